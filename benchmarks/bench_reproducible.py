@@ -0,0 +1,63 @@
+"""
+Throughput of the regression accumulators, plain and reproducible.
+
+Streams float64 rows in fixed-size chunks through `RegressionAccumulator`
+and `ReproducibleRegressionAccumulator` on each available backend and
+prints millions of rows per second (best of `--repeat` runs). Kernels are
+warmed up first, so Numba's import and compilation are not timed.
+
+Usage::
+
+    python benchmarks/bench_reproducible.py [--rows 10000000] [--chunk 1000000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from reportrabbit import RegressionAccumulator, ReproducibleRegressionAccumulator
+
+
+def _backends():
+    """Backends to time: "jit" only when Numba is installed."""
+    try:
+        RegressionAccumulator(backend="jit")
+    except ImportError:
+        return ["numpy"]
+    return ["numpy", "jit"]
+
+
+def _throughput(accumulator_class, backend, y_true, y_pred, chunk, repeat):
+    """Best rows per second over `repeat` passes of the whole input."""
+    accumulator_class(backend).update(y_true[:chunk], y_pred[:chunk])  # warm up
+    best = np.inf
+    for _ in range(repeat):
+        acc = accumulator_class(backend)
+        start = time.perf_counter()
+        for i in range(0, y_true.shape[0], chunk):
+            acc.update(y_true[i : i + chunk], y_pred[i : i + chunk])
+        best = min(best, time.perf_counter() - start)
+    return y_true.shape[0] / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--chunk", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(10, 2, args.rows)
+    y_pred = y_true + rng.normal(0, 1, args.rows)
+
+    print(f"{args.rows:,} float64 rows in {args.chunk:,}-row chunks")
+    for accumulator_class in (RegressionAccumulator, ReproducibleRegressionAccumulator):
+        for backend in _backends():
+            rate = _throughput(accumulator_class, backend, y_true, y_pred, args.chunk, args.repeat)
+            print(f"  {accumulator_class.__name__:<34} {backend:<6} {rate / 1e6:8.1f} M rows/s")
+
+
+if __name__ == "__main__":
+    main()
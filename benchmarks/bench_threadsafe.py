@@ -0,0 +1,85 @@
+"""
+Throughput of the concurrent accumulators at 1, 8 and 64 threads.
+
+Every thread pushes its share of fixed-size chunks into one shared
+accumulator: `ConcurrentRegressionAccumulator`, or a `RegressionAccumulator`
+behind a `threading.Lock` as the baseline. Prints millions of rows per
+second (best of `--repeat` runs) for each thread count. A parallel speed-up
+needs several CPUs; on one CPU the two variants should run level.
+
+Usage::
+
+    python benchmarks/bench_threadsafe.py [--backend jit] [--rows 20000000] [--chunk 100000]
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from reportrabbit import ConcurrentRegressionAccumulator, RegressionAccumulator
+
+THREAD_COUNTS = (1, 8, 64)
+
+
+class _LockedAccumulator:
+    """Baseline: one accumulator shared behind a lock."""
+
+    def __init__(self, backend):
+        self._acc = RegressionAccumulator(backend=backend)
+        self._lock = threading.Lock()
+
+    def update(self, y_true, y_pred):
+        with self._lock:
+            self._acc.update(y_true, y_pred)
+
+
+def _throughput(make_accumulator, n_threads, y_true, y_pred, chunk, repeat):
+    """Best rows per second over `repeat` runs of all chunks on `n_threads` threads."""
+    starts = range(0, y_true.shape[0], chunk)
+
+    def work(acc, thread_index):
+        for start in starts[thread_index::n_threads]:
+            acc.update(y_true[start : start + chunk], y_pred[start : start + chunk])
+
+    best = np.inf
+    for _ in range(repeat):
+        acc = make_accumulator()
+        threads = [threading.Thread(target=work, args=(acc, i)) for i in range(n_threads)]
+        start_time = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        best = min(best, time.perf_counter() - start_time)
+    return y_true.shape[0] / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", default="numpy", choices=["numpy", "jit"])
+    parser.add_argument("--rows", type=int, default=20_000_000)
+    parser.add_argument("--chunk", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(10, 2, args.rows)
+    y_pred = y_true + rng.normal(0, 1, args.rows)
+    # Warm up (imports Numba and loads the kernels for the jit backend)
+    RegressionAccumulator(backend=args.backend).update(y_true[:10], y_pred[:10])
+
+    variants = {
+        "concurrent": lambda: ConcurrentRegressionAccumulator(backend=args.backend),
+        "locked": lambda: _LockedAccumulator(args.backend),
+    }
+    print(f"{args.rows:,} float64 rows in {args.chunk:,}-row chunks, backend={args.backend}")
+    for n_threads in THREAD_COUNTS:
+        for name, make_accumulator in variants.items():
+            rate = _throughput(make_accumulator, n_threads, y_true, y_pred, args.chunk, args.repeat)
+            print(f"  {n_threads:>3} threads  {name:<10} {rate / 1e6:8.1f} M rows/s")
+
+
+if __name__ == "__main__":
+    main()
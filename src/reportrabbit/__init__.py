@@ -16,6 +16,8 @@ from .accuracy import get_accuracy
 from .f1 import get_f1
 from .precision import get_precision
 from .recall import get_recall
+from .auc import ScoreHistogram, get_pr_auc, get_roc_auc
+from .multilabel import get_multilabel_f1, get_multilabel_precision, get_multilabel_recall
 
 from .mae import get_mae
 from .mape import get_mape
@@ -23,12 +25,39 @@ from .mse_rmse import get_mse, get_rmse, get_mse_rmse
 
 from .r import get_r
 from .r2 import get_r2
+from .rank_correlation import Ranking, get_kendall_tau, get_spearman
+
+# Performance utilities
+from .workspace import MetricWorkspace
+from .packed import PackedLabels
+from .encoding import LabelEncoder
+from .accumulators import ClassificationAccumulator, RegressionAccumulator
+from .report import get_classification_report, get_regression_report
+from .compare import compare_models
+from .budget import MemoryBudget, get_memory_budget, set_memory_budget
+from .shards import evaluate_shards
+from .prepared import PreparedTarget
+from .checkpoint import load_checkpoint, save_checkpoint
+from .threadsafe import ConcurrentClassificationAccumulator, ConcurrentRegressionAccumulator
+from .approximate import approximate_metric
+from .calibration import CalibrationAccumulator
+from .drilldown import WorstErrors, worst_errors
+from .reproducible import ReproducibleRegressionAccumulator
+from .confusion import SparseConfusion
+from .ranking import get_ranking_metrics
+from .history import MetricHistory
 
 __all__ = [
     "get_accuracy",
     "get_f1",
     "get_precision",
     "get_recall",
+    "get_roc_auc",
+    "get_pr_auc",
+    "ScoreHistogram",
+    "get_multilabel_precision",
+    "get_multilabel_recall",
+    "get_multilabel_f1",
     "get_mae",
     "get_mape",
     "get_mse",
@@ -36,4 +65,32 @@ __all__ = [
     "get_mse_rmse",
     "get_r",
     "get_r2",
+    "get_spearman",
+    "get_kendall_tau",
+    "Ranking",
+    "MetricWorkspace",
+    "PackedLabels",
+    "LabelEncoder",
+    "RegressionAccumulator",
+    "ClassificationAccumulator",
+    "get_regression_report",
+    "get_classification_report",
+    "compare_models",
+    "MemoryBudget",
+    "set_memory_budget",
+    "get_memory_budget",
+    "evaluate_shards",
+    "PreparedTarget",
+    "save_checkpoint",
+    "load_checkpoint",
+    "ConcurrentRegressionAccumulator",
+    "ConcurrentClassificationAccumulator",
+    "approximate_metric",
+    "CalibrationAccumulator",
+    "worst_errors",
+    "WorstErrors",
+    "ReproducibleRegressionAccumulator",
+    "SparseConfusion",
+    "get_ranking_metrics",
+    "MetricHistory",
 ]
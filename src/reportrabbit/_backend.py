@@ -0,0 +1,403 @@
+"""
+Computational kernels shared by the accumulators and reports.
+
+Each kernel reads a chunk of ``(y_true, y_pred)`` once and returns the
+sufficient statistics needed by the regression or classification metrics.
+Two implementations exist: a pure-NumPy one that always works, and a
+compiled single-pass loop in `reportrabbit._jit`, which needs Numba and is
+only imported when the ``"jit"`` backend is first resolved.
+"""
+
+from __future__ import annotations
+
+import functools
+from types import ModuleType
+from typing import Optional
+
+import numpy as np
+
+BACKENDS = ("auto", "numpy", "jit")
+
+# Order of the values returned by the regression kernels
+REGRESSION_FIELDS = (
+    "n",
+    "mean_true",
+    "mean_pred",
+    "m2_true",
+    "m2_pred",
+    "c_true_pred",
+    "sum_abs",
+    "sum_sq",
+    "sum_ape",
+    "n_zero_true",
+)
+
+# Order of the values returned by the classification kernels
+CLASSIFICATION_FIELDS = ("n", "n_correct", "tp", "fp", "fn", "tn")
+
+# Order of the sums binned by the exact (reproducible) regression kernels
+EXACT_FIELDS = (
+    "sum_true",
+    "sum_pred",
+    "sum_true_sq",
+    "sum_pred_sq",
+    "sum_true_pred",
+    "sum_abs",
+    "sum_sq",
+    "sum_ape",
+)
+
+# A finite float is +-m * 2**(E - 1075), with E its biased exponent field
+# (1 for subnormals) and m its significand with the implicit bit. The exact
+# kernels sum the high and low halves of the signed m per E in int64 bins.
+N_EXPONENTS = 2047
+EXACT_HALF_BITS = 26
+_SPLITTER = 134217729.0  # 2**27 + 1, for Dekker's split
+
+
+@functools.cache
+def _jit_kernels() -> Optional[ModuleType]:
+    """The compiled kernels, imported on first use; None when Numba is not installed."""
+    try:
+        from reportrabbit import _jit
+    except ImportError:
+        return None
+    return _jit
+
+
+def _resolve_backend(backend: str) -> str:
+    """
+    Resolve a user-facing backend name to ``"numpy"`` or ``"jit"``.
+
+    Parameters
+    ----------
+    backend : {"auto", "numpy", "jit"}
+        Requested backend. ``"auto"`` picks ``"jit"`` when Numba is installed.
+        Only ``"auto"`` and ``"jit"`` import Numba.
+
+    Returns
+    -------
+    str
+        The concrete backend to use.
+
+    Raises
+    ------
+    ValueError
+        If `backend` is not a known backend name.
+    ImportError
+        If ``"jit"`` is requested but Numba is not installed.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}.")
+    if backend == "numpy":
+        return backend
+    available = _jit_kernels() is not None
+    if backend == "jit" and not available:
+        raise ImportError(
+            "The 'jit' backend requires numba. Install it with `pip install numba`."
+        )
+    if backend == "auto":
+        return "jit" if available else "numpy"
+    return backend
+
+
+# --------------------------------------------------------------
+# NumPy kernels
+# --------------------------------------------------------------
+
+
+def _regression_stats_numpy(yt: np.ndarray, yp: np.ndarray) -> tuple:
+    """
+    Regression sufficient statistics of one chunk, computed with NumPy.
+
+    Uses the same reductions as the ``get_*`` functions, so a single chunk
+    reproduces their results exactly.
+    """
+    if not np.all(np.isfinite(yt)) or not np.all(np.isfinite(yp)):
+        raise ValueError("Inputs must contain only finite values.")
+
+    n = yt.shape[0]
+    mean_true = np.mean(yt)
+    mean_pred = np.mean(yp)
+    dev_true = yt - mean_true
+    dev_pred = yp - mean_pred
+
+    residual = yt - yp
+    nonzero = yt != 0
+
+    return (
+        n,
+        float(mean_true),
+        float(mean_pred),
+        float(np.sum(dev_true**2)),
+        float(np.sum(dev_pred**2)),
+        float(np.sum(dev_true * dev_pred)),
+        float(np.sum(np.abs(residual))),
+        float(np.sum(residual**2)),
+        float(np.sum(np.abs(residual[nonzero] / yt[nonzero]))),
+        int(n - np.count_nonzero(nonzero)),
+    )
+
+
+def _classification_counts_numpy(yt: np.ndarray, yp: np.ndarray) -> tuple:
+    """
+    Confusion counts of one chunk, computed with NumPy.
+
+    Positives are non-zero labels, as in `get_precision` and `get_recall`;
+    correct predictions are exact matches, as in `get_accuracy`.
+    """
+    n = yt.shape[0]
+    true_pos = yt != 0
+    pred_pos = yp != 0
+
+    n_correct = int(np.count_nonzero(yt == yp))
+    tp = int(np.count_nonzero(true_pos & pred_pos))
+    n_true_pos = int(np.count_nonzero(true_pos))
+    n_pred_pos = int(np.count_nonzero(pred_pos))
+
+    fp = n_pred_pos - tp
+    fn = n_true_pos - tp
+    return n, n_correct, tp, fp, fn, n - tp - fp - fn
+
+
+def _two_product(a: np.ndarray, b: np.ndarray) -> tuple:
+    """
+    ``a * b`` as an unevaluated sum ``product + error`` (Dekker, 1971).
+
+    Exact unless the error underflows; overflow leaves non-finite values.
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        product = a * b
+        a_split = _SPLITTER * a
+        a_high = a_split - (a_split - a)
+        a_low = a - a_high
+        b_split = _SPLITTER * b
+        b_high = b_split - (b_split - b)
+        b_low = b - b_high
+        error = ((a_high * b_high - product) + a_high * b_low + a_low * b_high) + a_low * b_low
+    return product, error
+
+
+def _exact_regression_bins_numpy(yt: np.ndarray, yp: np.ndarray) -> tuple:
+    """
+    Exponent bins of the `EXACT_FIELDS` sums of one chunk, computed with NumPy.
+
+    The per-exponent sums of the significand halves are computed with
+    ``np.bincount``; they stay far below 2**53 (and are therefore exact in
+    float64) for chunks of up to 2**24 rows.
+
+    Returns the bins and whether any term was not finite. Overflowing terms
+    are reported that way (the caller raises), not as NumPy warnings.
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        residual = yt - yp
+        nonzero = yt != 0
+        terms = (
+            (yt,),
+            (yp,),
+            _two_product(yt, yt),
+            _two_product(yp, yp),
+            _two_product(yt, yp),
+            (np.abs(residual),),
+            (residual**2,),
+            (np.abs(residual[nonzero] / yt[nonzero]),),
+        )
+    bins = np.zeros((len(EXACT_FIELDS), N_EXPONENTS, 2), dtype=np.int64)
+    for field, arrays in enumerate(terms):
+        bits = np.concatenate(arrays).view(np.int64)
+        exponent = (bits >> 52) & 2047
+        if np.any(exponent == 2047):
+            return bins, True
+        significand = bits & ((1 << 52) - 1)
+        significand |= (exponent != 0).astype(np.int64) << 52
+        np.maximum(exponent, 1, out=exponent)
+        np.negative(significand, out=significand, where=bits < 0)
+        high = significand >> EXACT_HALF_BITS
+        significand &= (1 << EXACT_HALF_BITS) - 1
+        bins[field, :, 0] = np.bincount(exponent, weights=high, minlength=N_EXPONENTS)
+        bins[field, :, 1] = np.bincount(exponent, weights=significand, minlength=N_EXPONENTS)
+    return bins, False
+
+
+def _count_inversions_numpy(values: np.ndarray, n_bits: int) -> int:
+    """
+    Number of pairs ``i < j`` with ``values[i] > values[j]``.
+
+    Processes the bits of the non-negative integers in `values` from the
+    most significant down. Before the level for bit ``b``, the array is
+    stably grouped by ``values >> (b + 1)``; a pair in one group is inverted
+    at this level when the earlier element has bit ``b`` set and the later
+    one does not. Each group is then stably partitioned by bit ``b``.
+
+    Every level reuses the same five integer buffers: the global running
+    counts are nondecreasing, so their value at the start (or end) of each
+    group is propagated with a running maximum (or minimum) instead of
+    per-group index arrays.
+    """
+    n = values.shape[0]
+    current = values.astype(np.intp, copy=True)
+    ones = np.empty(n, dtype=np.intp)
+    ones_before = np.empty(n, dtype=np.intp)
+    target = np.empty(n, dtype=np.intp)
+    zeros_next = np.empty(n, dtype=np.intp)
+    group_start = np.zeros(n, dtype=bool)
+    group_start[0] = True
+    mask = np.empty(n, dtype=bool)
+    inversions = 0
+
+    for bit in range(n_bits - 1, -1, -1):
+        np.right_shift(current, bit, out=ones)
+        np.bitwise_and(ones, 1, out=ones)
+
+        # ones_before: elements with the bit set before i (globally); target
+        # holds, for now, the same count at the start of the group of i
+        np.cumsum(ones, out=ones_before)
+        ones_before -= ones
+        target.fill(0)
+        np.copyto(target, ones_before, where=group_start)
+        np.maximum.accumulate(target, out=target)
+        ones_before -= target
+        inversions += int(ones_before.sum()) - int(np.dot(ones_before, ones))
+        ones_before += target
+
+        # A zero moves after the earlier groups and the zeros before it:
+        # target = (zeros before i) + (ones before its group)
+        np.subtract(1, ones, out=zeros_next)
+        np.cumsum(zeros_next, out=zeros_next)
+        total_zeros = int(zeros_next[-1])
+        zeros_next -= 1
+        zeros_next += ones
+        target += zeros_next
+
+        # A one moves after every zero before the next group and the ones
+        # before it: target = (zeros before the next group) + (ones before i)
+        zeros_next[:-1] = zeros_next[1:]
+        zeros_next[-1] = total_zeros
+        np.logical_not(group_start, out=mask)
+        np.copyto(zeros_next[:-1], n, where=mask[1:])
+        reverse = zeros_next[::-1]
+        np.minimum.accumulate(reverse, out=reverse)
+        zeros_next += ones_before
+        np.not_equal(ones, 0, out=mask)
+        np.copyto(target, zeros_next, where=mask)
+
+        # Stable partition into the free buffer, then mark the new groups
+        ones[target] = current
+        current, ones = ones, current
+        np.right_shift(current, bit, out=ones_before)
+        np.not_equal(ones_before[1:], ones_before[:-1], out=group_start[1:])
+
+    return inversions
+
+
+# --------------------------------------------------------------
+# Dispatch
+# --------------------------------------------------------------
+
+
+def regression_stats(yt: np.ndarray, yp: np.ndarray, backend: str = "numpy") -> tuple:
+    """
+    Compute the regression sufficient statistics of one chunk.
+
+    Parameters
+    ----------
+    yt, yp : numpy.ndarray of shape (n_samples,)
+        Validated 1D float arrays of equal, non-zero length.
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Kernel implementation to use.
+
+    Returns
+    -------
+    tuple
+        Values in the order of `REGRESSION_FIELDS`.
+    """
+    if _resolve_backend(backend) == "jit":
+        return _jit_kernels()._regression_stats_jit(yt, yp)
+    return _regression_stats_numpy(yt, yp)
+
+
+def classification_counts(yt: np.ndarray, yp: np.ndarray, backend: str = "numpy") -> tuple:
+    """
+    Compute the confusion counts of one chunk.
+
+    Parameters
+    ----------
+    yt, yp : numpy.ndarray of shape (n_samples,)
+        Label arrays of equal length.
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Kernel implementation to use. Non-numeric labels always use NumPy.
+
+    Returns
+    -------
+    tuple
+        Values in the order of `CLASSIFICATION_FIELDS`.
+    """
+    resolved = _resolve_backend(backend)
+    numeric = yt.dtype.kind in "biuf" and yp.dtype.kind in "biuf"
+    if resolved == "jit" and numeric:
+        return _jit_kernels()._classification_counts_jit(yt, yp)
+    if backend == "jit" and not numeric:
+        raise ValueError("The 'jit' backend only supports numeric labels.")
+    return _classification_counts_numpy(yt, yp)
+
+
+def exact_regression_bins(yt: np.ndarray, yp: np.ndarray, backend: str = "numpy") -> np.ndarray:
+    """
+    Bin the `EXACT_FIELDS` sums of one chunk by exponent, without rounding.
+
+    Parameters
+    ----------
+    yt, yp : numpy.ndarray of shape (n_samples,)
+        Validated, finite 1D float arrays of equal length, at most 2**24.
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Kernel implementation to use; both give identical bins.
+
+    Returns
+    -------
+    numpy.ndarray of int64, shape (len(EXACT_FIELDS), N_EXPONENTS, 2)
+        ``bins[f, e, 0] * 2**EXACT_HALF_BITS + bins[f, e, 1]`` is the sum of
+        the signed significands of the terms of field ``f`` whose biased
+        exponent is ``e``, in units of ``2**(e - 1075)``.
+
+    Raises
+    ------
+    ValueError
+        If a product overflows.
+    """
+    if _resolve_backend(backend) == "jit":
+        bins = np.zeros((len(EXACT_FIELDS), N_EXPONENTS, 2), dtype=np.int64)
+        nonfinite = _jit_kernels()._exact_regression_kernel(
+            np.ascontiguousarray(yt, dtype=np.float64),
+            np.ascontiguousarray(yp, dtype=np.float64),
+            bins,
+        )
+    else:
+        bins, nonfinite = _exact_regression_bins_numpy(yt, yp)
+    if nonfinite:
+        raise ValueError("Inputs are too large to be summed exactly.")
+    return bins
+
+
+def count_inversions(values: np.ndarray, backend: str = "numpy") -> int:
+    """
+    Count the pairs ``i < j`` with ``values[i] > values[j]`` in O(n log n).
+
+    Parameters
+    ----------
+    values : numpy.ndarray of shape (n_samples,)
+        Non-negative integers, such as dense ranks.
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        ``"jit"`` runs a compiled merge sort; ``"numpy"`` counts the
+        inversions one bit of the values at a time.
+
+    Returns
+    -------
+    int
+        The number of inverted pairs.
+    """
+    if values.shape[0] < 2:
+        return 0
+    if _resolve_backend(backend) == "jit":
+        kernel = _jit_kernels()._inversions_kernel
+        return int(kernel(np.ascontiguousarray(values, dtype=np.intp)))
+    return _count_inversions_numpy(values, int(values.max()).bit_length())
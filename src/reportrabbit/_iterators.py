@@ -0,0 +1,94 @@
+"""
+Helpers that evaluate metrics on Python iterators without building lists.
+
+An iterator (a generator, ``map``, a database cursor, ...) is consumed in
+fixed-size blocks: ``itertools.islice`` takes the next `_BLOCK_SIZE`
+values and ``np.fromiter`` turns them into a float64 array directly (labels
+go through a list of one block, since their dtype is not known in
+advance). Each block is fed to a streaming accumulator, so memory stays
+constant and the per-element Python overhead is paid exactly once.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterator
+from typing import Any, Optional
+
+import numpy as np
+
+# Number of values pulled from an iterator at a time
+_BLOCK_SIZE = 1 << 16
+
+
+def _is_iterator(values: Any) -> bool:
+    """Whether `values` is a one-shot iterator rather than an array-like."""
+    return isinstance(values, Iterator)
+
+
+def _blocks(values: Any, dtype: Optional[type], block: int):
+    """Yield consecutive 1D blocks of an iterator or array-like."""
+    if not _is_iterator(values):
+        values = np.asarray(values).reshape(-1)
+        for start in range(0, values.shape[0], block):
+            yield values[start : start + block]
+        return
+
+    while True:
+        if dtype is None:
+            chunk = np.array(list(itertools.islice(values, block)))
+        else:
+            chunk = np.fromiter(itertools.islice(values, block), dtype=dtype)
+        if chunk.shape[0] == 0:
+            return
+        yield chunk
+
+
+def _paired_blocks(
+    y_true: Any, y_pred: Any, dtype: Optional[type] = None, block: int = _BLOCK_SIZE
+):
+    """
+    Yield aligned ``(y_true, y_pred)`` blocks; either side may be an iterator.
+
+    Raises
+    ------
+    ValueError
+        If one input runs out before the other.
+    """
+    pairs = itertools.zip_longest(_blocks(y_true, dtype, block), _blocks(y_pred, dtype, block))
+    for yt, yp in pairs:
+        if yt is None or yp is None or yt.shape[0] != yp.shape[0]:
+            raise ValueError("Input lengths must match.")
+        yield yt, yp
+
+
+def _accumulate(kind: str, y_true: Any, y_pred: Any, **options: Any) -> Any:
+    """
+    Stream iterator inputs into a regression or classification accumulator.
+
+    Parameters
+    ----------
+    kind : {"regression", "classification"}
+        Accumulator to fill.
+    y_true, y_pred : iterator or array-like
+        Inputs of a ``get_*`` call, at least one of them an iterator.
+    **options
+        Other keyword arguments of the ``get_*`` call; they must all be
+        ``None``, because the accumulators do not support them.
+
+    Returns
+    -------
+    RegressionAccumulator or ClassificationAccumulator
+        Accumulator holding every pair.
+    """
+    # Imported here: the metric modules are imported by the accumulators
+    from reportrabbit.accumulators import ClassificationAccumulator, RegressionAccumulator
+
+    for name, value in options.items():
+        if value is not None:
+            raise ValueError(f"{name} is not supported for iterator inputs.")
+
+    acc = RegressionAccumulator() if kind == "regression" else ClassificationAccumulator()
+    acc.update(y_true, y_pred)
+    acc._check_not_empty()
+    return acc
@@ -0,0 +1,196 @@
+"""
+Numba-compiled kernels of the ``"jit"`` backend.
+
+This module imports Numba, which takes a noticeable fraction of a second,
+so `reportrabbit._backend` only imports it when the ``"jit"`` backend is
+first resolved. Each kernel reads a chunk once, in a single loop, and
+returns the same statistics as its NumPy counterpart in `_backend`.
+"""
+
+import numba
+import numpy as np
+
+
+# cache=True stores the machine code next to this module (or in
+# NUMBA_CACHE_DIR), so the compilation cost is paid once per deployment.
+@numba.njit(cache=True, nogil=True)
+def _regression_kernel(yt, yp):
+    n = 0
+    n_nonfinite = 0
+    mean_true = 0.0
+    mean_pred = 0.0
+    m2_true = 0.0
+    m2_pred = 0.0
+    c_true_pred = 0.0
+    sum_abs = 0.0
+    sum_sq = 0.0
+    sum_ape = 0.0
+    n_zero_true = 0
+    for i in range(yt.shape[0]):
+        t = yt[i]
+        p = yp[i]
+        if not (np.isfinite(t) and np.isfinite(p)):
+            n_nonfinite += 1
+            continue
+        n += 1
+        d_true = t - mean_true
+        d_pred = p - mean_pred
+        mean_true += d_true / n
+        mean_pred += d_pred / n
+        m2_true += d_true * (t - mean_true)
+        m2_pred += d_pred * (p - mean_pred)
+        c_true_pred += d_true * (p - mean_pred)
+        r = t - p
+        sum_abs += abs(r)
+        sum_sq += r * r
+        if t != 0.0:
+            sum_ape += abs(r / t)
+        else:
+            n_zero_true += 1
+    return (
+        n_nonfinite,
+        n,
+        mean_true,
+        mean_pred,
+        m2_true,
+        m2_pred,
+        c_true_pred,
+        sum_abs,
+        sum_sq,
+        sum_ape,
+        n_zero_true,
+    )
+
+
+@numba.njit(cache=True, nogil=True)
+def _classification_kernel(yt, yp):
+    n_correct = 0
+    tp = 0
+    fp = 0
+    fn = 0
+    for i in range(yt.shape[0]):
+        t = yt[i]
+        p = yp[i]
+        if t == p:
+            n_correct += 1
+        if t != 0:
+            if p != 0:
+                tp += 1
+            else:
+                fn += 1
+        elif p != 0:
+            fp += 1
+    n = yt.shape[0]
+    return n, n_correct, tp, fp, fn, n - tp - fp - fn
+
+
+@numba.njit(cache=True, nogil=True)
+def _inversions_kernel(values):
+    # Bottom-up merge sort; every time an element of the right run is
+    # placed before the rest of the left run, it is inverted with all of it
+    n = values.shape[0]
+    src = values.copy()
+    dst = np.empty_like(src)
+    inversions = 0
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i = lo
+            j = mid
+            k = lo
+            while i < mid and j < hi:
+                if src[j] < src[i]:
+                    dst[k] = src[j]
+                    inversions += mid - i
+                    j += 1
+                else:
+                    dst[k] = src[i]
+                    i += 1
+                k += 1
+            while i < mid:
+                dst[k] = src[i]
+                i += 1
+                k += 1
+            while j < hi:
+                dst[k] = src[j]
+                j += 1
+                k += 1
+        src, dst = dst, src
+        width *= 2
+    return inversions
+
+
+@numba.njit(cache=True, nogil=True)
+def _exact_regression_kernel(yt, yp, bins):
+    # The terms of a row are written to a small buffer and binned through
+    # its int64 view, in one inlined loop (helper calls per term, or
+    # math.frexp, make this several times slower)
+    fields = np.array([0, 1, 2, 2, 3, 3, 4, 4, 5, 6, 7])
+    terms = np.zeros(11)
+    bits = terms.view(np.int64)
+    nonfinite = False
+    for i in range(yt.shape[0]):
+        t = yt[i]
+        p = yp[i]
+        r = t - p
+        # Dekker's two-products: each product plus its rounding error
+        t_split = 134217729.0 * t
+        t_high = t_split - (t_split - t)
+        t_low = t - t_high
+        p_split = 134217729.0 * p
+        p_high = p_split - (p_split - p)
+        p_low = p - p_high
+        terms[0] = t
+        terms[1] = p
+        terms[2] = t * t
+        terms[3] = ((t_high * t_high - terms[2]) + t_high * t_low + t_low * t_high) + (
+            t_low * t_low
+        )
+        terms[4] = p * p
+        terms[5] = ((p_high * p_high - terms[4]) + p_high * p_low + p_low * p_high) + (
+            p_low * p_low
+        )
+        terms[6] = t * p
+        terms[7] = ((t_high * p_high - terms[6]) + t_high * p_low + t_low * p_high) + (
+            t_low * p_low
+        )
+        terms[8] = abs(r)
+        terms[9] = r * r
+        terms[10] = abs(r / t) if t != 0.0 else 0.0
+        for j in range(11):
+            b = bits[j]
+            exponent = (b >> 52) & 2047
+            significand = b & 4503599627370495  # 2**52 - 1
+            if exponent == 2047:
+                nonfinite = True
+            if exponent == 0:
+                exponent = 1
+            else:
+                significand |= 4503599627370496  # 2**52
+            if b < 0:
+                significand = -significand
+            bins[fields[j], exponent, 0] += significand >> 26
+            bins[fields[j], exponent, 1] += significand & 67108863  # 2**26 - 1
+    return nonfinite
+
+
+def _regression_stats_jit(yt: np.ndarray, yp: np.ndarray) -> tuple:
+    """Regression sufficient statistics of one chunk, in one compiled pass."""
+    out = _regression_kernel(
+        np.ascontiguousarray(yt, dtype=np.float64),
+        np.ascontiguousarray(yp, dtype=np.float64),
+    )
+    if out[0]:
+        raise ValueError("Inputs must contain only finite values.")
+    n, *rest = out[1:]
+    return (int(n), *(float(v) for v in rest[:-1]), int(rest[-1]))
+
+
+def _classification_counts_jit(yt: np.ndarray, yp: np.ndarray) -> tuple:
+    """Confusion counts of one chunk, in one compiled pass."""
+    return tuple(
+        int(v)
+        for v in _classification_kernel(np.ascontiguousarray(yt), np.ascontiguousarray(yp))
+    )
@@ -0,0 +1,111 @@
+"""
+Helpers for regression metrics on multi-output ``(n_samples, n_outputs)`` targets.
+
+Every per-output score is computed with a single reduction along axis 0, so
+all outputs are scored in one call instead of slicing out each column.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+MULTIOUTPUT_OPTIONS = ("raw_values", "uniform_average", "variance_weighted")
+
+
+def _check_multioutput(multioutput: str) -> None:
+    """
+    Validate a ``multioutput`` option.
+
+    Raises
+    ------
+    ValueError
+        If `multioutput` is not one of `MULTIOUTPUT_OPTIONS`.
+    """
+    if multioutput not in MULTIOUTPUT_OPTIONS:
+        raise ValueError(
+            f"multioutput must be one of {MULTIOUTPUT_OPTIONS}, got {multioutput!r}."
+        )
+
+
+def _to_2d_numeric_arrays(
+    y_true: Any, y_pred: Any, multioutput: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Coerce multi-output targets to 2D float arrays with a common memory layout.
+
+    1D inputs are treated as a single output. When `y_true` is stored in
+    Fortran order, `y_pred` is brought into Fortran order too (and C order
+    otherwise), so elementwise passes and the axis-0 reductions stream both
+    arrays in the same order instead of striding through one of them.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,) or (n_samples, n_outputs)
+        True target values.
+    y_pred : array-like of shape (n_samples,) or (n_samples, n_outputs)
+        Predicted target values.
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}
+        Aggregation option, validated here so errors surface before any work.
+
+    Returns
+    -------
+    yt, yp : numpy.ndarray of shape (n_samples, n_outputs)
+        Coerced arrays.
+
+    Raises
+    ------
+    ValueError
+        If shapes differ, inputs are empty, not 1D/2D, or not finite.
+    """
+    _check_multioutput(multioutput)
+
+    yt = np.asarray(y_true, dtype=np.float64)
+    order = "F" if yt.flags.f_contiguous and not yt.flags.c_contiguous else "C"
+    yt = np.asarray(yt, order=order)
+    yp = np.asarray(y_pred, dtype=np.float64, order=order)
+
+    if yt.shape != yp.shape:
+        raise ValueError(f"Shape mismatch: {yt.shape} vs {yp.shape}")
+    if yt.ndim == 1:
+        yt = yt.reshape(-1, 1)
+        yp = yp.reshape(-1, 1)
+    if yt.ndim != 2:
+        raise ValueError("Multi-output inputs must be 1D or 2D (n_samples, n_outputs).")
+    if yt.size == 0:
+        raise ValueError("Input arrays cannot be empty.")
+    if not np.all(np.isfinite(yt)) or not np.all(np.isfinite(yp)):
+        raise ValueError("Inputs must contain only finite values.")
+
+    return yt, yp
+
+
+def _aggregate_outputs(values: np.ndarray, multioutput: str, yt: np.ndarray):
+    """
+    Aggregate per-output scores.
+
+    Parameters
+    ----------
+    values : numpy.ndarray of shape (n_outputs,)
+        Score of each output.
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}
+        ``"raw_values"`` returns `values`; ``"uniform_average"`` returns their
+        mean; ``"variance_weighted"`` weights each output by the variance of
+        its `y_true` column (falling back to a uniform mean when every
+        column is constant).
+    yt : numpy.ndarray of shape (n_samples, n_outputs)
+        True target values, used for the variance weights.
+
+    Returns
+    -------
+    numpy.ndarray or float
+        Per-output scores or their aggregate.
+    """
+    if multioutput == "raw_values":
+        return values
+    if multioutput == "variance_weighted":
+        weights = np.var(yt, axis=0)
+        if weights.sum() != 0:
+            return float(np.average(values, weights=weights))
+    return float(np.mean(values))
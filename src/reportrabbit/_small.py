@@ -0,0 +1,97 @@
+"""
+Pure-Python paths for the tiny inputs of per-request scoring.
+
+For a handful of values, ``np.asarray``, ``np.isfinite`` and ufunc dispatch
+cost far more than the arithmetic itself. Lists and tuples of at most
+`_SMALL_INPUT_MAX` plain Python numbers (or strings, for labels) are
+therefore scored with Python loops. The loops perform the same float64
+operations in the same order as the vectorized path, including NumPy's
+pairwise summation, so both paths return bit-identical results.
+
+The helpers return None whenever an input is not eligible (other types,
+non-finite values, empty or mismatched inputs); the caller then runs its
+vectorized path, which also raises the usual errors.
+"""
+
+import math
+from operator import eq
+from typing import Any, Optional
+
+from reportrabbit.budget import get_memory_budget
+
+# Inputs up to this length take the pure-Python path; the measured
+# crossover is ~100-150 values for get_mae and beyond 300 for get_accuracy
+_SMALL_INPUT_MAX = 64
+
+# NumPy's pairwise summation: unrolled 8-way below this length, recursive above
+_PAIRWISE_BLOCKSIZE = 128
+
+_NUMBER_TYPES = frozenset((int, float, bool))
+_LABEL_KINDS = (_NUMBER_TYPES, frozenset((str,)))
+
+
+def _is_small(y_true: Any, y_pred: Any) -> bool:
+    """Whether both inputs are short lists or tuples and no memory budget is active."""
+    return (
+        type(y_true) in (list, tuple)
+        and type(y_pred) in (list, tuple)
+        and 0 < len(y_true) == len(y_pred) <= _SMALL_INPUT_MAX
+        and get_memory_budget() is None
+    )
+
+
+def _pairwise_sum(values: list) -> float:
+    """Sum floats in the order of NumPy's pairwise summation (``np.add.reduce``)."""
+    n = len(values)
+    if n < 8:
+        total = -0.0
+        for value in values:
+            total += value
+        return total
+    if n <= _PAIRWISE_BLOCKSIZE:
+        r0, r1, r2, r3, r4, r5, r6, r7 = values[:8]
+        stop = n - n % 8
+        for i in range(8, stop, 8):
+            r0 += values[i]
+            r1 += values[i + 1]
+            r2 += values[i + 2]
+            r3 += values[i + 3]
+            r4 += values[i + 4]
+            r5 += values[i + 5]
+            r6 += values[i + 6]
+            r7 += values[i + 7]
+        total = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+        for value in values[stop:]:
+            total += value
+        return total
+    half = n // 2
+    half -= half % 8
+    return _pairwise_sum(values[:half]) + _pairwise_sum(values[half:])
+
+
+def _small_accuracy(y_true: Any, y_pred: Any) -> Optional[float]:
+    """Accuracy of small label sequences, or None if they need the vectorized path."""
+    if not _is_small(y_true, y_pred):
+        return None
+    kinds = set(map(type, y_true))
+    kinds.update(map(type, y_pred))
+    # Mixed strings and numbers are coerced to strings by np.asarray
+    if not any(kinds <= kind for kind in _LABEL_KINDS):
+        return None
+    return sum(map(eq, y_true, y_pred)) / len(y_true)
+
+
+def _small_mae(y_true: Any, y_pred: Any) -> Optional[float]:
+    """MAE of small numeric sequences, or None if they need the vectorized path."""
+    if not _is_small(y_true, y_pred):
+        return None
+    if not set(map(type, y_true)).union(map(type, y_pred)) <= _NUMBER_TYPES:
+        return None
+    try:
+        errors = [abs(a - b) for a, b in zip(map(float, y_true), map(float, y_pred))]
+    except OverflowError:
+        return None
+    if not all(map(math.isfinite, errors)):
+        # Non-finite inputs (or an overflowing difference) are handled there
+        return None
+    return _pairwise_sum(errors) / len(errors)
@@ -0,0 +1,189 @@
+"""
+Helpers for classification inputs given as positive indices or sparse vectors.
+
+For heavily imbalanced labels it is much cheaper to describe each side by
+the sorted indices of its positive samples than by a dense label array.
+Confusion counts are then computed from a sorted intersection, so time and
+memory scale with the number of positives instead of the number of samples.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+
+def _is_sparse(x: Any) -> bool:
+    """
+    Return True if `x` is a scipy.sparse array or matrix.
+
+    SciPy is optional and slow to import, so other inputs are rejected by
+    the module of their type; a sparse input means SciPy is already loaded.
+    """
+    if not type(x).__module__.startswith("scipy.sparse"):
+        return False
+    import scipy.sparse as sp
+
+    return sp.issparse(x)
+
+
+def _uses_positive_indices(y_true: Any, y_pred: Any, n_samples: Optional[int]) -> bool:
+    """Return True if the inputs should be read as positive indices."""
+    return n_samples is not None or _is_sparse(y_true) or _is_sparse(y_pred)
+
+
+def _sparse_to_indices(x: Any, name: str) -> tuple[np.ndarray, int]:
+    """
+    Sorted flat indices of the non-zero entries of a sparse vector.
+
+    Parameters
+    ----------
+    x : scipy.sparse array or matrix of shape (n_samples,), (1, n_samples) or (n_samples, 1)
+        Sparse label vector.
+    name : str
+        Parameter name used for error messages.
+
+    Returns
+    -------
+    indices : numpy.ndarray of int64
+        Sorted indices of the positive (non-zero) entries.
+    n_samples : int
+        Length of the vector.
+    """
+    if len(x.shape) == 2 and min(x.shape) != 1:
+        raise ValueError(f"{name} must be a sparse vector, got shape {x.shape}.")
+    coo = x.tocoo(copy=True)
+    coo.sum_duplicates()
+    n_samples = int(np.prod(x.shape))
+    # Flat index works for row vectors, column vectors and 1D sparse arrays
+    if len(x.shape) == 2:
+        flat = np.ravel_multi_index((coo.row, coo.col), x.shape)
+    else:
+        flat = coo.coords[0]
+    flat = np.asarray(flat, dtype=np.int64)[np.asarray(coo.data) != 0]
+    return np.sort(flat), n_samples
+
+
+def _to_positive_indices(x: Any, name: str, n_samples: Optional[int]) -> tuple[np.ndarray, int]:
+    """
+    Validate positive indices (or convert a sparse vector) for one input.
+
+    Parameters
+    ----------
+    x : array-like of int or scipy.sparse vector
+        Sorted, unique indices of the positive samples, or a sparse label vector.
+    name : str
+        Parameter name used for error messages.
+    n_samples : int or None
+        Total number of samples. Required unless `x` is sparse.
+
+    Returns
+    -------
+    indices : numpy.ndarray of int64
+        Sorted indices of the positive samples.
+    n_samples : int
+        Total number of samples.
+
+    Raises
+    ------
+    ValueError
+        If indices are unsorted, repeated or out of range, or sizes disagree.
+    """
+    if _is_sparse(x):
+        indices, size = _sparse_to_indices(x, name)
+        if n_samples is not None and size != n_samples:
+            raise ValueError(f"{name} has {size} samples but n_samples is {n_samples}.")
+        return indices, size
+
+    if n_samples is None:
+        raise ValueError(f"n_samples is required when {name} is given as positive indices.")
+    indices = np.asarray(x).reshape(-1)
+    if indices.size and indices.dtype.kind not in "iu":
+        raise ValueError(f"{name} positive indices must be integers.")
+    indices = indices.astype(np.int64, copy=False)
+    if indices.size:
+        if np.any(indices[1:] <= indices[:-1]):
+            raise ValueError(f"{name} positive indices must be sorted and unique.")
+        if indices[0] < 0 or indices[-1] >= n_samples:
+            raise ValueError(f"{name} positive indices must be in [0, n_samples).")
+    return indices, int(n_samples)
+
+
+def _dense_to_positive_indices(x: Any, name: str, n_samples: int) -> tuple[np.ndarray, int]:
+    """
+    Positive indices of the dense side of a mixed sparse/dense pair.
+
+    A dense array as long as the sparse vector is a 0/1 label array (sorted
+    positive indices of that length could only be ``0..n_samples-1``);
+    anything shorter is read as positive indices.
+    """
+    labels = np.asarray(x)
+    if labels.ndim != 1 or labels.shape[0] != n_samples:
+        return _to_positive_indices(labels, name, n_samples)
+    if labels.dtype.kind not in "biuf" or not np.all((labels == 0) | (labels == 1)):
+        raise ValueError(
+            f"{name} has as many entries as the sparse input, so it must be a 0/1 label "
+            "array; pass n_samples to give it as positive indices."
+        )
+    return np.flatnonzero(labels).astype(np.int64), n_samples
+
+
+def _positive_index_counts(
+    y_true: Any, y_pred: Any, n_samples: Optional[int]
+) -> tuple[int, int, int]:
+    """
+    Confusion counts from positive-index or sparse inputs.
+
+    Parameters
+    ----------
+    y_true : array-like of int or scipy.sparse vector
+        Positive indices (or sparse labels) of the ground truth.
+    y_pred : array-like of int or scipy.sparse vector
+        Positive indices (or sparse labels) of the predictions.
+    n_samples : int or None
+        Total number of samples; taken from the sparse input when omitted.
+        In that case a dense input as long as the sparse one is read as a
+        0/1 label array rather than as positive indices.
+
+    Returns
+    -------
+    tp : int
+        Number of indices positive on both sides.
+    n_pred_positive : int
+        Number of predicted positives (TP + FP).
+    n_true_positive : int
+        Number of actual positives (TP + FN).
+
+    Raises
+    ------
+    ValueError
+        If `n_samples` is not a positive integer or the inputs are invalid.
+    """
+    if n_samples is not None and (
+        isinstance(n_samples, bool) or not isinstance(n_samples, (int, np.integer)) or n_samples < 1
+    ):
+        raise ValueError("n_samples must be a positive integer.")
+
+    # Resolve n_samples from whichever side is sparse before validating the other
+    if n_samples is None and _is_sparse(y_true):
+        true_idx, n_samples = _to_positive_indices(y_true, "y_true", None)
+        pred_idx, _ = (
+            _to_positive_indices(y_pred, "y_pred", n_samples)
+            if _is_sparse(y_pred)
+            else _dense_to_positive_indices(y_pred, "y_pred", n_samples)
+        )
+    elif n_samples is None:
+        pred_idx, n_samples = _to_positive_indices(y_pred, "y_pred", None)
+        true_idx, _ = _dense_to_positive_indices(y_true, "y_true", n_samples)
+    else:
+        pred_idx, n_samples = _to_positive_indices(y_pred, "y_pred", n_samples)
+        true_idx, _ = _to_positive_indices(y_true, "y_true", n_samples)
+
+    # Sorted intersection: binary-search the true positives in the predictions
+    tp = 0
+    if true_idx.size and pred_idx.size:
+        pos = np.searchsorted(pred_idx, true_idx)
+        np.minimum(pos, pred_idx.size - 1, out=pos)
+        tp = int(np.count_nonzero(pred_idx[pos] == true_idx))
+    return tp, int(pred_idx.size), int(true_idx.size)
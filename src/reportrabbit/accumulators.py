@@ -0,0 +1,366 @@
+"""
+A module of incremental accumulators for the regression and classification metrics.
+
+An accumulator is updated chunk by chunk with ``(y_true, y_pred)`` pairs and
+keeps only a handful of sufficient statistics, so data larger than memory
+can be evaluated in a single pass. Accumulators built on different chunks
+or shards can be merged.
+"""
+
+from __future__ import annotations
+
+import math
+import warnings
+from typing import Any
+
+import numpy as np
+
+from reportrabbit._backend import (
+    CLASSIFICATION_FIELDS,
+    REGRESSION_FIELDS,
+    _resolve_backend,
+    classification_counts,
+    regression_stats,
+)
+from reportrabbit._iterators import _is_iterator, _paired_blocks
+from reportrabbit.mse_rmse import _to_1d_numeric_array
+from reportrabbit.packed import PackedLabels, _packed_counts
+
+
+class RegressionAccumulator:
+    """
+    Streaming sufficient statistics for the regression metrics.
+
+    Tracks the count, means, centered second moments (merged with Chan's
+    parallel update), and the sums of absolute, squared and absolute
+    percentage errors. From these it produces MAE, MSE, RMSE, MAPE, R and R^2.
+
+    Parameters
+    ----------
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Kernel used to summarise each chunk. ``"jit"`` requires Numba;
+        ``"auto"`` uses it when it is installed and NumPy otherwise.
+
+    Examples
+    --------
+    >>> from reportrabbit import RegressionAccumulator
+    >>> acc = RegressionAccumulator(backend="numpy")
+    >>> acc.update([1.0, 2.0], [2.0, 2.0])
+    >>> acc.update([3.0], [4.0])
+    >>> acc.mae()
+    0.6666666666666666
+    """
+
+    _FIELDS = REGRESSION_FIELDS
+
+    def __init__(self, backend: str = "numpy") -> None:
+        _resolve_backend(backend)
+        self.backend = backend
+        self.n = 0
+        self.mean_true = 0.0
+        self.mean_pred = 0.0
+        self.m2_true = 0.0
+        self.m2_pred = 0.0
+        self.c_true_pred = 0.0
+        self.sum_abs = 0.0
+        self.sum_sq = 0.0
+        self.sum_ape = 0.0
+        self.n_zero_true = 0
+
+    def __repr__(self) -> str:
+        return f"RegressionAccumulator(n={self.n}, backend={self.backend!r})"
+
+    def update(self, y_true: Any, y_pred: Any) -> None:
+        """
+        Add a chunk of observations.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,) or iterator
+            True target values of the chunk.
+        y_pred : array-like of shape (n_samples,) or iterator
+            Predicted target values of the chunk. Iterators (e.g. generators)
+            are consumed in fixed-size blocks, without building a list.
+
+        Raises
+        ------
+        ValueError
+            If the chunk is empty, lengths differ, or values are not finite.
+        """
+        if _is_iterator(y_true) or _is_iterator(y_pred):
+            for yt, yp in _paired_blocks(y_true, y_pred, np.float64):
+                self.update(yt, yp)
+            return
+
+        yt = _to_1d_numeric_array(y_true, "y_true")
+        yp = _to_1d_numeric_array(y_pred, "y_pred")
+        if yt.shape[0] != yp.shape[0]:
+            raise ValueError("Input lengths must match.")
+        self._merge_state(regression_stats(yt, yp, self.backend))
+
+    def merge(self, other: "RegressionAccumulator") -> "RegressionAccumulator":
+        """
+        Merge the statistics of another accumulator into this one.
+
+        Parameters
+        ----------
+        other : RegressionAccumulator
+            Accumulator built on a disjoint set of observations.
+
+        Returns
+        -------
+        RegressionAccumulator
+            This accumulator, updated in place.
+        """
+        if not isinstance(other, RegressionAccumulator):
+            raise TypeError("Can only merge another RegressionAccumulator.")
+        self._merge_state(other._state())
+        return self
+
+    def _state(self) -> tuple:
+        """Return the statistics in the order of `REGRESSION_FIELDS`."""
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def _merge_state(self, state: tuple) -> None:
+        """Combine a state tuple into this accumulator (Chan et al. update)."""
+        (n_b, mean_t_b, mean_p_b, m2_t_b, m2_p_b, c_b, abs_b, sq_b, ape_b, zero_b) = state
+        if n_b == 0:
+            return
+        if self.n == 0:
+            for name, value in zip(self._FIELDS, state):
+                setattr(self, name, value)
+            return
+        n_a = self.n
+        n = n_a + n_b
+        d_true = mean_t_b - self.mean_true
+        d_pred = mean_p_b - self.mean_pred
+        weight = n_a * n_b / n
+
+        self.mean_true += d_true * n_b / n
+        self.mean_pred += d_pred * n_b / n
+        self.m2_true += m2_t_b + d_true * d_true * weight
+        self.m2_pred += m2_p_b + d_pred * d_pred * weight
+        self.c_true_pred += c_b + d_true * d_pred * weight
+        self.sum_abs += abs_b
+        self.sum_sq += sq_b
+        self.sum_ape += ape_b
+        self.n_zero_true += zero_b
+        self.n = n
+
+    def _check_not_empty(self) -> None:
+        if self.n == 0:
+            raise ValueError("Input arrays cannot be empty.")
+
+    def mae(self) -> float:
+        """Mean Absolute Error of all observations seen so far."""
+        self._check_not_empty()
+        return float(self.sum_abs / self.n)
+
+    def mse(self) -> float:
+        """Mean Squared Error of all observations seen so far."""
+        self._check_not_empty()
+        return float(self.sum_sq / self.n)
+
+    def rmse(self) -> float:
+        """Root Mean Squared Error of all observations seen so far."""
+        return float(np.sqrt(self.mse()))
+
+    def mape(self) -> float:
+        """
+        Mean Absolute Percentage Error of all observations seen so far.
+
+        Raises
+        ------
+        ValueError
+            If any observed `y_true` value was zero.
+        """
+        self._check_not_empty()
+        if self.n_zero_true:
+            raise ValueError("MAPE is undefined when y_true contains zero values.")
+        return float(self.sum_ape / self.n)
+
+    def r(self) -> float:
+        """Pearson correlation coefficient; NaN when either side has no variance."""
+        self._check_not_empty()
+        denominator = math.sqrt(self.m2_true * self.m2_pred)
+        if denominator == 0:
+            return np.nan
+        return float(self.c_true_pred / denominator)
+
+    def r2(self) -> float:
+        """Coefficient of determination, following the conventions of `get_r2`."""
+        if self.n < 2:
+            warnings.warn("R^2 is undefined for fewer than 2 data points.")
+            return np.nan
+        if self.m2_true == 0:
+            return 0.0
+        return float(1 - self.sum_sq / self.m2_true)
+
+    def result(self) -> dict:
+        """
+        Return all regression metrics as a dictionary.
+
+        Returns
+        -------
+        dict
+            Keys ``"mae"``, ``"mse"``, ``"rmse"``, ``"mape"``, ``"r"`` and
+            ``"r2"``. ``"mape"`` is NaN when `y_true` contained zeros.
+        """
+        return {
+            "mae": self.mae(),
+            "mse": self.mse(),
+            "rmse": self.rmse(),
+            "mape": np.nan if self.n_zero_true else self.mape(),
+            "r": self.r(),
+            "r2": self.r2(),
+        }
+
+
+class ClassificationAccumulator:
+    """
+    Streaming confusion counts for the classification metrics.
+
+    Counts exact matches (for accuracy) and the binary confusion counts with
+    non-zero labels treated as positive (for precision, recall and F1), the
+    same conventions as `get_accuracy`, `get_precision` and `get_recall`.
+
+    Parameters
+    ----------
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Kernel used to count each chunk. ``"jit"`` requires Numba;
+        ``"auto"`` uses it when it is installed and NumPy otherwise.
+
+    Examples
+    --------
+    >>> from reportrabbit import ClassificationAccumulator
+    >>> acc = ClassificationAccumulator(backend="numpy")
+    >>> acc.update([0, 1], [0, 1])
+    >>> acc.update([1, 0], [0, 0])
+    >>> acc.accuracy()
+    0.75
+    """
+
+    _FIELDS = CLASSIFICATION_FIELDS
+
+    def __init__(self, backend: str = "numpy") -> None:
+        _resolve_backend(backend)
+        self.backend = backend
+        self.n = 0
+        self.n_correct = 0
+        self.tp = 0
+        self.fp = 0
+        self.fn = 0
+        self.tn = 0
+
+    def __repr__(self) -> str:
+        return f"ClassificationAccumulator(n={self.n}, backend={self.backend!r})"
+
+    def update(self, y_true: Any, y_pred: Any) -> None:
+        """
+        Add a chunk of labels.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,), PackedLabels or iterator
+            True labels of the chunk.
+        y_pred : array-like of shape (n_samples,), PackedLabels or iterator
+            Predicted labels of the chunk. Packed chunks are counted with
+            popcounts; both sides must then be packed. Iterators (e.g.
+            generators) are consumed in fixed-size blocks.
+
+        Raises
+        ------
+        ValueError
+            If the chunk is empty or the lengths differ.
+        """
+        if _is_iterator(y_true) or _is_iterator(y_pred):
+            for yt, yp in _paired_blocks(y_true, y_pred):
+                self.update(yt, yp)
+            return
+
+        if isinstance(y_true, PackedLabels) or isinstance(y_pred, PackedLabels):
+            self._merge_state(_packed_counts(y_true, y_pred))
+            return
+
+        yt = np.asarray(y_true).reshape(-1)
+        yp = np.asarray(y_pred).reshape(-1)
+        if yt.shape[0] == 0:
+            raise ValueError("Input cannot be empty")
+        if yt.shape[0] != yp.shape[0]:
+            raise ValueError("Input arrays must be the same length")
+        self._merge_state(classification_counts(yt, yp, self.backend))
+
+    def merge(self, other: "ClassificationAccumulator") -> "ClassificationAccumulator":
+        """
+        Merge the counts of another accumulator into this one.
+
+        Parameters
+        ----------
+        other : ClassificationAccumulator
+            Accumulator built on a disjoint set of observations.
+
+        Returns
+        -------
+        ClassificationAccumulator
+            This accumulator, updated in place.
+        """
+        if not isinstance(other, ClassificationAccumulator):
+            raise TypeError("Can only merge another ClassificationAccumulator.")
+        self._merge_state(other._state())
+        return self
+
+    def _state(self) -> tuple:
+        """Return the counts in the order of `CLASSIFICATION_FIELDS`."""
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def _merge_state(self, state: tuple) -> None:
+        """Add a tuple of counts to this accumulator."""
+        for name, value in zip(self._FIELDS, state):
+            setattr(self, name, getattr(self, name) + int(value))
+
+    def _check_not_empty(self) -> None:
+        if self.n == 0:
+            raise ValueError("Input cannot be empty")
+
+    def accuracy(self) -> float:
+        """Proportion of exactly matching labels."""
+        self._check_not_empty()
+        return float(self.n_correct / self.n)
+
+    def precision(self) -> float:
+        """TP / (TP + FP); 0.0 when no positive predictions were made."""
+        self._check_not_empty()
+        if self.tp + self.fp == 0:
+            return 0.0
+        return float(self.tp / (self.tp + self.fp))
+
+    def recall(self) -> float:
+        """TP / (TP + FN); 0.0 when there are no actual positives."""
+        self._check_not_empty()
+        if self.tp + self.fn == 0:
+            return 0.0
+        return float(self.tp / (self.tp + self.fn))
+
+    def f1(self) -> float:
+        """Harmonic mean of precision and recall; 0.0 when both are 0."""
+        precision = self.precision()
+        recall = self.recall()
+        if precision + recall == 0:
+            return 0.0
+        return float(2 * (precision * recall) / (precision + recall))
+
+    def result(self) -> dict:
+        """
+        Return all classification metrics as a dictionary.
+
+        Returns
+        -------
+        dict
+            Keys ``"accuracy"``, ``"precision"``, ``"recall"`` and ``"f1"``.
+        """
+        return {
+            "accuracy": self.accuracy(),
+            "precision": self.precision(),
+            "recall": self.recall(),
+            "f1": self.f1(),
+        }
@@ -1,5 +1,16 @@
 import numpy as np
 
+from reportrabbit.budget import _block_length, _blocked_count
+from reportrabbit.packed import PackedLabels, _packed_counts
+from reportrabbit._small import _small_accuracy
+from reportrabbit._iterators import _accumulate, _is_iterator
+
+# Peak temporaries per element: the boolean match mask
+_TEMP_BYTES_PER_ELEMENT = 1
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {"get_accuracy": 0.25}
+
 """
 A module that calculates the accuracy statistic (proportion of correct predictions).
 """
@@ -12,13 +23,19 @@ def get_accuracy(y_true, y_pred):
     It represents the overall correctness of the model.
     Accuracy = (True Positives + True Negatives) / Total.
     Scores are between 0 and 1 with a perfect accuracy being 1.
+
+    `y_true` and `y_pred` may also both be `PackedLabels`, in which case the
+    matches are computed with popcounts on the packed bits. Short lists and
+    tuples of numbers or strings are compared in pure Python, which avoids
+    the NumPy call overhead and gives the same result.
     
     Parameters
     ----------
-    y_true : array
+    y_true : array or PackedLabels
         The actual observed values (ground truth).
-    y_pred : array
+    y_pred : array or PackedLabels
         The model predicted values.
+
     Returns
     -------
     float
@@ -37,6 +54,18 @@ def get_accuracy(y_true, y_pred):
     >>> get_accuracy(y_true, y_pred)
     0.75
     """
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        return _accumulate("classification", y_true, y_pred).accuracy()
+
+    # Tiny lists skip the NumPy dispatch overhead; same result
+    small = _small_accuracy(y_true, y_pred)
+    if small is not None:
+        return small
+
+    if isinstance(y_true, PackedLabels) or isinstance(y_pred, PackedLabels):
+        n, n_correct, *_ = _packed_counts(y_true, y_pred)
+        return float(n_correct / n)
+
     y_true = np.asarray(y_true)
     y_pred = np.asarray(y_pred)
     
@@ -46,7 +75,11 @@ def get_accuracy(y_true, y_pred):
     if len(y_true) != len(y_pred):
         raise ValueError("Input arrays must be the same length")
     
-    correct = np.sum(y_true == y_pred)
     total = len(y_true)
+    block = _block_length(total, _TEMP_BYTES_PER_ELEMENT)
+    if block is not None:
+        correct = _blocked_count(lambda i, j: y_true[i:j] == y_pred[i:j], total, block)
+    else:
+        correct = np.sum(y_true == y_pred)
     
     return float(correct / total)
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""
+A module that estimates a metric from random samples, with a confidence interval.
+
+MAE, MSE, MAPE and accuracy are means of one per-row term (absolute error,
+squared error, absolute percentage error, exact match), so a uniform random
+sample of rows gives an unbiased estimate of each, and the central limit
+theorem gives a confidence interval for it. RMSE uses the interval of the
+MSE, square-rooted. Accuracy, a proportion, uses the Wilson score interval,
+which stays inside [0, 1] and keeps a nonzero width when every sampled
+prediction is right (or wrong).
+
+`approximate_metric` draws progressively larger samples (each round doubles
+the total), reading only the sampled rows with fancy indexing, which is a
+random read on a `numpy.memmap` rather than a copy of the data. It keeps the
+running mean and variance of the terms (Chan et al. update) and stops as
+soon as the interval is within the requested tolerance. With `strata`, rows
+are sampled within each stratum in proportion to its size and the strata
+means are combined with their population weights, which narrows the
+interval when the strata differ.
+"""
+
+from __future__ import annotations
+
+import math
+from statistics import NormalDist
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
+
+from reportrabbit.accuracy import get_accuracy
+from reportrabbit.mae import get_mae
+from reportrabbit.mape import get_mape
+from reportrabbit.mse_rmse import get_mse, get_rmse
+
+METRICS = ("mae", "mse", "rmse", "mape", "accuracy")
+
+_METRIC_FUNCTIONS = {
+    get_mae: "mae",
+    get_mse: "mse",
+    get_rmse: "rmse",
+    get_mape: "mape",
+    get_accuracy: "accuracy",
+}
+_EXACT = {name: func for func, name in _METRIC_FUNCTIONS.items()}
+
+
+def _resolve_metric(metric: Union[str, Callable]) -> str:
+    """Map a metric name or ``get_*`` function to its name."""
+    name = _METRIC_FUNCTIONS.get(metric, metric) if callable(metric) else metric
+    if name not in METRICS:
+        raise ValueError(f"metric must be one of {METRICS} or the matching get_* function.")
+    return name
+
+
+def _terms(metric: str, yt: np.ndarray, yp: np.ndarray) -> np.ndarray:
+    """Per-row terms whose mean is `metric` (the MSE for ``"rmse"``)."""
+    if metric == "accuracy":
+        return (yt == yp).astype(np.float64)
+
+    yt = yt.astype(np.float64, copy=False)
+    yp = yp.astype(np.float64, copy=False)
+    if not (np.all(np.isfinite(yt)) and np.all(np.isfinite(yp))):
+        raise ValueError("Inputs must contain only finite values.")
+    residual = yt - yp
+    if metric == "mae":
+        return np.abs(residual)
+    if metric == "mape":
+        if np.any(yt == 0):
+            raise ValueError("MAPE is undefined when y_true contains zero values.")
+        return np.abs(residual / yt)
+    return residual**2
+
+
+class _RunningMoments:
+    """Count, mean and sum of squared deviations of a growing sample."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        n_b = values.shape[0]
+        mean_b = float(np.mean(values))
+        m2_b = float(np.sum((values - mean_b) ** 2))
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.m2 += m2_b + delta * delta * self.n * n_b / n
+        self.mean += delta * n_b / n
+        self.n = n
+
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else math.inf
+
+
+def _wilson_interval(p: float, variance: float, n: int, z: float) -> tuple[float, float]:
+    """
+    Wilson score interval of a proportion `p`, clamped to [0, 1].
+
+    `n` is the effective sample size ``p * (1 - p) / variance`` (Kish), so
+    that the narrower variance of a stratified estimate carries over; it
+    falls back to the number of sampled rows when the variance is zero.
+    """
+    if variance > 0:
+        n = p * (1 - p) / variance
+    z2_n = z * z / n
+    center = (p + z2_n / 2) / (1 + z2_n)
+    half_width = z / (1 + z2_n) * math.sqrt(p * (1 - p) / n + z2_n / (4 * n))
+    return max(center - half_width, 0.0), min(center + half_width, 1.0)
+
+
+def approximate_metric(
+    y_true: Any,
+    y_pred: Any,
+    metric: Union[str, Callable] = "mae",
+    *,
+    tolerance: float = 1e-3,
+    relative: bool = True,
+    confidence: float = 0.95,
+    strata: Optional[Sequence[Any]] = None,
+    initial_size: int = 10_000,
+    max_fraction: float = 1.0,
+    random_state: Optional[Union[int, np.random.Generator]] = None,
+) -> dict:
+    """
+    Estimate a metric from growing random samples until it is precise enough.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        True values or labels. A `numpy.memmap` is read only at the sampled
+        rows.
+    y_pred : array-like of shape (n_samples,)
+        Predicted values or labels, read the same way.
+    metric : {"mae", "mse", "rmse", "mape", "accuracy"} or callable, default="mae"
+        Metric to estimate, by name or as the matching ``get_*`` function.
+    tolerance : float, default=1e-3
+        Stop once the half-width of the interval is at most `tolerance`
+        times the estimate (``relative=True``, so 1e-3 is +/-0.1%) or at
+        most `tolerance` (``relative=False``).
+    relative : bool, default=True
+        Whether `tolerance` is relative to the estimate.
+    confidence : float, default=0.95
+        Confidence level of the interval: a normal approximation interval,
+        or a Wilson score interval for ``"accuracy"``.
+    strata : sequence of array-like of int, optional
+        Row indices of each stratum, e.g. one index array (or memmap) per
+        class or time period. The strata must partition the rows: every
+        row index in ``[0, n_samples)`` appears in exactly one stratum,
+        once. This is checked up front, which reads every index once. When
+        given, every round samples each stratum in proportion to its size.
+    initial_size : int, default=10_000
+        Number of rows in the first sample; every later round doubles the
+        total.
+    max_fraction : float, default=1.0
+        Largest number of sampled rows, as a fraction of `n_samples`. When
+        the next round would sample all rows anyway (``max_fraction=1``),
+        the metric is computed exactly instead. Rows are drawn with
+        replacement, so the sampled rows may repeat, and with `strata` the
+        per-stratum sizes are rounded up, which can exceed the budget by a
+        few rows per stratum.
+    random_state : int or numpy.random.Generator, optional
+        Seed or generator for the row samples.
+
+    Returns
+    -------
+    dict
+        ``"estimate"``: the metric estimate. ``"interval"``: the
+        ``(lower, upper)`` confidence interval. ``"fraction"``: rows read
+        divided by `n_samples`. ``"n_sampled"``: rows read, counting
+        repeated rows. ``"converged"``: whether the tolerance was met
+        (always ``True`` after an exact evaluation). For the error metrics,
+        a sample in which some stratum has no spread at all (e.g. only
+        zero errors, while rare large errors were missed) is never
+        considered converged; sampling continues.
+
+    Raises
+    ------
+    ValueError
+        If the inputs are empty or differ in length, an argument is out of
+        range, `strata` do not partition the rows, or a sampled value is not
+        finite (or is a zero `y_true` for ``"mape"``).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from reportrabbit import approximate_metric
+    >>> rng = np.random.default_rng(0)
+    >>> y_true = rng.normal(100, 10, 5_000_000)
+    >>> y_pred = y_true + rng.normal(0, 5, 5_000_000)
+    >>> result = approximate_metric(y_true, y_pred, "mae", tolerance=0.01, random_state=0)
+    >>> result["converged"], result["fraction"] < 0.01
+    (True, True)
+    >>> lower, upper = result["interval"]
+    >>> bool(lower <= 3.989 <= upper)
+    True
+    """
+    name = _resolve_metric(metric)
+    if not tolerance > 0:
+        raise ValueError("tolerance must be positive.")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1.")
+    if not 0 < max_fraction <= 1:
+        raise ValueError("max_fraction must be in (0, 1].")
+    if initial_size < 2:
+        raise ValueError("initial_size must be at least 2.")
+
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    if y_true.ndim != 1 or y_pred.ndim != 1:
+        raise ValueError("Inputs must be 1D array-likes.")
+    n = y_true.shape[0]
+    if n == 0:
+        raise ValueError("Input arrays cannot be empty.")
+    if y_pred.shape[0] != n:
+        raise ValueError("Input lengths must match.")
+
+    if strata is None:
+        strata = [None]
+        sizes = np.array([n])
+    else:
+        strata = [np.asarray(indices).reshape(-1) for indices in strata]
+        sizes = np.array([indices.shape[0] for indices in strata])
+        if sizes.sum() != n:
+            raise ValueError("strata must partition the rows of y_true.")
+        rows = np.concatenate([indices for indices in strata if indices.shape[0]])
+        if (
+            rows.dtype.kind not in "iu"
+            or rows.min() < 0
+            or rows.max() >= n
+            or np.any(np.bincount(rows, minlength=n) != 1)
+        ):
+            raise ValueError("strata must partition the rows of y_true.")
+        del rows
+    weights = sizes / n
+    nonempty = np.flatnonzero(sizes)
+
+    rng = np.random.default_rng(random_state)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    budget = max(int(max_fraction * n), 2)
+    moments = [_RunningMoments() for _ in strata]
+    n_sampled = 0
+    round_size = initial_size
+
+    while True:
+        if max_fraction == 1 and n_sampled + round_size >= n:
+            value = float(_EXACT[name](y_true, y_pred))
+            return {
+                "estimate": value,
+                "interval": (value, value),
+                "fraction": 1.0,
+                "n_sampled": n,
+                "converged": True,
+            }
+        round_size = min(round_size, budget - n_sampled)
+
+        for h in nonempty:
+            k = max(2, math.ceil(round_size * weights[h]))
+            rows = rng.integers(0, sizes[h], k)
+            if strata[h] is not None:
+                rows = strata[h][rows]
+            rows.sort()  # sequential page access on memmaps
+            moments[h].update(_terms(name, y_true[rows], y_pred[rows]))
+            n_sampled += k
+
+        mean = sum(weights[h] * moments[h].mean for h in nonempty)
+        variance = sum(weights[h] ** 2 * moments[h].variance() / moments[h].n for h in nonempty)
+        if name == "accuracy":
+            lower, upper = _wilson_interval(mean, variance, n_sampled, z)
+            degenerate = False
+        else:
+            half_width = z * math.sqrt(variance)
+            lower, upper = mean - half_width, mean + half_width
+            # Identical terms say nothing about the tails that were not sampled
+            degenerate = any(moments[h].m2 == 0 for h in nonempty)
+        if name == "rmse":
+            mean, lower, upper = math.sqrt(mean), math.sqrt(max(lower, 0.0)), math.sqrt(upper)
+
+        limit = tolerance * abs(mean) if relative else tolerance
+        converged = not degenerate and max(upper - mean, mean - lower) <= limit
+        if converged or n_sampled >= budget:
+            return {
+                "estimate": float(mean),
+                "interval": (float(lower), float(upper)),
+                "fraction": n_sampled / n,
+                "n_sampled": n_sampled,
+                "converged": bool(converged),
+            }
+        round_size = n_sampled
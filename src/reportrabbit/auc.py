@@ -0,0 +1,368 @@
+"""
+A module that calculates the area under the ROC curve and the precision-recall curve.
+
+Both metrics score continuous classifier outputs rather than hard labels.
+The exact mode sorts the scores once and walks the tie-aware cumulative
+counts. The binned mode accumulates fixed-bin positive/negative histograms
+(`ScoreHistogram`) chunk by chunk, which uses O(n_bins) memory and can be
+merged across shards.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+MODES = ("exact", "binned")
+
+# Number of scores binned at a time, to bound the size of the temporaries
+_CHUNK_SIZE = 1 << 20
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {
+    "get_roc_auc": 4.75,
+    "get_pr_auc": 4.75,
+}
+
+
+def _validate_scores(y_true: Any, y_score: Any) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Coerce labels to a positive mask and scores to a 1D float array.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        True labels; non-zero labels are positive.
+    y_score : array-like of shape (n_samples,)
+        Classifier scores; larger means more likely positive.
+
+    Returns
+    -------
+    positive : numpy.ndarray of bool, shape (n_samples,)
+        Mask of positive samples.
+    score : numpy.ndarray of float, shape (n_samples,)
+        Scores.
+
+    Raises
+    ------
+    ValueError
+        If inputs are empty, of different lengths, or scores are not finite.
+    """
+    positive = np.asarray(y_true).reshape(-1) != 0
+    score = np.asarray(y_score, dtype=np.float64).reshape(-1)
+
+    if positive.shape[0] == 0:
+        raise ValueError("Input cannot be empty")
+    if positive.shape[0] != score.shape[0]:
+        raise ValueError("Input arrays must be the same length")
+    if not np.all(np.isfinite(score)):
+        raise ValueError("Scores must contain only finite values.")
+    return positive, score
+
+
+def _check_mode(mode: str) -> None:
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}, got {mode!r}.")
+
+
+def _grouped_counts(positive: np.ndarray, score: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Positive and negative counts per distinct score, from highest to lowest.
+
+    Uses a single stable sort; tied scores are grouped so they share one
+    threshold on the curve.
+    """
+    order = np.argsort(score, kind="stable")[::-1]
+    sorted_score = score[order]
+    tps = np.cumsum(positive[order])
+
+    # Last index of every group of equal scores
+    ends = np.r_[np.flatnonzero(np.diff(sorted_score)), sorted_score.shape[0] - 1]
+    cum_pos = tps[ends]
+    cum_neg = ends + 1 - cum_pos
+    return np.diff(cum_pos, prepend=0), np.diff(cum_neg, prepend=0)
+
+
+def _roc_auc_from_counts(pos: np.ndarray, neg: np.ndarray) -> float:
+    """
+    ROC AUC from per-threshold counts ordered by decreasing score.
+
+    Samples in the same group are ties and receive half credit, which is
+    the trapezoidal rule on the ROC curve (the Mann-Whitney U statistic).
+    """
+    n_pos = int(pos.sum())
+    n_neg = int(neg.sum())
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError("ROC AUC is undefined when y_true contains only one class.")
+
+    # Negatives ranked above each group, plus half of the negatives tied with it
+    neg_above = np.cumsum(neg) - neg
+    wins = np.dot(pos.astype(np.float64), (n_neg - neg_above) - 0.5 * neg)
+    return float(wins / (n_pos * n_neg))
+
+
+def _pr_auc_from_counts(pos: np.ndarray, neg: np.ndarray) -> float:
+    """
+    Average precision from per-threshold counts ordered by decreasing score.
+
+    AP = sum_k (R_k - R_{k-1}) * P_k, evaluated at every threshold where
+    recall increases.
+    """
+    n_pos = int(pos.sum())
+    if n_pos == 0:
+        raise ValueError("PR AUC is undefined when y_true contains no positives.")
+
+    tps = np.cumsum(pos)
+    fps = np.cumsum(neg)
+    hit = pos > 0
+    precision = tps[hit] / (tps[hit] + fps[hit])
+    return float(np.dot(pos[hit] / n_pos, precision))
+
+
+class ScoreHistogram:
+    """
+    Fixed-bin positive/negative score histograms for bounded-memory AUC.
+
+    Scores are assigned to `n_bins` equal-width bins over `score_range`
+    (scores outside the range fall into the first or last bin). Updating
+    costs O(chunk) time and the state is two integer arrays of length
+    `n_bins`, so histograms from different shards can be merged exactly.
+
+    The AUC values computed from the histogram treat scores in the same
+    bin as ties. The approximation error is bounded by
+    `roc_auc_error_bound` and `pr_auc_error_bound`; for ROC AUC the bound is
+    ``0.5 * sum_b(pos_b * neg_b) / (P * N)``, i.e. half the fraction of
+    positive/negative pairs that share a bin, and it shrinks as bins are
+    made finer.
+
+    Parameters
+    ----------
+    n_bins : int, default=1024
+        Number of bins.
+    score_range : tuple of float, default=(0.0, 1.0)
+        Lower and upper edge of the binned score range.
+
+    Examples
+    --------
+    >>> from reportrabbit import ScoreHistogram
+    >>> hist = ScoreHistogram(n_bins=10)
+    >>> hist.update([0, 0, 1, 1], [0.1, 0.4, 0.35, 0.8])
+    >>> hist.roc_auc()
+    0.75
+    """
+
+    def __init__(self, n_bins: int = 1024, score_range: tuple = (0.0, 1.0)) -> None:
+        if isinstance(n_bins, bool) or not isinstance(n_bins, (int, np.integer)) or n_bins < 1:
+            raise ValueError("n_bins must be a positive integer.")
+        low, high = (float(v) for v in score_range)
+        if not high > low:
+            raise ValueError("score_range must be an increasing (low, high) pair.")
+
+        self.n_bins = int(n_bins)
+        self.score_range = (low, high)
+        self.pos = np.zeros(self.n_bins, dtype=np.int64)
+        self.neg = np.zeros(self.n_bins, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"ScoreHistogram(n_bins={self.n_bins}, score_range={self.score_range})"
+
+    def update(self, y_true: Any, y_score: Any) -> None:
+        """
+        Add a chunk of labels and scores to the histograms.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,)
+            True labels of the chunk; non-zero labels are positive.
+        y_score : array-like of shape (n_samples,)
+            Scores of the chunk.
+        """
+        positive, score = _validate_scores(y_true, y_score)
+        low, high = self.score_range
+        for start in range(0, score.shape[0], _CHUNK_SIZE):
+            chunk = score[start : start + _CHUNK_SIZE]
+            bins = ((chunk - low) * (self.n_bins / (high - low))).astype(np.int64)
+            np.clip(bins, 0, self.n_bins - 1, out=bins)
+            # One bincount for both classes: positives are offset by n_bins
+            bins += positive[start : start + _CHUNK_SIZE] * self.n_bins
+            counts = np.bincount(bins, minlength=2 * self.n_bins)
+            self.neg += counts[: self.n_bins]
+            self.pos += counts[self.n_bins :]
+
+    def merge(self, other: "ScoreHistogram") -> "ScoreHistogram":
+        """
+        Add the counts of another histogram with the same binning.
+
+        Parameters
+        ----------
+        other : ScoreHistogram
+            Histogram built on a disjoint set of samples.
+
+        Returns
+        -------
+        ScoreHistogram
+            This histogram, updated in place.
+        """
+        if not isinstance(other, ScoreHistogram):
+            raise TypeError("Can only merge another ScoreHistogram.")
+        if other.n_bins != self.n_bins or other.score_range != self.score_range:
+            raise ValueError("Histograms must have the same n_bins and score_range.")
+        self.pos += other.pos
+        self.neg += other.neg
+        return self
+
+    def roc_auc(self) -> float:
+        """ROC AUC with scores in the same bin treated as ties."""
+        return _roc_auc_from_counts(self.pos[::-1], self.neg[::-1])
+
+    def pr_auc(self) -> float:
+        """Average precision with bin edges used as thresholds."""
+        return _pr_auc_from_counts(self.pos[::-1], self.neg[::-1])
+
+    def roc_auc_error_bound(self) -> float:
+        """
+        Upper bound on ``|roc_auc() - exact ROC AUC|``.
+
+        Within a bin every positive/negative pair counts as a tie (half a
+        win), while the exact value counts it as 0 or 1.
+        """
+        n_pos = int(self.pos.sum())
+        n_neg = int(self.neg.sum())
+        if n_pos == 0 or n_neg == 0:
+            raise ValueError("ROC AUC is undefined when y_true contains only one class.")
+        shared = np.dot(self.pos.astype(np.float64), self.neg)
+        return float(0.5 * shared / (n_pos * n_neg))
+
+    def pr_auc_error_bound(self) -> float:
+        """
+        Upper bound on ``|pr_auc() - exact average precision|``.
+
+        Inside a bin the exact precision at each positive lies between
+        ``(T + 1) / (T + 1 + F + neg_b)`` and ``(T + pos_b) / (T + pos_b + F)``,
+        where T and F count the samples in higher bins. The bound adds up
+        the width of that interval weighted by the recall gained in the bin.
+        """
+        pos = self.pos[::-1].astype(np.float64)
+        neg = self.neg[::-1].astype(np.float64)
+        n_pos = pos.sum()
+        if n_pos == 0:
+            raise ValueError("PR AUC is undefined when y_true contains no positives.")
+
+        hit = pos > 0
+        tp_above = (np.cumsum(pos) - pos)[hit]
+        fp_above = (np.cumsum(neg) - neg)[hit]
+        upper = (tp_above + pos[hit]) / (tp_above + pos[hit] + fp_above)
+        lower = (tp_above + 1) / (tp_above + 1 + fp_above + neg[hit])
+        return float(np.dot(pos[hit] / n_pos, upper - lower))
+
+
+def get_roc_auc(
+    y_true: Any,
+    y_score: Any,
+    *,
+    mode: str = "exact",
+    n_bins: int = 1024,
+    score_range: tuple = (0.0, 1.0),
+) -> float:
+    """
+    Calculates the area under the ROC curve (ROC AUC) and returns the result.
+
+    ROC AUC is the probability that a randomly chosen positive sample is
+    scored higher than a randomly chosen negative one (ties count as half).
+    Scores are between 0 and 1, with 0.5 for a random classifier and 1 for
+    a perfect ranking.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        The actual observed labels. Non-zero labels are positive.
+    y_score : array-like of shape (n_samples,)
+        The model scores; larger means more likely positive.
+    mode : {"exact", "binned"}, default="exact"
+        ``"exact"`` uses one O(n log n) sort and tie-aware cumulative counts.
+        ``"binned"`` accumulates a `ScoreHistogram` in chunks; its error is
+        at most `ScoreHistogram.roc_auc_error_bound`.
+    n_bins : int, default=1024
+        Number of bins for ``mode="binned"``.
+    score_range : tuple of float, default=(0.0, 1.0)
+        Binned score range for ``mode="binned"``.
+
+    Returns
+    -------
+    float
+        The calculated ROC AUC, ranging from 0.0 to 1.0.
+
+    Raises
+    ------
+    ValueError
+        If inputs are invalid or `y_true` contains only one class.
+
+    Examples
+    --------
+    >>> y_true = [0, 0, 1, 1]
+    >>> y_score = [0.1, 0.4, 0.35, 0.8]
+    >>> get_roc_auc(y_true, y_score)
+    0.75
+    """
+    _check_mode(mode)
+    if mode == "binned":
+        hist = ScoreHistogram(n_bins, score_range)
+        hist.update(y_true, y_score)
+        return hist.roc_auc()
+    return _roc_auc_from_counts(*_grouped_counts(*_validate_scores(y_true, y_score)))
+
+
+def get_pr_auc(
+    y_true: Any,
+    y_score: Any,
+    *,
+    mode: str = "exact",
+    n_bins: int = 1024,
+    score_range: tuple = (0.0, 1.0),
+) -> float:
+    """
+    Calculates the area under the precision-recall curve (average precision).
+
+    Average precision summarises the precision-recall curve as the mean of
+    the precision reached at each threshold, weighted by the increase in
+    recall: AP = sum_k (R_k - R_{k-1}) * P_k. Tied scores share a threshold.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        The actual observed labels. Non-zero labels are positive.
+    y_score : array-like of shape (n_samples,)
+        The model scores; larger means more likely positive.
+    mode : {"exact", "binned"}, default="exact"
+        ``"exact"`` uses one O(n log n) sort and tie-aware cumulative counts.
+        ``"binned"`` accumulates a `ScoreHistogram` in chunks; its error is
+        at most `ScoreHistogram.pr_auc_error_bound`.
+    n_bins : int, default=1024
+        Number of bins for ``mode="binned"``.
+    score_range : tuple of float, default=(0.0, 1.0)
+        Binned score range for ``mode="binned"``.
+
+    Returns
+    -------
+    float
+        The calculated average precision, ranging from 0.0 to 1.0.
+
+    Raises
+    ------
+    ValueError
+        If inputs are invalid or `y_true` contains no positives.
+
+    Examples
+    --------
+    >>> y_true = [0, 0, 1, 1]
+    >>> y_score = [0.1, 0.4, 0.35, 0.8]
+    >>> get_pr_auc(y_true, y_score)
+    0.8333333333333333
+    """
+    _check_mode(mode)
+    if mode == "binned":
+        hist = ScoreHistogram(n_bins, score_range)
+        hist.update(y_true, y_score)
+        return hist.pr_auc()
+    return _pr_auc_from_counts(*_grouped_counts(*_validate_scores(y_true, y_score)))
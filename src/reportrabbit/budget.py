@@ -0,0 +1,217 @@
+"""
+A module that caps the memory used by temporary arrays inside the metrics.
+
+A metric such as ``get_mape`` coerces both inputs to float64 and then builds
+several full-length temporaries (the residual, the ratio, its absolute
+value). On large in-memory inputs these temporaries can take several times
+the size of the inputs themselves. Under a `MemoryBudget` the metrics
+process their inputs in blocks sized so that the temporaries of one block
+stay under ``max_temp_bytes``.
+
+Blocked results are bit-for-bit identical to the unblocked ones: block sums
+are combined in the same order as NumPy's own pairwise (or, for inputs that
+need casting, buffered) summation of the full array.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+_GLOBAL_BUDGET: Optional["MemoryBudget"] = None
+_LOCAL = threading.local()
+
+# numpy switches from its unrolled loop to recursive halving above this length
+_PAIRWISE_BLOCKSIZE = 128
+
+
+class MemoryBudget:
+    """
+    Upper bound on the temporary memory used by the metric functions.
+
+    Use it as a context manager to apply the budget to the calls made inside
+    the ``with`` block (in the current thread), or install it for every call
+    with `set_memory_budget`. Metrics whose temporaries would exceed
+    `max_temp_bytes` process their inputs in blocks; smaller calls run
+    unchanged. Either way the call's planned temporary footprint (its block
+    length times the bytes of temporaries the metric declares per element)
+    is recorded in `planned_temp_bytes`. It is computed when the call is
+    planned, not measured from the allocations made.
+
+    The budget covers temporaries only: the inputs themselves are not
+    counted, and lists or other non-array inputs are still converted to one
+    array up front.
+
+    Parameters
+    ----------
+    max_temp_bytes : int
+        Largest number of bytes of temporaries that one metric call may hold
+        at the same time.
+
+    Attributes
+    ----------
+    planned_temp_bytes : int
+        Largest planned temporary footprint of any metric call made under
+        the budget.
+    n_blocked_calls : int
+        Number of metric calls that had to be split into blocks.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from reportrabbit import MemoryBudget, get_mape
+    >>> y_true = np.arange(1.0, 100_001.0)
+    >>> with MemoryBudget(max_temp_bytes=1_000_000) as budget:
+    ...     mape = get_mape(y_true, y_true * 1.01)
+    >>> round(mape, 6), budget.planned_temp_bytes <= 1_000_000, budget.n_blocked_calls
+    (0.01, True, 1)
+    """
+
+    def __init__(self, max_temp_bytes: int) -> None:
+        if max_temp_bytes <= 0:
+            raise ValueError("max_temp_bytes must be a positive integer.")
+        self.max_temp_bytes = int(max_temp_bytes)
+        self.planned_temp_bytes = 0
+        self.n_blocked_calls = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"MemoryBudget(max_temp_bytes={self.max_temp_bytes}, "
+            f"planned_temp_bytes={self.planned_temp_bytes})"
+        )
+
+    def __enter__(self) -> "MemoryBudget":
+        stack = getattr(_LOCAL, "stack", None)
+        if stack is None:
+            stack = _LOCAL.stack = []
+        stack.append(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _LOCAL.stack.remove(self)
+
+    def _block_length(self, n: int, bytes_per_element: int) -> Optional[int]:
+        """
+        Elements per block for a call on `n` elements, or None if no blocking is needed.
+
+        Blocks are whole multiples of NumPy's buffer size, so they line up
+        with both the pairwise and the buffered summation orders.
+        """
+        if n * bytes_per_element <= self.max_temp_bytes:
+            self.planned_temp_bytes = max(self.planned_temp_bytes, n * bytes_per_element)
+            return None
+
+        unit = np.getbufsize()
+        block = self.max_temp_bytes // bytes_per_element // unit * unit
+        if block == 0:
+            raise ValueError(
+                f"max_temp_bytes={self.max_temp_bytes} is too small; this metric "
+                f"needs at least {unit * bytes_per_element} bytes per block."
+            )
+        self.planned_temp_bytes = max(self.planned_temp_bytes, block * bytes_per_element)
+        self.n_blocked_calls += 1
+        return block
+
+
+def set_memory_budget(max_temp_bytes: Optional[int]) -> Optional[MemoryBudget]:
+    """
+    Install a process-wide memory budget for the metric functions.
+
+    Parameters
+    ----------
+    max_temp_bytes : int or None
+        Largest number of bytes of temporaries per metric call, or None to
+        remove the global budget.
+
+    Returns
+    -------
+    MemoryBudget or None
+        The installed budget, whose `planned_temp_bytes` tracks every call made
+        without a more specific ``with MemoryBudget(...)`` block.
+    """
+    global _GLOBAL_BUDGET
+    _GLOBAL_BUDGET = None if max_temp_bytes is None else MemoryBudget(max_temp_bytes)
+    return _GLOBAL_BUDGET
+
+
+def get_memory_budget() -> Optional[MemoryBudget]:
+    """
+    Return the budget that applies to metric calls made from this thread.
+
+    Returns
+    -------
+    MemoryBudget or None
+        The innermost active ``with MemoryBudget(...)`` block, otherwise the
+        global budget installed with `set_memory_budget`, otherwise None.
+    """
+    stack = getattr(_LOCAL, "stack", None)
+    if stack:
+        return stack[-1]
+    return _GLOBAL_BUDGET
+
+
+def _block_length(n: int, bytes_per_element: int) -> Optional[int]:
+    """Block length under the active budget, or None to run the unblocked path."""
+    budget = get_memory_budget()
+    if budget is None:
+        return None
+    return budget._block_length(n, bytes_per_element)
+
+
+def _reduction_dtype(arr: np.ndarray) -> Optional[np.dtype]:
+    """Accumulator dtype that ``np.mean`` casts `arr` to, or None if it sums in place."""
+    if issubclass(arr.dtype.type, (np.integer, np.bool_)):
+        return np.dtype(np.float64)
+    return None
+
+
+def _blocked_sum(
+    terms: Callable[[int, int], np.ndarray],
+    n: int,
+    block: int,
+    dtype: Optional[np.dtype] = None,
+) -> Any:
+    """
+    Sum ``terms(start, stop)`` over ``[0, n)`` exactly as one ``np.add.reduce`` call would.
+
+    Parameters
+    ----------
+    terms : callable
+        Returns the array of summands for the half-open range ``[start, stop)``.
+    n : int
+        Total number of summands.
+    block : int
+        Largest range passed to `terms`; a multiple of ``np.getbufsize()``.
+    dtype : numpy.dtype, optional
+        Accumulator dtype when the summands have to be cast (integer or
+        boolean terms summed in float64). NumPy then adds pairwise sums of
+        buffer-sized chunks one after the other, which is replayed with
+        ``initial=``. When omitted, the summands are summed in their own
+        dtype and NumPy's pairwise recursion is replayed down to `block`.
+
+    Returns
+    -------
+    numpy scalar
+        The sum, bit-for-bit equal to ``np.add.reduce`` over all terms.
+    """
+    if dtype is not None:
+        total = dtype.type(0)
+        for start in range(0, n, block):
+            total = np.add.reduce(terms(start, min(start + block, n)), dtype=dtype, initial=total)
+        return total
+
+    def pairwise(start: int, length: int) -> Any:
+        if length <= max(block, _PAIRWISE_BLOCKSIZE):
+            return np.add.reduce(terms(start, start + length))
+        half = length // 2
+        half -= half % 8
+        return pairwise(start, half) + pairwise(start + half, length - half)
+
+    return pairwise(0, n)
+
+
+def _blocked_count(mask: Callable[[int, int], np.ndarray], n: int, block: int) -> int:
+    """Count the true entries of ``mask(start, stop)`` over ``[0, n)`` in blocks."""
+    return sum(np.count_nonzero(mask(start, min(start + block, n))) for start in range(0, n, block))
@@ -0,0 +1,176 @@
+"""
+A module of streaming calibration metrics for probabilistic classifiers.
+
+`CalibrationAccumulator` splits [0, 1] into equal-width bins and keeps, for
+each bin, the number of samples, the sum of their predicted probabilities
+and the number of positives, all updated with `np.bincount`. The expected
+and maximum calibration errors and the reliability diagram follow from
+these O(n_bins) arrays; the Brier score is a running sum. Accumulators
+built on different chunks or shards can be merged exactly (up to the
+rounding of the float sums).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from reportrabbit.auc import _CHUNK_SIZE, _validate_scores
+
+
+class CalibrationAccumulator:
+    """
+    Binned calibration statistics: ECE, MCE, Brier score and reliability bins.
+
+    Parameters
+    ----------
+    n_bins : int, default=15
+        Number of equal-width probability bins over [0, 1]. A score of
+        exactly 1.0 falls into the last bin.
+
+    Examples
+    --------
+    >>> from reportrabbit import CalibrationAccumulator
+    >>> acc = CalibrationAccumulator(n_bins=2)
+    >>> acc.update([0, 0, 1], [0.1, 0.3, 0.8])
+    >>> acc.update([1, 0], [0.6, 0.7])
+    >>> round(acc.ece(), 6)
+    0.1
+    >>> round(acc.brier_score(), 6)
+    0.158
+    """
+
+    def __init__(self, n_bins: int = 15) -> None:
+        if isinstance(n_bins, bool) or not isinstance(n_bins, (int, np.integer)) or n_bins < 1:
+            raise ValueError("n_bins must be a positive integer.")
+        self.n_bins = int(n_bins)
+        self.counts = np.zeros(self.n_bins, dtype=np.int64)
+        self.n_positive = np.zeros(self.n_bins, dtype=np.int64)
+        self.sum_score = np.zeros(self.n_bins, dtype=np.float64)
+        self.sum_sq_error = 0.0
+
+    def __repr__(self) -> str:
+        return f"CalibrationAccumulator(n_bins={self.n_bins}, n={self.n})"
+
+    @property
+    def n(self) -> int:
+        """Number of samples seen."""
+        return int(self.counts.sum())
+
+    def update(self, y_true: Any, y_score: Any) -> None:
+        """
+        Add a chunk of labels and predicted probabilities.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,)
+            True labels of the chunk; non-zero labels are positive.
+        y_score : array-like of shape (n_samples,)
+            Predicted probabilities of the positive class.
+
+        Raises
+        ------
+        ValueError
+            If the chunk is empty, the lengths differ, or a score is not a
+            probability in [0, 1].
+        """
+        positive, score = _validate_scores(y_true, y_score)
+        if np.any(score < 0) or np.any(score > 1):
+            raise ValueError("Scores must be probabilities in [0, 1].")
+
+        for start in range(0, score.shape[0], _CHUNK_SIZE):
+            chunk = score[start : start + _CHUNK_SIZE]
+            chunk_positive = positive[start : start + _CHUNK_SIZE]
+            bins = (chunk * self.n_bins).astype(np.int64)
+            np.minimum(bins, self.n_bins - 1, out=bins)
+
+            self.counts += np.bincount(bins, minlength=self.n_bins)
+            self.n_positive += np.bincount(bins[chunk_positive], minlength=self.n_bins)
+            self.sum_score += np.bincount(bins, weights=chunk, minlength=self.n_bins)
+            self.sum_sq_error += float(np.sum((chunk - chunk_positive) ** 2))
+
+    def merge(self, other: "CalibrationAccumulator") -> "CalibrationAccumulator":
+        """
+        Add the statistics of another accumulator with the same binning.
+
+        Parameters
+        ----------
+        other : CalibrationAccumulator
+            Accumulator built on a disjoint set of samples.
+
+        Returns
+        -------
+        CalibrationAccumulator
+            This accumulator, updated in place.
+        """
+        if not isinstance(other, CalibrationAccumulator):
+            raise TypeError("Can only merge another CalibrationAccumulator.")
+        if other.n_bins != self.n_bins:
+            raise ValueError("Accumulators must have the same n_bins.")
+        self.counts += other.counts
+        self.n_positive += other.n_positive
+        self.sum_score += other.sum_score
+        self.sum_sq_error += other.sum_sq_error
+        return self
+
+    def _check_not_empty(self) -> None:
+        if self.n == 0:
+            raise ValueError("Input cannot be empty")
+
+    def _gaps(self) -> tuple[np.ndarray, np.ndarray]:
+        """Calibration gap and count of every non-empty bin."""
+        nonempty = self.counts > 0
+        counts = self.counts[nonempty]
+        gaps = np.abs(self.sum_score[nonempty] - self.n_positive[nonempty]) / counts
+        return gaps, counts
+
+    def ece(self) -> float:
+        """Expected calibration error: bin gaps weighted by the share of samples."""
+        self._check_not_empty()
+        gaps, counts = self._gaps()
+        return float(np.dot(gaps, counts) / self.n)
+
+    def mce(self) -> float:
+        """Maximum calibration error: the largest gap over non-empty bins."""
+        self._check_not_empty()
+        gaps, _ = self._gaps()
+        return float(gaps.max())
+
+    def brier_score(self) -> float:
+        """Mean squared difference between the probabilities and the outcomes."""
+        self._check_not_empty()
+        return float(self.sum_sq_error / self.n)
+
+    def reliability(self) -> dict:
+        """
+        Return the arrays of a reliability diagram.
+
+        Returns
+        -------
+        dict
+            ``"bin_edges"`` (length ``n_bins + 1``), and per bin
+            ``"mean_score"`` (average predicted probability),
+            ``"fraction_positive"`` (observed frequency) and ``"counts"``.
+            Empty bins have NaN means.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_score = self.sum_score / self.counts
+            fraction_positive = self.n_positive / self.counts
+        return {
+            "bin_edges": np.linspace(0.0, 1.0, self.n_bins + 1),
+            "mean_score": mean_score,
+            "fraction_positive": fraction_positive,
+            "counts": self.counts.copy(),
+        }
+
+    def result(self) -> dict:
+        """
+        Return all calibration metrics as a dictionary.
+
+        Returns
+        -------
+        dict
+            Keys ``"ece"``, ``"mce"`` and ``"brier"``.
+        """
+        return {"ece": self.ece(), "mce": self.mce(), "brier": self.brier_score()}
@@ -0,0 +1,298 @@
+"""
+A module of sparse confusion counts for problems with very many classes.
+
+A dense ``K x K`` confusion matrix needs K**2 cells; with millions of
+classes that is impossible, and calling `get_precision` once per class is
+O(n * K). `SparseConfusion` instead packs every ``(true, pred)`` pair into one
+int64 code, ``true << 32 | pred``, and keeps the sorted distinct codes with
+their counts (``np.unique`` per chunk, merged lazily with a sort and
+``np.add.reduceat``). Memory is proportional to the number of distinct pairs
+observed; per-class TP/FP/FN follow from ``np.bincount(..., minlength=K)``
+over the pairs.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+from reportrabbit.multilabel import _average_scores, _Counts
+
+AVERAGES = ("micro", "macro", "weighted")
+
+# Labels processed per np.unique call, to bound the size of the temporaries
+_CHUNK_SIZE = 1 << 22
+# Class ids must fit in the 31 bits of each half of a non-negative pair code
+_MAX_CLASSES = 1 << 31
+_PRED_BITS = 32
+_PRED_MASK = (1 << _PRED_BITS) - 1
+
+
+def _class_ids(values: Any, name: str) -> np.ndarray:
+    """Validate a 1D array of integer class ids."""
+    labels = np.asarray(values)
+    if labels.ndim != 1:
+        raise ValueError("Inputs must be 1D array-likes.")
+    if labels.shape[0] and labels.dtype.kind not in "biu":
+        raise ValueError(
+            f"{name} must contain integer class ids; encode other labels with LabelEncoder."
+        )
+    return labels
+
+
+def _merge_pairs(parts: list) -> tuple[np.ndarray, np.ndarray]:
+    """Merge ``(codes, counts)`` parts into sorted distinct codes and summed counts."""
+    codes = np.concatenate([part[0] for part in parts])
+    counts = np.concatenate([part[1] for part in parts])
+    if codes.shape[0] == 0:
+        return codes, counts
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    counts = counts[order]
+    starts = np.flatnonzero(np.concatenate([[True], codes[1:] != codes[:-1]]))
+    return codes[starts], np.add.reduceat(counts, starts)
+
+
+class SparseConfusion:
+    """
+    Confusion counts of a multiclass problem, stored as distinct (true, pred) pairs.
+
+    Labels are integer class ids in ``[0, n_classes)``; encode strings or
+    other labels with `LabelEncoder` first. Each class is scored one versus
+    rest: TP are its correct predictions, FP the samples wrongly predicted
+    as it, FN its samples predicted as something else.
+
+    Parameters
+    ----------
+    n_classes : int, optional
+        Number of classes K. When omitted, it is one more than the largest
+        class id seen so far.
+
+    Examples
+    --------
+    >>> from reportrabbit import SparseConfusion
+    >>> confusion = SparseConfusion()
+    >>> confusion.update([0, 1, 2, 2, 2], [0, 2, 2, 1, 2])
+    >>> confusion.f1(average="macro")
+    0.5555555555555555
+    >>> true, pred, counts = confusion.top_confused(1)
+    >>> true.tolist(), pred.tolist(), counts.tolist()
+    ([1], [2], [1])
+    """
+
+    def __init__(self, n_classes: Optional[int] = None) -> None:
+        if n_classes is not None and (
+            isinstance(n_classes, bool)
+            or not isinstance(n_classes, (int, np.integer))
+            or not 0 < n_classes <= _MAX_CLASSES
+        ):
+            raise ValueError(f"n_classes must be a positive integer up to {_MAX_CLASSES}.")
+        self._n_classes = None if n_classes is None else int(n_classes)
+        self._max_class = -1
+        self.n = 0
+        self._codes = np.empty(0, dtype=np.int64)
+        self._counts = np.empty(0, dtype=np.int64)
+        # Per-chunk (codes, counts) not merged into the sorted arrays yet
+        self._pending: list[tuple[np.ndarray, np.ndarray]] = []
+        self._n_pending = 0
+
+    def __repr__(self) -> str:
+        return f"SparseConfusion(n_classes={self.n_classes}, n={self.n})"
+
+    @property
+    def n_classes(self) -> int:
+        """Number of classes K: the given `n_classes`, or the largest id seen plus one."""
+        return self._n_classes if self._n_classes is not None else self._max_class + 1
+
+    @property
+    def n_pairs(self) -> int:
+        """Number of distinct (true, pred) pairs observed."""
+        self._consolidate()
+        return int(self._codes.shape[0])
+
+    def update(self, y_true: Any, y_pred: Any) -> None:
+        """
+        Add a chunk of labels.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,)
+            True class ids of the chunk.
+        y_pred : array-like of shape (n_samples,)
+            Predicted class ids of the chunk.
+
+        Raises
+        ------
+        ValueError
+            If the chunk is empty, the lengths differ, or the labels are not
+            integer class ids in ``[0, n_classes)``.
+        """
+        yt = _class_ids(y_true, "y_true")
+        yp = _class_ids(y_pred, "y_pred")
+        if yt.shape[0] != yp.shape[0]:
+            raise ValueError("Input lengths must match.")
+        if yt.shape[0] == 0:
+            raise ValueError("Input cannot be empty")
+        low = min(int(yt.min()), int(yp.min()))
+        high = max(int(yt.max()), int(yp.max()))
+        limit = self._n_classes if self._n_classes is not None else _MAX_CLASSES
+        if low < 0 or high >= limit:
+            raise ValueError(f"Class ids must be in [0, {limit}).")
+
+        for start in range(0, yt.shape[0], _CHUNK_SIZE):
+            codes = yt[start : start + _CHUNK_SIZE].astype(np.int64) << _PRED_BITS
+            codes |= yp[start : start + _CHUNK_SIZE].astype(np.int64)
+            self._add_pairs(*np.unique(codes, return_counts=True))
+        self._max_class = max(self._max_class, high)
+        self.n += yt.shape[0]
+
+    def merge(self, other: "SparseConfusion") -> "SparseConfusion":
+        """
+        Add the counts of another confusion built on disjoint samples.
+
+        Parameters
+        ----------
+        other : SparseConfusion
+            Confusion counts of another chunk or shard.
+
+        Returns
+        -------
+        SparseConfusion
+            This object, updated in place.
+        """
+        if not isinstance(other, SparseConfusion):
+            raise TypeError("Can only merge another SparseConfusion.")
+        if (
+            self._n_classes is not None
+            and other._n_classes is not None
+            and self._n_classes != other._n_classes
+        ):
+            raise ValueError("Confusions must have the same n_classes.")
+        if self._n_classes is not None and other._max_class >= self._n_classes:
+            raise ValueError(f"Class ids must be in [0, {self._n_classes}).")
+        other._consolidate()
+        self._add_pairs(other._codes, other._counts)
+        self._max_class = max(self._max_class, other._max_class)
+        self.n += other.n
+        return self
+
+    def _add_pairs(self, codes: np.ndarray, counts: np.ndarray) -> None:
+        """Queue counted pairs; merge once the queue outgrows the sorted arrays."""
+        self._pending.append((codes, counts.astype(np.int64, copy=False)))
+        self._n_pending += codes.shape[0]
+        if self._n_pending > max(self._codes.shape[0], _CHUNK_SIZE):
+            self._consolidate()
+
+    def _consolidate(self) -> None:
+        if self._pending:
+            self._codes, self._counts = _merge_pairs(
+                [(self._codes, self._counts), *self._pending]
+            )
+            self._pending = []
+            self._n_pending = 0
+
+    def _check_not_empty(self) -> None:
+        if self.n == 0:
+            raise ValueError("Input cannot be empty")
+
+    def pairs(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return every observed (true, pred) pair with its count.
+
+        Returns
+        -------
+        true, pred : numpy.ndarray of int64, shape (n_pairs,)
+            Class ids of the pairs, sorted by true and then predicted class.
+        counts : numpy.ndarray of int64, shape (n_pairs,)
+            Number of samples of each pair.
+        """
+        self._consolidate()
+        return self._codes >> _PRED_BITS, self._codes & _PRED_MASK, self._counts.copy()
+
+    def class_counts(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the one-versus-rest counts of every class.
+
+        Returns
+        -------
+        tp, fp, fn : numpy.ndarray of int64, shape (n_classes,)
+            True positives, false positives and false negatives per class.
+        """
+        true, pred, counts = self.pairs()
+        weights = counts.astype(np.float64)
+        k = self.n_classes
+        correct = true == pred
+        tp = np.bincount(true[correct], weights=weights[correct], minlength=k).astype(np.int64)
+        n_true = np.bincount(true, weights=weights, minlength=k).astype(np.int64)
+        n_pred = np.bincount(pred, weights=weights, minlength=k).astype(np.int64)
+        return tp, n_pred - tp, n_true - tp
+
+    def _score(self, average: Optional[str], kind: int):
+        if average is not None and average not in AVERAGES:
+            raise ValueError(f"average must be one of {AVERAGES} or None, got {average!r}.")
+        self._check_not_empty()
+        tp, fp, fn = self.class_counts()
+        if average is not None:
+            # Average over the classes that occur in y_true or y_pred
+            seen = (tp + fp + fn) > 0
+            tp, fp, fn = tp[seen], fp[seen], fn[seen]
+        counts = _Counts(tp.shape[0])
+        counts.tp = tp
+        counts.n_pred = tp + fp
+        counts.n_true = tp + fn
+        return _average_scores(counts, average, kind)
+
+    def precision(self, average: Optional[str] = "micro"):
+        """
+        Precision, TP / (TP + FP), per class or averaged.
+
+        Parameters
+        ----------
+        average : {"micro", "macro", "weighted"} or None, default="micro"
+            ``"micro"`` pools the counts of all classes (and equals the
+            accuracy); ``"macro"`` is the unweighted mean over the classes
+            that occur in `y_true` or `y_pred`; ``"weighted"`` weights that
+            mean by support. None returns one score per class id.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            The averaged precision, or an array of shape (n_classes,).
+        """
+        return self._score(average, 0)
+
+    def recall(self, average: Optional[str] = "micro"):
+        """Recall, TP / (TP + FN), per class or averaged as in `precision`."""
+        return self._score(average, 1)
+
+    def f1(self, average: Optional[str] = "micro"):
+        """F1 score, 2 TP / (2 TP + FP + FN), per class or averaged as in `precision`."""
+        return self._score(average, 2)
+
+    def top_confused(self, k: int = 10) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the k most frequent misclassifications.
+
+        Parameters
+        ----------
+        k : int, default=10
+            Number of (true, pred) pairs with ``true != pred`` to return.
+
+        Returns
+        -------
+        true, pred, counts : numpy.ndarray of int64, shape (min(k, n_errors),)
+            The pairs, most frequent first; equal counts are ordered by true
+            and then predicted class.
+        """
+        if isinstance(k, bool) or not isinstance(k, (int, np.integer)) or k < 1:
+            raise ValueError("k must be a positive integer.")
+        true, pred, counts = self.pairs()
+        wrong = np.flatnonzero(true != pred)
+        if wrong.shape[0] > k:
+            # Pairs are sorted by code, so a stable sort keeps ties in that order
+            kth = wrong.shape[0] - k
+            threshold = counts[wrong[np.argpartition(counts[wrong], kth)[kth]]]
+            wrong = wrong[counts[wrong] >= threshold]
+        wrong = wrong[np.argsort(-counts[wrong], kind="stable")][:k]
+        return true[wrong], pred[wrong], counts[wrong]
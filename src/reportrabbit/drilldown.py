@@ -0,0 +1,198 @@
+"""
+A module that finds the rows with the largest errors.
+
+Sorting every residual to find the worst k rows costs O(n log n) time and
+an n-element index array. Instead, each chunk of at most `_CHUNK_SIZE` rows
+is reduced to its own top k with `np.argpartition` (O(chunk)), and those
+candidates are merged into a size-k min-heap, so only O(k) state survives
+between chunks. `WorstErrors` exposes the same merge for chunked or
+streaming evaluation.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any
+
+import numpy as np
+
+from reportrabbit.mse_rmse import _to_1d_numeric_array
+
+KINDS = ("abs", "pct", "squared")
+
+# Number of rows scored at a time, to bound the size of the temporaries
+_CHUNK_SIZE = 1 << 20
+
+
+def _errors(kind: str, y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """Per-row error of the requested kind."""
+    if not (np.all(np.isfinite(y_true)) and np.all(np.isfinite(y_pred))):
+        raise ValueError("Inputs must contain only finite values.")
+    residual = y_true - y_pred
+    if kind == "squared":
+        return np.square(residual, out=residual)
+    if kind == "pct":
+        if np.any(y_true == 0):
+            raise ValueError("Percentage errors are undefined when y_true contains zero values.")
+        residual /= y_true
+    return np.abs(residual, out=residual)
+
+
+class WorstErrors:
+    """
+    Running top-k of the largest per-row errors over chunks of data.
+
+    Rows are numbered in the order they are passed to `update`, starting at
+    0. Equal errors are ranked by row index, lowest first.
+
+    Parameters
+    ----------
+    k : int
+        Number of rows to keep.
+    kind : {"abs", "pct", "squared"}, default="abs"
+        Error of each row: ``|y_true - y_pred|``, ``|(y_true - y_pred) /
+        y_true|`` (as in `get_mape`) or ``(y_true - y_pred) ** 2``.
+
+    Examples
+    --------
+    >>> from reportrabbit import WorstErrors
+    >>> worst = WorstErrors(k=2)
+    >>> worst.update([1.0, 2.0, 3.0], [1.5, 2.0, 0.0])
+    >>> worst.update([4.0, 5.0], [4.0, 9.0])
+    >>> indices, errors = worst.result()
+    >>> indices.tolist(), errors.tolist()
+    ([4, 2], [4.0, 3.0])
+    """
+
+    def __init__(self, k: int, kind: str = "abs") -> None:
+        if isinstance(k, bool) or not isinstance(k, (int, np.integer)) or k < 1:
+            raise ValueError("k must be a positive integer.")
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {KINDS}, got {kind!r}.")
+        self.k = int(k)
+        self.kind = kind
+        self.n = 0
+        # Min-heap of (error, -index): the root is the row that goes first
+        self._heap: list[tuple[float, int]] = []
+
+    def __repr__(self) -> str:
+        return f"WorstErrors(k={self.k}, kind={self.kind!r}, n={self.n})"
+
+    def update(self, y_true: Any, y_pred: Any) -> None:
+        """
+        Add a chunk of rows.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,)
+            True target values of the chunk.
+        y_pred : array-like of shape (n_samples,)
+            Predicted target values of the chunk.
+
+        Raises
+        ------
+        ValueError
+            If the chunk is empty, the lengths differ, values are not finite,
+            or ``kind="pct"`` and `y_true` contains zeros.
+        """
+        yt = _to_1d_numeric_array(y_true, "y_true")
+        yp = _to_1d_numeric_array(y_pred, "y_pred")
+        if yt.shape[0] != yp.shape[0]:
+            raise ValueError("Input lengths must match.")
+        for start in range(0, yt.shape[0], _CHUNK_SIZE):
+            stop = start + _CHUNK_SIZE
+            self._add(_errors(self.kind, yt[start:stop], yp[start:stop]))
+
+    def _add(self, errors: np.ndarray) -> None:
+        """Merge the top k of one chunk of errors into the heap."""
+        offset = self.n
+        self.n += errors.shape[0]
+        if errors.shape[0] > self.k:
+            kth = errors.shape[0] - self.k
+            threshold = errors[np.argpartition(errors, kth)[kth]]
+            # Rows above the k-th largest error, then the lowest-indexed ties
+            above = np.flatnonzero(errors > threshold)
+            ties = np.flatnonzero(errors == threshold)[: self.k - above.shape[0]]
+            candidates = np.concatenate([above, ties])
+        else:
+            candidates = np.arange(errors.shape[0])
+        if len(self._heap) == self.k:
+            # Only rows at least as bad as the current k-th can enter
+            candidates = candidates[errors[candidates] >= self._heap[0][0]]
+
+        heap = self._heap
+        for value, index in zip(errors[candidates].tolist(), (candidates + offset).tolist()):
+            item = (value, -index)
+            if len(heap) < self.k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    def result(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the worst rows seen so far, worst first.
+
+        Returns
+        -------
+        indices : numpy.ndarray of int64, shape (min(k, n),)
+            Row indices.
+        errors : numpy.ndarray of float64, shape (min(k, n),)
+            Their errors, in decreasing order.
+        """
+        ranked = sorted(self._heap, reverse=True)
+        indices = np.array([-index for _, index in ranked], dtype=np.int64)
+        errors = np.array([value for value, _ in ranked], dtype=np.float64)
+        return indices, errors
+
+
+def worst_errors(
+    y_true: Any, y_pred: Any, k: int, kind: str = "abs"
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k rows with the largest errors in O(n) time and O(k) extra memory.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        True target values. A `numpy.memmap` is read chunk by chunk.
+    y_pred : array-like of shape (n_samples,)
+        Predicted target values.
+    k : int
+        Number of rows to return (all rows if there are fewer).
+    kind : {"abs", "pct", "squared"}, default="abs"
+        Error of each row: ``|y_true - y_pred|``, ``|(y_true - y_pred) /
+        y_true|`` (as in `get_mape`) or ``(y_true - y_pred) ** 2``.
+
+    Returns
+    -------
+    indices : numpy.ndarray of int64, shape (min(k, n_samples),)
+        Row indices, worst first; equal errors are ranked by index.
+    errors : numpy.ndarray of float64, shape (min(k, n_samples),)
+        The matching errors, in decreasing order.
+
+    Raises
+    ------
+    ValueError
+        If the inputs are empty or differ in length, values are not finite,
+        `k` or `kind` is invalid, or ``kind="pct"`` and `y_true` contains
+        zeros.
+
+    Examples
+    --------
+    >>> from reportrabbit import worst_errors
+    >>> indices, errors = worst_errors([3.0, -0.5, 2.0, 7.0], [2.5, 0.0, 2.0, 8.0], k=2)
+    >>> indices.tolist(), errors.tolist()
+    ([3, 0], [1.0, 0.5])
+    """
+    worst = WorstErrors(k, kind)
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    if y_true.ndim != 1 or y_pred.ndim != 1:
+        raise ValueError("Inputs must be 1D array-likes.")
+    if y_true.shape[0] != y_pred.shape[0]:
+        raise ValueError("Input lengths must match.")
+    if y_true.shape[0] == 0:
+        raise ValueError("Input arrays cannot be empty.")
+    for start in range(0, y_true.shape[0], _CHUNK_SIZE):
+        worst.update(y_true[start : start + _CHUNK_SIZE], y_pred[start : start + _CHUNK_SIZE])
+    return worst.result()
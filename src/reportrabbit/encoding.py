@@ -0,0 +1,173 @@
+"""
+A module that encodes string and categorical labels as compact integer codes.
+
+Comparing object or unicode label arrays element by element is much slower
+than comparing small integers, and the non-zero-is-positive convention of
+`get_precision` and `get_recall` has no meaning for strings. `LabelEncoder`
+maps labels to integer codes and keeps the vocabulary between calls. Encode
+each label array once and pass the codes to the classification metrics, so
+repeated evaluations compare small integers only.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+
+class LabelEncoder:
+    """
+    Map labels to compact integer codes with a cached vocabulary.
+
+    The vocabulary is stored sorted, so encoding an array is one vectorised
+    binary search per label (no hashing of Python objects and no re-sorting
+    of the data). Labels never seen before are appended to the vocabulary
+    with new codes, so codes already handed out never change.
+
+    Parameters
+    ----------
+    classes : array-like, optional
+        Initial vocabulary. Codes follow the sorted order of the labels,
+        except for `negative_label`.
+    negative_label : object, optional
+        Label that receives code 0. The classification metrics treat code 0
+        as the negative class and every other code as positive, so set it
+        whenever the codes are passed to `get_precision`, `get_recall` or
+        `get_f1`. When omitted, the smallest label of the initial vocabulary
+        gets code 0.
+
+    Attributes
+    ----------
+    classes_ : numpy.ndarray
+        Vocabulary in code order: ``classes_[code]`` is the original label.
+
+    Examples
+    --------
+    >>> from reportrabbit import LabelEncoder, get_precision
+    >>> encoder = LabelEncoder(negative_label="ham")
+    >>> y_true = encoder.transform(["ham", "spam", "spam"])
+    >>> y_true
+    array([0, 1, 1], dtype=uint8)
+    >>> get_precision(y_true, encoder.transform(["spam", "spam", "ham"]))
+    0.5
+    """
+
+    def __init__(self, classes: Optional[Any] = None, *, negative_label: Any = None) -> None:
+        self.negative_label = negative_label
+        self._reset(classes)
+
+    def __repr__(self) -> str:
+        return f"LabelEncoder(n_classes={len(self)}, negative_label={self.negative_label!r})"
+
+    def __len__(self) -> int:
+        return int(self.classes_.shape[0])
+
+    def _reset(self, classes: Optional[Any]) -> None:
+        """Replace the vocabulary with `negative_label` followed by the sorted `classes`."""
+        self.classes_ = np.empty(0)
+        self._sorted = np.empty(0)
+        self._sorter = np.empty(0, dtype=np.intp)
+
+        initial = [] if self.negative_label is None else [self.negative_label]
+        if classes is not None:
+            initial = initial + list(np.unique(np.asarray(classes).reshape(-1)))
+        if initial:
+            self._extend(np.asarray(initial))
+
+    def _extend(self, new_labels: np.ndarray) -> None:
+        """Append labels (in the given order, skipping duplicates) to the vocabulary."""
+        _, first = np.unique(new_labels, return_index=True)
+        new_labels = new_labels[np.sort(first)]
+        if len(self):
+            new_labels = np.concatenate([self.classes_, new_labels])
+        self.classes_ = new_labels
+        self._sorter = np.argsort(self.classes_, kind="stable")
+        self._sorted = self.classes_[self._sorter]
+
+    def _code_dtype(self) -> np.dtype:
+        """Smallest unsigned integer type that can hold every code."""
+        return np.min_scalar_type(max(len(self) - 1, 0))
+
+    def fit(self, labels: Any) -> "LabelEncoder":
+        """
+        Reset the vocabulary to the labels in `labels`.
+
+        Parameters
+        ----------
+        labels : array-like
+            Labels defining the vocabulary.
+
+        Returns
+        -------
+        LabelEncoder
+            This encoder.
+        """
+        self._reset(labels)
+        return self
+
+    def transform(self, labels: Any, *, extend: bool = True) -> np.ndarray:
+        """
+        Encode labels as integer codes.
+
+        Parameters
+        ----------
+        labels : array-like of shape (n_samples,)
+            Labels to encode.
+        extend : bool, default=True
+            Whether unseen labels are added to the vocabulary. When False,
+            unseen labels raise ValueError.
+
+        Returns
+        -------
+        numpy.ndarray of shape (n_samples,)
+            Codes, in the smallest unsigned integer type that fits the vocabulary.
+
+        Raises
+        ------
+        ValueError
+            If `extend` is False and `labels` contains unseen labels.
+        """
+        arr = np.asarray(labels).reshape(-1)
+        if arr.shape[0] == 0:
+            return np.empty(0, dtype=self._code_dtype())
+
+        if len(self) == 0:
+            if not extend:
+                raise ValueError("The encoder has no vocabulary; fit it first.")
+            # First call: np.unique with return_inverse builds the vocabulary and codes at once
+            classes, inverse = np.unique(arr, return_inverse=True)
+            self._extend(classes)
+            return inverse.astype(self._code_dtype())
+
+        found, pos = self._lookup(arr)
+        if not found.all():
+            if not extend:
+                unseen = np.unique(arr[~found])
+                raise ValueError(f"Labels not in the vocabulary: {unseen[:5].tolist()}")
+            self._extend(np.unique(arr[~found]))
+            found, pos = self._lookup(arr)
+        return self._sorter[pos].astype(self._code_dtype())
+
+    def _lookup(self, arr: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Binary-search labels in the sorted vocabulary."""
+        pos = np.searchsorted(self._sorted, arr)
+        np.minimum(pos, len(self) - 1, out=pos)
+        return self._sorted[pos] == arr, pos
+
+    def inverse_transform(self, codes: Any) -> np.ndarray:
+        """
+        Decode integer codes back to the original labels.
+
+        Parameters
+        ----------
+        codes : array-like of int
+            Codes produced by `transform`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The original labels.
+        """
+        return self.classes_[np.asarray(codes, dtype=np.intp)]
+
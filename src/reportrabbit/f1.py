@@ -1,13 +1,19 @@
 import numpy as np
 from reportrabbit.precision import get_precision
 from reportrabbit.recall import get_recall
+from reportrabbit.packed import PackedLabels, _packed_counts
+from reportrabbit._sparse import _positive_index_counts, _uses_positive_indices
+from reportrabbit._iterators import _accumulate, _is_iterator
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {"get_f1": 0.5}
 
 """
 A module that calculates the F1 score (harmonic mean of precision and recall).
 """
 
 
-def get_f1(y_true, y_pred):
+def get_f1(y_true, y_pred, *, n_samples=None):
     """
     Calculates the F1 score of predictions and returns the result.
     The F1 score is the harmonic mean of precision and recall.
@@ -15,13 +21,25 @@ def get_f1(y_true, y_pred):
     you want to balance the trade-off between false positives and false negatives.
     F1 = 2 * ((Precision * Recall) / (Precision + Recall)).
     Scoring is between 0 and 1 with a perfect F1 score being 1.
+
+    `y_true` and `y_pred` may also both be `PackedLabels`, in which case the
+    counts are computed with popcounts on the packed bits.
     
     Parameters
     ----------
-    y_true : array
+    y_true : array or PackedLabels
         The actual observed values (ground truth).
-    y_pred : array
+    y_pred : array or PackedLabels
         The model predicted values.
+    n_samples : int, optional
+        Total number of samples. When given, `y_true` and `y_pred` are read
+        as sorted arrays of the indices of their positive samples instead of
+        dense label arrays. ``scipy.sparse`` label vectors are also accepted
+        (and set `n_samples` from their length); the other input may then
+        be a dense 0/1 label array of the same length or positive indices.
+        Counts then come from a sorted intersection, so the cost scales
+        with the number of positives.
+
     Returns
     -------
     float
@@ -40,18 +58,31 @@ def get_f1(y_true, y_pred):
     >>> get_f1(y_true, y_pred)
     0.6666666666666666
     """
-    y_true = np.asarray(y_true)
-    y_pred = np.asarray(y_pred)
-    
-    if len(y_true) == 0:
-        raise ValueError("Input cannot be empty")
-    
-    if len(y_true) != len(y_pred):
-        raise ValueError("Input arrays must be the same length")
-    
-    # Calculate precision and recall
-    precision = get_precision(y_true, y_pred)
-    recall = get_recall(y_true, y_pred)
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        return _accumulate("classification", y_true, y_pred, n_samples=n_samples).f1()
+
+    if isinstance(y_true, PackedLabels) or isinstance(y_pred, PackedLabels):
+        _, _, tp, fp, fn, _ = _packed_counts(y_true, y_pred)
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+    elif _uses_positive_indices(y_true, y_pred, n_samples):
+        # One sorted intersection gives both precision and recall
+        tp, n_pred_positive, n_true_positive = _positive_index_counts(y_true, y_pred, n_samples)
+        precision = tp / n_pred_positive if n_pred_positive else 0.0
+        recall = tp / n_true_positive if n_true_positive else 0.0
+    else:
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+
+        if len(y_true) == 0:
+            raise ValueError("Input cannot be empty")
+
+        if len(y_true) != len(y_pred):
+            raise ValueError("Input arrays must be the same length")
+
+        # Calculate precision and recall
+        precision = get_precision(y_true, y_pred)
+        recall = get_recall(y_true, y_pred)
     
     # If both are 0, F1 is 0
     if precision + recall == 0:
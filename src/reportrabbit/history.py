@@ -0,0 +1,409 @@
+"""
+A module that stores metric results over time for many models.
+
+`MetricHistory` keeps one fixed-width record per ``(model, timestamp)``
+(the timestamp, a model code and one float64 per metric) in a directory of
+preallocated segment files that are memory-mapped with `numpy.memmap`.
+Appending writes one record into the active segment, so it costs the same
+however long the history is. Unwritten slots carry a reserved model code,
+so the fill level of the active segment is recovered when a store is
+reopened.
+
+When a segment is full it is sealed: its rows are sorted by model and
+timestamp once and the order is saved next to it as an index, and its
+time range is recorded in the manifest. A range read skips the segments
+outside the range, finds the rows of a model with binary searches in the
+index, and gathers only those records, returning one NumPy array per
+metric. The small active segment is scanned with vectorised masks.
+
+Files in the store directory:
+
+- ``history.json``: format version, metric names, segment size and the
+  time range of every sealed segment (replaced atomically).
+- ``models.txt``: model ids, one per line; the line number is the code.
+- ``segment-NNNNNN.bin``: records; ``segment-NNNNNN.idx``: the index of a
+  sealed segment, three int64 rows (model code, timestamp, record).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+HISTORY_VERSION = 1
+
+_MANIFEST = "history.json"
+_MODELS = "models.txt"
+# Records per segment file; about 2 hours of 2,000 models scored every minute
+_SEGMENT_RECORDS = 1 << 18
+# Model code of the slots of a segment that have not been written yet
+_EMPTY = np.iinfo(np.uint32).max
+# Sealed segments kept mapped between reads
+_OPEN_SEGMENTS = 256
+
+
+def _record_dtype(metrics: Sequence[str]) -> np.dtype:
+    return np.dtype(
+        [("timestamp", "<i8"), ("model", "<u4")] + [(name, "<f8") for name in metrics]
+    )
+
+
+def _to_timestamp(value: Any) -> int:
+    """Integer timestamp; ``numpy.datetime64`` values become Unix seconds."""
+    if isinstance(value, np.datetime64):
+        return int(value.astype("datetime64[s]").astype(np.int64))
+    if isinstance(value, bool) or not isinstance(value, (int, np.integer)):
+        raise ValueError(f"timestamp must be an integer or numpy.datetime64, got {value!r}.")
+    return int(value)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write `data` to a temporary file and move it into place."""
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class MetricHistory:
+    """
+    Append-only, columnar store of metric results per model and timestamp.
+
+    Each `append` writes one fixed-width record; `read` returns the records
+    of a model (or of all models) in a time range as one array per metric.
+    A store is meant to be opened by one process at a time.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Store directory. It is created if it does not exist.
+    metrics : sequence of str, optional
+        Metric names recorded, e.g. ``("mse", "rmse", "f1")``. Required to
+        create a store; when opening an existing one it must be omitted or
+        equal to the stored names.
+    segment_records : int, default=262144
+        Records per segment file, for a new store.
+
+    Raises
+    ------
+    ValueError
+        If `metrics` is missing or invalid for a new store, does not match
+        an existing store, or the store has an unsupported format version.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from reportrabbit import MetricHistory
+    >>> history = MetricHistory(tempfile.mkdtemp(), metrics=["mse", "rmse"])
+    >>> for minute in range(3):
+    ...     history.append("model-a", 60 * minute, {"mse": 4.0 + minute, "rmse": 2.0})
+    >>> history.append("model-b", 0, {"mse": 1.0})
+    >>> trend = history.read("model-a", start=60)
+    >>> trend["timestamp"].tolist(), trend["mse"].tolist()
+    ([60, 120], [5.0, 6.0])
+    >>> float(history.read("model-b")["rmse"][0])
+    nan
+    >>> history.close()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        metrics: Optional[Sequence[str]] = None,
+        *,
+        segment_records: int = _SEGMENT_RECORDS,
+    ) -> None:
+        self.path = os.fspath(path)
+        manifest_path = os.path.join(self.path, _MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "rb") as f:
+                manifest = json.loads(f.read())
+            if manifest.get("version") != HISTORY_VERSION:
+                raise ValueError(
+                    f"Unsupported history version {manifest.get('version')}; "
+                    f"expected {HISTORY_VERSION}."
+                )
+            if metrics is not None and tuple(metrics) != tuple(manifest["metrics"]):
+                raise ValueError(
+                    f"metrics {tuple(metrics)} do not match the stored metrics "
+                    f"{tuple(manifest['metrics'])}."
+                )
+            self.metrics = tuple(manifest["metrics"])
+            self.segment_records = int(manifest["segment_records"])
+            self._bounds = [tuple(bounds) for bounds in manifest["segments"]]
+        else:
+            if metrics is None:
+                raise ValueError("metrics are required to create a new history.")
+            self.metrics = tuple(metrics)
+            if not self.metrics or len(set(self.metrics)) != len(self.metrics):
+                raise ValueError("metrics must be a non-empty sequence of distinct names.")
+            if any(name in ("timestamp", "model") for name in self.metrics):
+                raise ValueError('"timestamp" and "model" cannot be metric names.')
+            if (
+                isinstance(segment_records, bool)
+                or not isinstance(segment_records, int)
+                or segment_records < 1
+            ):
+                raise ValueError("segment_records must be a positive integer.")
+            self.segment_records = segment_records
+            self._bounds = []
+            os.makedirs(self.path, exist_ok=True)
+            self._write_manifest()
+
+        self._dtype = _record_dtype(self.metrics)
+        models_path = os.path.join(self.path, _MODELS)
+        if os.path.exists(models_path):
+            with open(models_path, encoding="utf-8") as f:
+                self._models = f.read().split("\n")[:-1]
+        else:
+            self._models = []
+        self._codes = {model: code for code, model in enumerate(self._models)}
+        self._models_file = open(models_path, "a", encoding="utf-8")
+        self._cache: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+        # Seal full segments left behind by an interrupted writer
+        self._active: Optional[np.memmap] = None
+        self._n_active = 0
+        i = len(self._bounds)
+        while os.path.exists(self._segment_path(i, "bin")):
+            data = np.memmap(self._segment_path(i, "bin"), dtype=self._dtype, mode="r+")
+            n = self._filled(data)
+            if n < self.segment_records:
+                if os.path.exists(self._segment_path(i + 1, "bin")):
+                    raise ValueError(f"Segment {i} of {self.path!r} is incomplete.")
+                self._active, self._n_active = data, n
+                break
+            self._seal(data)
+            i += 1
+
+    def __repr__(self) -> str:
+        return f"MetricHistory({self.path!r}, metrics={list(self.metrics)}, n={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._bounds) * self.segment_records + self._n_active
+
+    def __enter__(self) -> "MetricHistory":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def models(self) -> tuple:
+        """Model ids in the order they were first appended."""
+        return tuple(self._models)
+
+    def _segment_path(self, i: int, suffix: str) -> str:
+        return os.path.join(self.path, f"segment-{i:06d}.{suffix}")
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "version": HISTORY_VERSION,
+            "metrics": list(self.metrics),
+            "segment_records": self.segment_records,
+            "segments": [list(bounds) for bounds in self._bounds],
+        }
+        _write_atomic(os.path.join(self.path, _MANIFEST), json.dumps(manifest).encode())
+
+    @staticmethod
+    def _filled(data: np.ndarray) -> int:
+        """Number of written records; segments are filled in order."""
+        empty = data["model"] == _EMPTY
+        return int(np.argmax(empty)) if empty.any() else data.shape[0]
+
+    def _seal(self, data: np.ndarray) -> None:
+        """Index a full segment by model and timestamp and record its time range."""
+        i = len(self._bounds)
+        models = data["model"].astype(np.int64)
+        timestamps = data["timestamp"].astype(np.int64)
+        order = np.lexsort((timestamps, models))
+        index = np.stack([models[order], timestamps[order], order])
+        data.flush()
+        tmp_path = f"{self._segment_path(i, 'idx')}.tmp-{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            np.save(f, index)
+        os.replace(tmp_path, self._segment_path(i, "idx"))
+        self._bounds.append((int(timestamps.min()), int(timestamps.max())))
+        self._write_manifest()
+
+    def _new_segment(self) -> None:
+        data = np.memmap(
+            self._segment_path(len(self._bounds), "bin"),
+            dtype=self._dtype,
+            mode="w+",
+            shape=(self.segment_records,),
+        )
+        data["model"] = _EMPTY
+        self._active, self._n_active = data, 0
+
+    def _code(self, model: str) -> int:
+        code = self._codes.get(model)
+        if code is None:
+            if not isinstance(model, str) or "\n" in model:
+                raise ValueError(f"model must be a string without newlines, got {model!r}.")
+            code = len(self._models)
+            self._models_file.write(model + "\n")
+            self._models_file.flush()
+            self._models.append(model)
+            self._codes[model] = code
+        return code
+
+    def append(self, model: str, timestamp: Any, results: Mapping[str, Any]) -> None:
+        """
+        Record the metric results of a model at a timestamp.
+
+        Parameters
+        ----------
+        model : str
+            Model id.
+        timestamp : int or numpy.datetime64
+            Time of the evaluation, as an integer in any unit (e.g. Unix
+            seconds); ``numpy.datetime64`` values are stored as Unix seconds.
+        results : mapping of str to float
+            Metric values, e.g. the dict returned by `get_mse_rmse`. Metrics
+            of the store missing from `results` are stored as NaN.
+
+        Raises
+        ------
+        ValueError
+            If `results` has a metric the store does not record or a value
+            that is not a number, the timestamp or model id is invalid, or
+            the store is closed.
+        """
+        if self._models_file.closed:
+            raise ValueError("Cannot append to a closed MetricHistory.")
+        values = dict.fromkeys(self.metrics, np.nan)
+        for name, value in results.items():
+            if name not in values:
+                raise ValueError(f"Unknown metric {name!r}; this history records {self.metrics}.")
+            try:
+                values[name] = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Metric {name!r} must be a number, got {value!r}.") from None
+        timestamp = _to_timestamp(timestamp)
+        code = self._code(model)
+
+        if self._active is None:
+            self._new_segment()
+        self._active[self._n_active] = (timestamp, code, *values.values())
+        self._n_active += 1
+        if self._n_active == self.segment_records:
+            self._seal(self._active)
+            self._active, self._n_active = None, 0
+
+    def _sealed(self, i: int) -> tuple[np.ndarray, np.ndarray]:
+        """Memory-mapped records and index of sealed segment `i`."""
+        if i not in self._cache:
+            if len(self._cache) >= _OPEN_SEGMENTS:
+                del self._cache[next(iter(self._cache))]
+            self._cache[i] = (
+                np.memmap(self._segment_path(i, "bin"), dtype=self._dtype, mode="r"),
+                np.load(self._segment_path(i, "idx"), mmap_mode="r"),
+            )
+        return self._cache[i]
+
+    def read(
+        self,
+        model: Optional[str] = None,
+        start: Any = None,
+        stop: Any = None,
+        *,
+        metrics: Optional[Sequence[str]] = None,
+    ) -> dict:
+        """
+        Return the records in a time range as one array per column.
+
+        Parameters
+        ----------
+        model : str, optional
+            Model id. By default the records of all models are returned.
+        start : int or numpy.datetime64, optional
+            First timestamp included. Unbounded by default.
+        stop : int or numpy.datetime64, optional
+            Timestamps from `stop` on are excluded. Unbounded by default.
+        metrics : sequence of str, optional
+            Metrics to return. Defaults to all metrics of the store.
+
+        Returns
+        -------
+        dict
+            ``"timestamp"``: int64 array of the record times, sorted
+            (records with the same time stay in append order). ``"model"``:
+            the model id of each record, only when `model` is None. One
+            float64 array per metric.
+
+        Raises
+        ------
+        ValueError
+            If `model` was never appended or a metric is not recorded.
+        """
+        metrics = self.metrics if metrics is None else tuple(metrics)
+        for name in metrics:
+            if name not in self.metrics:
+                raise ValueError(f"Unknown metric {name!r}; this history records {self.metrics}.")
+        if model is not None and model not in self._codes:
+            raise ValueError(f"Unknown model {model!r}.")
+        code = None if model is None else self._codes[model]
+        start = None if start is None else _to_timestamp(start)
+        stop = None if stop is None else _to_timestamp(stop)
+
+        parts = []
+        for i, (t_min, t_max) in enumerate(self._bounds):
+            if (start is not None and t_max < start) or (stop is not None and t_min >= stop):
+                continue
+            data, index = self._sealed(i)
+            if code is None:
+                parts.append(data[self._in_range(data["timestamp"], start, stop)])
+                continue
+            lo, hi = np.searchsorted(index[0], [code, code + 1])
+            timestamps = index[1, lo:hi]
+            first = 0 if start is None else np.searchsorted(timestamps, start)
+            last = timestamps.shape[0] if stop is None else np.searchsorted(timestamps, stop)
+            parts.append(data[index[2, lo + first : lo + last]])
+        if self._n_active:
+            data = self._active[: self._n_active]
+            mask = self._in_range(data["timestamp"], start, stop)
+            if code is not None:
+                mask &= data["model"] == code
+            parts.append(data[mask])
+
+        records = np.concatenate(parts) if parts else np.empty(0, dtype=self._dtype)
+        records = records[np.argsort(records["timestamp"], kind="stable")]
+        out = {"timestamp": records["timestamp"].astype(np.int64)}
+        if code is None:
+            out["model"] = np.array(self._models, dtype=object)[records["model"]]
+        for name in metrics:
+            out[name] = records[name].astype(np.float64)
+        return out
+
+    @staticmethod
+    def _in_range(timestamps: np.ndarray, start: Optional[int], stop: Optional[int]):
+        mask = np.ones(timestamps.shape[0], dtype=bool)
+        if start is not None:
+            mask &= timestamps >= start
+        if stop is not None:
+            mask &= timestamps < stop
+        return mask
+
+    def flush(self) -> None:
+        """Write the active segment and the model ids through to disk."""
+        if self._active is not None:
+            self._active.flush()
+        self._models_file.flush()
+        os.fsync(self._models_file.fileno())
+
+    def close(self) -> None:
+        """Flush and release the files of the store."""
+        if self._models_file.closed:
+            return
+        self.flush()
+        self._models_file.close()
+        self._cache.clear()
@@ -5,7 +5,19 @@ Note: these tests are written with the assistance of LLMs.
 """
 import numpy as np
 
-def get_mae(y_true, y_pred):
+from reportrabbit._multioutput import _aggregate_outputs, _to_2d_numeric_arrays
+from reportrabbit.budget import _block_length, _blocked_sum
+from reportrabbit._iterators import _accumulate, _is_iterator
+from reportrabbit._small import _small_mae
+
+# Peak temporaries per element: both coerced inputs, the residual and its absolute value
+_TEMP_BYTES_PER_ELEMENT = 32
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {"get_mae": 1.25}
+
+
+def get_mae(y_true, y_pred, *, workspace=None, multioutput=None):
     """
     Calculates the Mean Absolute Error (MAE) and returns the result.
     
@@ -18,12 +30,29 @@ def get_mae(y_true, y_pred):
         The actual observed values (ground truth).
     y_pred : array
         The model predicted values.
+    workspace : MetricWorkspace, optional
+        Preallocated scratch buffers. When given, the computation is done
+        in the workspace dtype with ``out=`` ufunc calls, so repeated calls
+        on batches that fit in the workspace do not allocate temporaries.
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}, optional
+        How to score ``(n_samples, n_outputs)`` inputs. When given, each
+        column is scored separately with one reduction along axis 0;
+        ``"raw_values"`` returns the per-output scores as an array, the
+        other options average them (``"variance_weighted"`` weights each
+        output by the variance of its `y_true` column). By default all
+        values are pooled into a single score.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The calculated Mean Absolute Error.
 
+    Notes
+    -----
+    Short lists and tuples of Python numbers are scored in pure Python,
+    which avoids the NumPy call overhead. The result is bit-identical to
+    the vectorized path, whose pairwise summation order it reproduces.
+
     Examples
     --------
     >>> y_true = [1.0, 2.0, 3.0]
@@ -31,9 +60,33 @@ def get_mae(y_true, y_pred):
     >>> get_mae(y_true, y_pred)
     0.6666666666666666
     """
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        return _accumulate(
+            "regression", y_true, y_pred, workspace=workspace, multioutput=multioutput
+        ).mae()
+
+    if multioutput is not None:
+        if workspace is not None:
+            raise ValueError("workspace cannot be combined with multioutput.")
+        return _get_mae_multioutput(y_true, y_pred, multioutput)
+
+    if workspace is None:
+        # Tiny lists skip the NumPy dispatch overhead; same summation order
+        small = _small_mae(y_true, y_pred)
+        if small is not None:
+            return small
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        if y_true.shape == y_pred.shape and y_true.size:
+            block = _block_length(y_true.size, _TEMP_BYTES_PER_ELEMENT)
+            if block is not None:
+                return _get_mae_blocked(y_true.reshape(-1), y_pred.reshape(-1), block)
+
+    dtype = np.float64 if workspace is None else workspace.dtype
+
     # Convert inputs to numeric arrays (reject strings/objects)
-    y_true = np.asarray(y_true, dtype=np.float64)
-    y_pred = np.asarray(y_pred, dtype=np.float64)
+    y_true = np.asarray(y_true, dtype=dtype)
+    y_pred = np.asarray(y_pred, dtype=dtype)
 
     # Prevent broadcasting
     if y_true.shape != y_pred.shape:
@@ -43,8 +96,77 @@ def get_mae(y_true, y_pred):
     if y_true.size == 0:
         raise ValueError("Input arrays cannot be empty.")
 
+    if workspace is not None:
+        y_true = y_true.reshape(-1)
+        y_pred = y_pred.reshape(-1)
+        residual = workspace._views(y_true.shape[0])[0]
+
+        if not workspace._all_finite(y_true) or not workspace._all_finite(y_pred):
+            raise ValueError("Inputs must contain only finite values.")
+
+        np.subtract(y_true, y_pred, out=residual)
+        np.abs(residual, out=residual)
+        return float(np.mean(residual))
+
     # Reject NaN / Inf
     if not np.all(np.isfinite(y_true)) or not np.all(np.isfinite(y_pred)):
         raise ValueError("Inputs must contain only finite values.")
 
     return float(np.mean(np.abs(y_true - y_pred)))
+
+
+def _get_mae_blocked(y_true, y_pred, block):
+    """
+    Calculates the MAE block by block under a `MemoryBudget`.
+
+    Gives exactly the same result as the unblocked path, but only coerces
+    and builds temporaries for `block` elements at a time.
+
+    Parameters
+    ----------
+    y_true : numpy.ndarray
+        The actual observed values, flattened.
+    y_pred : numpy.ndarray
+        The model predicted values, flattened.
+    block : int
+        Number of elements per block.
+
+    Returns
+    -------
+    float
+        The calculated Mean Absolute Error.
+    """
+    finite = [True]
+
+    def terms(start, stop):
+        yt = np.asarray(y_true[start:stop], dtype=np.float64)
+        yp = np.asarray(y_pred[start:stop], dtype=np.float64)
+        finite[0] &= bool(np.all(np.isfinite(yt)) and np.all(np.isfinite(yp)))
+        return np.abs(yt - yp)
+
+    total = _blocked_sum(terms, y_true.shape[0], block)
+    if not finite[0]:
+        raise ValueError("Inputs must contain only finite values.")
+    return float(total / y_true.shape[0])
+
+
+def _get_mae_multioutput(y_true, y_pred, multioutput):
+    """
+    Calculates the MAE of each output column and aggregates the result.
+
+    Parameters
+    ----------
+    y_true : array
+        The actual observed values, of shape (n_samples, n_outputs).
+    y_pred : array
+        The model predicted values, of shape (n_samples, n_outputs).
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}
+        Aggregation of the per-output scores.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The aggregated MAE, or one MAE per output for ``"raw_values"``.
+    """
+    yt, yp = _to_2d_numeric_arrays(y_true, y_pred, multioutput)
+    return _aggregate_outputs(np.mean(np.abs(yt - yp), axis=0), multioutput, yt)
@@ -5,7 +5,19 @@ Note: these tests are written with the assistance of LLMs.
 """
 import numpy as np
 
-def get_mape(y_true, y_pred):
+from reportrabbit._multioutput import _aggregate_outputs, _to_2d_numeric_arrays
+from reportrabbit.budget import _block_length, _blocked_sum
+from reportrabbit._iterators import _accumulate, _is_iterator
+
+# Peak temporaries per element: both coerced inputs, the residual, the ratio and its
+# absolute value
+_TEMP_BYTES_PER_ELEMENT = 40
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {"get_mape": 1.25}
+
+
+def get_mape(y_true, y_pred, *, workspace=None, multioutput=None):
     """
     Calculates the Mean Absolute Percentage Error (MAPE) and returns the result.
 
@@ -20,10 +32,21 @@ def get_mape(y_true, y_pred):
         The actual observed values (ground truth).
     y_pred : array
         The model predicted values.
+    workspace : MetricWorkspace, optional
+        Preallocated scratch buffers. When given, the computation is done
+        in the workspace dtype with ``out=`` ufunc calls, so repeated calls
+        on batches that fit in the workspace do not allocate temporaries.
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}, optional
+        How to score ``(n_samples, n_outputs)`` inputs. When given, each
+        column is scored separately with one reduction along axis 0;
+        ``"raw_values"`` returns the per-output scores as an array, the
+        other options average them (``"variance_weighted"`` weights each
+        output by the variance of its `y_true` column). By default all
+        values are pooled into a single score.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The calculated Mean Absolute Percentage Error (in percentage).
 
     Examples
@@ -33,9 +56,29 @@ def get_mape(y_true, y_pred):
     >>> get_mape(y_true, y_pred)
     8.333333333333332
     """
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        return _accumulate(
+            "regression", y_true, y_pred, workspace=workspace, multioutput=multioutput
+        ).mape()
+
+    if multioutput is not None:
+        if workspace is not None:
+            raise ValueError("workspace cannot be combined with multioutput.")
+        return _get_mape_multioutput(y_true, y_pred, multioutput)
+
+    if workspace is None:
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        if y_true.shape == y_pred.shape and y_true.size:
+            block = _block_length(y_true.size, _TEMP_BYTES_PER_ELEMENT)
+            if block is not None:
+                return _get_mape_blocked(y_true.reshape(-1), y_pred.reshape(-1), block)
+
+    dtype = np.float64 if workspace is None else workspace.dtype
+
     # Convert inputs to numeric arrays (reject strings/objects)
-    y_true = np.asarray(y_true, dtype=np.float64)
-    y_pred = np.asarray(y_pred, dtype=np.float64)
+    y_true = np.asarray(y_true, dtype=dtype)
+    y_pred = np.asarray(y_pred, dtype=dtype)
 
     # Prevent broadcasting
     if y_true.shape != y_pred.shape:
@@ -45,6 +88,22 @@ def get_mape(y_true, y_pred):
     if y_true.size == 0:
         raise ValueError("Input arrays cannot be empty.")
 
+    if workspace is not None:
+        y_true = y_true.reshape(-1)
+        y_pred = y_pred.reshape(-1)
+        residual, mask = workspace._views(y_true.shape[0])
+
+        if not workspace._all_finite(y_true) or not workspace._all_finite(y_pred):
+            raise ValueError("Inputs must contain only finite values.")
+
+        if np.equal(y_true, 0, out=mask).any():
+            raise ValueError("MAPE is undefined when y_true contains zero values.")
+
+        np.subtract(y_true, y_pred, out=residual)
+        np.divide(residual, y_true, out=residual)
+        np.abs(residual, out=residual)
+        return float(np.mean(residual))
+
     # Reject NaN / Inf
     if not np.all(np.isfinite(y_true)) or not np.all(np.isfinite(y_pred)):
         raise ValueError("Inputs must contain only finite values.")
@@ -54,3 +113,68 @@ def get_mape(y_true, y_pred):
         raise ValueError("MAPE is undefined when y_true contains zero values.")
 
     return float(np.mean(np.abs((y_true - y_pred) / y_true)))
+
+
+def _get_mape_blocked(y_true, y_pred, block):
+    """
+    Calculates the MAPE block by block under a `MemoryBudget`.
+
+    Gives exactly the same result (and the same errors) as the unblocked
+    path, but only coerces and builds temporaries for `block` elements at a
+    time.
+
+    Parameters
+    ----------
+    y_true : numpy.ndarray
+        The actual observed values, flattened.
+    y_pred : numpy.ndarray
+        The model predicted values, flattened.
+    block : int
+        Number of elements per block.
+
+    Returns
+    -------
+    float
+        The calculated Mean Absolute Percentage Error.
+    """
+    finite, nonzero = [True], [True]
+
+    def terms(start, stop):
+        yt = np.asarray(y_true[start:stop], dtype=np.float64)
+        yp = np.asarray(y_pred[start:stop], dtype=np.float64)
+        finite[0] &= bool(np.all(np.isfinite(yt)) and np.all(np.isfinite(yp)))
+        nonzero[0] &= bool(np.all(yt != 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.abs((yt - yp) / yt)
+
+    total = _blocked_sum(terms, y_true.shape[0], block)
+    # Raise in the same order as the unblocked checks
+    if not finite[0]:
+        raise ValueError("Inputs must contain only finite values.")
+    if not nonzero[0]:
+        raise ValueError("MAPE is undefined when y_true contains zero values.")
+    return float(total / y_true.shape[0])
+
+
+def _get_mape_multioutput(y_true, y_pred, multioutput):
+    """
+    Calculates the MAPE of each output column and aggregates the result.
+
+    Parameters
+    ----------
+    y_true : array
+        The actual observed values, of shape (n_samples, n_outputs).
+    y_pred : array
+        The model predicted values, of shape (n_samples, n_outputs).
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}
+        Aggregation of the per-output scores.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The aggregated MAPE, or one MAPE per output for ``"raw_values"``.
+    """
+    yt, yp = _to_2d_numeric_arrays(y_true, y_pred, multioutput)
+    if np.any(yt == 0):
+        raise ValueError("MAPE is undefined when y_true contains zero values.")
+    return _aggregate_outputs(np.mean(np.abs((yt - yp) / yt), axis=0), multioutput, yt)
@@ -9,13 +9,30 @@ from __future__ import annotations
 from typing import Any, Optional
 import numpy as np
 
+from reportrabbit._multioutput import _aggregate_outputs, _to_2d_numeric_arrays
+from reportrabbit.budget import _block_length, _blocked_sum, get_memory_budget
+from reportrabbit.workspace import MetricWorkspace
+from reportrabbit._iterators import _accumulate, _is_iterator
+
+# Peak temporaries per element: both coerced inputs, the residual and its square,
+# plus the coerced weight and the weighted error when sample_weight is given
+_TEMP_BYTES_PER_ELEMENT = 32
+_WEIGHTED_TEMP_BYTES_PER_ELEMENT = 48
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {
+    "get_mse": 0.75,
+    "get_rmse": 0.75,
+    "get_mse_rmse": 0.75,
+}
+
 
 # --------------------------------------------------------------
 # Helper functions to compute MSE and RMSE
 # --------------------------------------------------------------
 
 
-def _to_1d_numeric_array(x: Any, name: str) -> np.ndarray:
+def _to_1d_numeric_array(x: Any, name: str, dtype: Any = float) -> np.ndarray:
     """
     Convert input to a 1D NumPy float array.
 
@@ -25,6 +42,8 @@ def _to_1d_numeric_array(x: Any, name: str) -> np.ndarray:
         Input values.
     name : str
         Parameter name used for error messages.
+    dtype : data-type, optional
+        Floating point type of the returned array. Defaults to float64.
 
     Returns
     -------
@@ -37,7 +56,7 @@ def _to_1d_numeric_array(x: Any, name: str) -> np.ndarray:
         If `x` is empty or cannot be converted to a 1D numeric array.
     """
     try:
-        arr = np.asarray(x, dtype=float)
+        arr = np.asarray(x, dtype=dtype)
     except (TypeError, ValueError) as e:
         raise ValueError(f"{name} must contain only numeric values.") from e
 
@@ -55,6 +74,7 @@ def _validate_inputs(
     y_true: Any,
     y_pred: Any,
     sample_weight: Optional[Any] = None,
+    dtype: Any = float,
 ) -> tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
     """
     Validate and coerce inputs for MSE/RMSE computations.
@@ -67,6 +87,8 @@ def _validate_inputs(
         Predicted target values.
     sample_weight : array-like of shape (n_samples,), optional
         Sample weights.
+    dtype : data-type, optional
+        Floating point type of the returned arrays. Defaults to float64.
 
     Returns
     -------
@@ -82,15 +104,15 @@ def _validate_inputs(
     ValueError
         If shapes are incompatible, inputs are empty, or weights are invalid.
     """
-    yt = _to_1d_numeric_array(y_true, "y_true")
-    yp = _to_1d_numeric_array(y_pred, "y_pred")
+    yt = _to_1d_numeric_array(y_true, "y_true", dtype)
+    yp = _to_1d_numeric_array(y_pred, "y_pred", dtype)
 
     if yt.shape[0] != yp.shape[0]:
         raise ValueError("Input lengths must match.")
 
     sw = None
     if sample_weight is not None:
-        sw = _to_1d_numeric_array(sample_weight, "sample_weight")
+        sw = _to_1d_numeric_array(sample_weight, "sample_weight", dtype)
         if sw.shape[0] != yt.shape[0]:
             raise ValueError(
                 "sample_weight must have the same length as y_true and y_pred."
@@ -99,7 +121,14 @@ def _validate_inputs(
     return yt, yp, sw
 
 
-def get_mse(y_true: Any, y_pred: Any, *, sample_weight: Optional[Any] = None) -> float:
+def get_mse(
+    y_true: Any,
+    y_pred: Any,
+    *,
+    sample_weight: Optional[Any] = None,
+    workspace: Optional[MetricWorkspace] = None,
+    multioutput: Optional[str] = None,
+) -> float:
     """
     Compute Mean Squared Error (MSE).
 
@@ -114,11 +143,44 @@ def get_mse(y_true: Any, y_pred: Any, *, sample_weight: Optional[Any] = None) ->
     sample_weight : array-like of shape (n_samples,), optional
         Sample weights.
 
+    workspace : MetricWorkspace, optional
+        Preallocated scratch buffers. When given, squared errors are written
+        into the workspace with ``out=`` ufunc calls instead of new arrays.
+
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}, optional
+        How to score ``(n_samples, n_outputs)`` inputs. When given, each
+        column is scored separately with one reduction along axis 0;
+        ``"raw_values"`` returns the per-output scores as an array, the
+        other options average them (``"variance_weighted"`` weights each
+        output by the variance of its `y_true` column). By default all
+        values are pooled into a single score.
+
     Returns
     -------
-    mse : float
-        Mean Squared Error.
+    mse : float or numpy.ndarray
+        Mean Squared Error (one per output for ``multioutput="raw_values"``).
     """
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        return _accumulate(
+            "regression",
+            y_true,
+            y_pred,
+            sample_weight=sample_weight,
+            workspace=workspace,
+            multioutput=multioutput,
+        ).mse()
+
+    if multioutput is not None:
+        yt, mse = _get_mse_multioutput(y_true, y_pred, sample_weight, workspace, multioutput)
+        return _aggregate_outputs(mse, multioutput, yt)
+
+    if workspace is not None:
+        return _get_mse_workspace(y_true, y_pred, sample_weight, workspace)
+
+    mse = _get_mse_blocked(y_true, y_pred, sample_weight)
+    if mse is not None:
+        return mse
+
     yt, yp, sw = _validate_inputs(y_true, y_pred, sample_weight)
 
     errors = (yt - yp) ** 2
@@ -128,7 +190,162 @@ def get_mse(y_true: Any, y_pred: Any, *, sample_weight: Optional[Any] = None) ->
     return float(np.average(errors, weights=sw))
 
 
-def get_rmse(y_true, y_pred, *, sample_weight=None):
+def _get_mse_multioutput(
+    y_true: Any,
+    y_pred: Any,
+    sample_weight: Optional[Any],
+    workspace: Optional[MetricWorkspace],
+    multioutput: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the MSE of every output column with one reduction along axis 0.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples, n_outputs)
+        True target values.
+    y_pred : array-like of shape (n_samples, n_outputs)
+        Predicted target values.
+    sample_weight : array-like of shape (n_samples,) or None
+        Sample weights shared by all outputs.
+    workspace : MetricWorkspace or None
+        Must be None; workspaces only hold 1D buffers.
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}
+        Aggregation option, validated before any work is done.
+
+    Returns
+    -------
+    yt : numpy.ndarray of shape (n_samples, n_outputs)
+        Coerced y_true, needed for variance weighting.
+    mse : numpy.ndarray of shape (n_outputs,)
+        Mean Squared Error of each output.
+    """
+    if workspace is not None:
+        raise ValueError("workspace cannot be combined with multioutput.")
+
+    yt, yp = _to_2d_numeric_arrays(y_true, y_pred, multioutput)
+    errors = (yt - yp) ** 2
+    if sample_weight is None:
+        return yt, np.mean(errors, axis=0)
+
+    sw = _to_1d_numeric_array(sample_weight, "sample_weight")
+    if sw.shape[0] != yt.shape[0]:
+        raise ValueError("sample_weight must have the same length as y_true and y_pred.")
+    return yt, np.average(errors, axis=0, weights=sw)
+
+
+def _get_mse_workspace(
+    y_true: Any,
+    y_pred: Any,
+    sample_weight: Optional[Any],
+    workspace: MetricWorkspace,
+) -> float:
+    """
+    Compute MSE into the buffers of a `MetricWorkspace`.
+
+    Gives the same result as the allocating path of `get_mse`, but writes the
+    squared errors into the workspace residual buffer.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        True target values.
+    y_pred : array-like of shape (n_samples,)
+        Predicted target values.
+    sample_weight : array-like of shape (n_samples,) or None
+        Sample weights.
+    workspace : MetricWorkspace
+        Preallocated scratch buffers.
+
+    Returns
+    -------
+    mse : float
+        Mean Squared Error.
+    """
+    yt, yp, sw = _validate_inputs(y_true, y_pred, sample_weight, workspace.dtype)
+    errors = workspace._views(yt.shape[0])[0]
+
+    np.subtract(yt, yp, out=errors)
+    np.square(errors, out=errors)
+    if sw is None:
+        return float(np.mean(errors))
+
+    # Same reduction as np.average(errors, weights=sw), without the product temporary
+    scale = sw.sum()
+    if scale == 0.0:
+        raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+    np.multiply(errors, sw, out=errors)
+    return float(errors.sum() / scale)
+
+
+def _get_mse_blocked(
+    y_true: Any,
+    y_pred: Any,
+    sample_weight: Optional[Any],
+) -> Optional[float]:
+    """
+    Compute MSE block by block when the active `MemoryBudget` requires it.
+
+    Gives exactly the same result as the unblocked path of `get_mse`, but
+    only coerces and builds temporaries for one block of elements at a time.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        True target values.
+    y_pred : array-like of shape (n_samples,)
+        Predicted target values.
+    sample_weight : array-like of shape (n_samples,) or None
+        Sample weights.
+
+    Returns
+    -------
+    mse : float or None
+        Mean Squared Error, or None when the inputs fit in the budget (or no
+        budget is active) and the unblocked path should be used.
+    """
+    if get_memory_budget() is None:
+        return None  # checked first: without a budget the inputs are not coerced twice
+    arrays = [np.asarray(y_true), np.asarray(y_pred)]
+    if sample_weight is not None:
+        arrays.append(np.asarray(sample_weight))
+    if any(arr.ndim == 0 or arr.size == 0 for arr in arrays):
+        return None  # let _validate_inputs raise
+    yt, yp, *sw = [arr.reshape(-1) for arr in arrays]
+    if any(arr.shape[0] != yt.shape[0] for arr in (yp, *sw)):
+        return None
+
+    if sample_weight is None:
+        block = _block_length(yt.shape[0], _TEMP_BYTES_PER_ELEMENT)
+    else:
+        block = _block_length(yt.shape[0], _WEIGHTED_TEMP_BYTES_PER_ELEMENT)
+    if block is None:
+        return None
+    n = yt.shape[0]
+
+    def errors(start, stop):
+        t = _to_1d_numeric_array(yt[start:stop], "y_true")
+        p = _to_1d_numeric_array(yp[start:stop], "y_pred")
+        return (t - p) ** 2
+
+    if sample_weight is None:
+        return float(_blocked_sum(errors, n, block) / n)
+
+    # Same reductions as np.average(errors, weights=sw)
+    def weights(start, stop):
+        return _to_1d_numeric_array(sw[0][start:stop], "sample_weight")
+
+    scale = _blocked_sum(weights, n, block)
+    if scale == 0.0:
+        raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+
+    def weighted_errors(start, stop):
+        return np.multiply(errors(start, stop), weights(start, stop))
+
+    return float(_blocked_sum(weighted_errors, n, block) / scale)
+
+
+def get_rmse(y_true, y_pred, *, sample_weight=None, workspace=None, multioutput=None):
     """
     Compute Root Mean Squared Error (RMSE).
 
@@ -143,19 +360,46 @@ def get_rmse(y_true, y_pred, *, sample_weight=None):
     sample_weight : array-like of shape (n_samples,), optional
         Sample weights.
 
+    workspace : MetricWorkspace, optional
+        Preallocated scratch buffers. When given, squared errors are written
+        into the workspace with ``out=`` ufunc calls instead of new arrays.
+
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}, optional
+        How to score ``(n_samples, n_outputs)`` inputs. When given, each
+        column is scored separately with one reduction along axis 0;
+        ``"raw_values"`` returns the per-output scores as an array, the
+        other options average them (``"variance_weighted"`` weights each
+        output by the variance of its `y_true` column). By default all
+        values are pooled into a single score.
+
     Returns
     -------
-    rmse : float
-        Root Mean Squared Error.
+    rmse : float or numpy.ndarray
+        Root Mean Squared Error (one per output for ``multioutput="raw_values"``).
+        Aggregated options average the per-output RMSE values.
     """
-    mse = get_mse(y_true, y_pred, sample_weight=sample_weight)
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        return _accumulate(
+            "regression",
+            y_true,
+            y_pred,
+            sample_weight=sample_weight,
+            workspace=workspace,
+            multioutput=multioutput,
+        ).rmse()
+
+    if multioutput is not None:
+        yt, mse = _get_mse_multioutput(y_true, y_pred, sample_weight, workspace, multioutput)
+        return _aggregate_outputs(np.sqrt(mse), multioutput, yt)
+
+    mse = get_mse(y_true, y_pred, sample_weight=sample_weight, workspace=workspace)
     return float(np.sqrt(mse))
 
 
 # --------------------------------------------------------------
 # Main function to compute both MSE and RMSE
 # --------------------------------------------------------------
-def get_mse_rmse(y_true, y_pred, *, sample_weight=None):
+def get_mse_rmse(y_true, y_pred, *, sample_weight=None, workspace=None, multioutput=None):
     """
     Compute Mean Squared Error (MSE) and Root Mean Squared Error (RMSE).
 
@@ -175,6 +419,18 @@ def get_mse_rmse(y_true, y_pred, *, sample_weight=None):
         Sample weights (e.g., list, NumPy array, or pandas Series).
         If provided, errors are aggregated using a weighted mean.
 
+    workspace : MetricWorkspace, optional
+        Preallocated scratch buffers. When given, squared errors are written
+        into the workspace with ``out=`` ufunc calls instead of new arrays.
+
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}, optional
+        How to score ``(n_samples, n_outputs)`` inputs. When given, each
+        column is scored separately with one reduction along axis 0;
+        ``"raw_values"`` returns the per-output scores as an array, the
+        other options average them (``"variance_weighted"`` weights each
+        output by the variance of its `y_true` column). By default all
+        values are pooled into a single score.
+
     Returns
     -------
     metrics : dict
@@ -184,6 +440,9 @@ def get_mse_rmse(y_true, y_pred, *, sample_weight=None):
         - ``"rmse"`` : float
             Root Mean Squared Error computed as the square root of MSE.
 
+        With ``multioutput="raw_values"`` both values are arrays with one
+        entry per output.
+
     Notes
     -----
     - MSE is defined as: ``mean((y_true - y_pred)**2)``.
@@ -211,6 +470,24 @@ def get_mse_rmse(y_true, y_pred, *, sample_weight=None):
     >>> mr.get_mse_rmse(y_true, y_pred)
     {'mse': 0.31, 'rmse': 0.556776436283}
     """
-    mse = get_mse(y_true, y_pred, sample_weight=sample_weight)
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        acc = _accumulate(
+            "regression",
+            y_true,
+            y_pred,
+            sample_weight=sample_weight,
+            workspace=workspace,
+            multioutput=multioutput,
+        )
+        return {"mse": acc.mse(), "rmse": acc.rmse()}
+
+    if multioutput is not None:
+        yt, mse = _get_mse_multioutput(y_true, y_pred, sample_weight, workspace, multioutput)
+        return {
+            "mse": _aggregate_outputs(mse, multioutput, yt),
+            "rmse": _aggregate_outputs(np.sqrt(mse), multioutput, yt),
+        }
+
+    mse = get_mse(y_true, y_pred, sample_weight=sample_weight, workspace=workspace)
     rmse = float(np.sqrt(mse))
     return {"mse": float(mse), "rmse": float(rmse)}
@@ -0,0 +1,377 @@
+"""
+A module that calculates precision, recall and F1 for multilabel indicator matrices.
+
+Inputs are ``(n_samples, n_labels)`` 0/1 matrices. Per-label TP/FP/FN counts
+are obtained with column-wise reductions over blocks of rows, so every
+label is scored in one pass instead of one metric call per label column.
+Dense, bit-packed (``np.packbits(Y, axis=0)``) and CSR sparse matrices are
+supported; sparse matrices are never densified.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+from reportrabbit._sparse import _is_sparse
+from reportrabbit.packed import _POPCOUNT_TABLE
+
+AVERAGES = ("micro", "macro", "samples", "weighted")
+
+# Rows processed per block for dense and unpacked inputs
+_BLOCK_ROWS = 4096
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {
+    "get_multilabel_precision": 1.0,
+    "get_multilabel_recall": 1.0,
+    "get_multilabel_f1": 1.0,
+}
+
+
+def _column_popcount(words: np.ndarray) -> np.ndarray:
+    """Number of set bits in each column of a uint8 matrix."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=0, dtype=np.int64)
+    return _POPCOUNT_TABLE[words].sum(axis=0, dtype=np.int64)  # pragma: no cover
+
+
+class _Counts:
+    """Per-label counts and the sums of per-sample scores of one evaluation."""
+
+    def __init__(self, n_labels: int) -> None:
+        self.tp = np.zeros(n_labels, dtype=np.int64)
+        self.n_pred = np.zeros(n_labels, dtype=np.int64)
+        self.n_true = np.zeros(n_labels, dtype=np.int64)
+        self.n_samples = 0
+        # Sums over samples of the per-sample precision, recall and F1
+        self.sample_sums = np.zeros(3)
+
+    def add_samples(self, row_tp: np.ndarray, row_pred: np.ndarray, row_true: np.ndarray) -> None:
+        """Accumulate per-sample scores from per-row counts."""
+        row_tp = row_tp.astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precision = np.where(row_pred > 0, row_tp / row_pred, 0.0)
+            recall = np.where(row_true > 0, row_tp / row_true, 0.0)
+            f1 = np.where(row_pred + row_true > 0, 2 * row_tp / (row_pred + row_true), 0.0)
+        self.sample_sums += (precision.sum(), recall.sum(), f1.sum())
+
+
+def _check_average(average: Optional[str]) -> None:
+    if average is not None and average not in AVERAGES:
+        raise ValueError(f"average must be one of {AVERAGES} or None, got {average!r}.")
+
+
+def _dense_counts(yt: np.ndarray, yp: np.ndarray, with_samples: bool) -> _Counts:
+    """Counts of dense indicator matrices, one block of rows at a time."""
+    counts = _Counts(yt.shape[1])
+    counts.n_samples = yt.shape[0]
+    for start in range(0, yt.shape[0], _BLOCK_ROWS):
+        t = yt[start : start + _BLOCK_ROWS] != 0
+        p = yp[start : start + _BLOCK_ROWS] != 0
+        both = t & p
+        counts.tp += np.count_nonzero(both, axis=0)
+        counts.n_pred += np.count_nonzero(p, axis=0)
+        counts.n_true += np.count_nonzero(t, axis=0)
+        if with_samples:
+            counts.add_samples(
+                np.count_nonzero(both, axis=1),
+                np.count_nonzero(p, axis=1),
+                np.count_nonzero(t, axis=1),
+            )
+    return counts
+
+
+def _packed_counts(yt: np.ndarray, yp: np.ndarray, n_samples: int, with_samples: bool) -> _Counts:
+    """
+    Counts of matrices bit-packed along axis 0 (``np.packbits(Y, axis=0)``).
+
+    Per-label counts are popcounts of each column of ``A & B``; the padding
+    bits of the last packed row are masked off first. Per-sample scores
+    need the rows, so they unpack one block of packed rows at a time.
+    """
+    if yt.shape[0] != (n_samples + 7) // 8:
+        raise ValueError(f"{n_samples} samples need {(n_samples + 7) // 8} packed rows.")
+
+    counts = _Counts(yt.shape[1])
+    counts.n_samples = n_samples
+    tail = n_samples % 8
+    mask = np.uint8((0xFF << (8 - tail)) & 0xFF) if tail else np.uint8(0xFF)
+
+    block_bytes = _BLOCK_ROWS // 8
+    for start in range(0, yt.shape[0], block_bytes):
+        a = yt[start : start + block_bytes]
+        b = yp[start : start + block_bytes]
+        if start + block_bytes >= yt.shape[0] and tail:
+            a = a.copy()
+            b = b.copy()
+            a[-1] &= mask
+            b[-1] &= mask
+        counts.tp += _column_popcount(a & b)
+        counts.n_pred += _column_popcount(b)
+        counts.n_true += _column_popcount(a)
+        if with_samples:
+            rows = min(n_samples - start * 8, block_bytes * 8)
+            t = np.unpackbits(a, axis=0, count=rows).astype(bool)
+            p = np.unpackbits(b, axis=0, count=rows).astype(bool)
+            counts.add_samples(
+                np.count_nonzero(t & p, axis=1),
+                np.count_nonzero(p, axis=1),
+                np.count_nonzero(t, axis=1),
+            )
+    return counts
+
+
+def _binary_csr(x: Any):
+    """CSR copy of a sparse matrix with canonical, strictly non-zero entries."""
+    x = x.tocsr(copy=True)
+    x.sum_duplicates()
+    x.eliminate_zeros()
+    x.data = np.ones_like(x.data, dtype=np.int8)
+    return x
+
+
+def _sparse_counts(yt: Any, yp: Any, with_samples: bool) -> _Counts:
+    """Counts of CSR indicator matrices from their index arrays, without densifying."""
+    yt = _binary_csr(yt)
+    yp = _binary_csr(yp)
+    both = yt.multiply(yp).tocsr()
+    both.eliminate_zeros()
+
+    n_labels = yt.shape[1]
+    counts = _Counts(n_labels)
+    counts.n_samples = yt.shape[0]
+    counts.tp += np.bincount(both.indices, minlength=n_labels)
+    counts.n_pred += np.bincount(yp.indices, minlength=n_labels)
+    counts.n_true += np.bincount(yt.indices, minlength=n_labels)
+    if with_samples:
+        counts.add_samples(np.diff(both.indptr), np.diff(yp.indptr), np.diff(yt.indptr))
+    return counts
+
+
+def _multilabel_counts(
+    y_true: Any, y_pred: Any, average: Optional[str], n_samples: Optional[int]
+) -> _Counts:
+    """
+    Validate multilabel inputs and compute their counts.
+
+    Parameters
+    ----------
+    y_true, y_pred : array-like, bit-packed array or scipy.sparse matrix
+        Indicator matrices of shape (n_samples, n_labels), or
+        (ceil(n_samples / 8), n_labels) uint8 matrices when `n_samples` is given.
+    average : {"micro", "macro", "samples", "weighted"} or None
+        Averaging mode; per-sample sums are only computed for ``"samples"``.
+    n_samples : int or None
+        Number of samples of bit-packed inputs.
+
+    Returns
+    -------
+    _Counts
+        Per-label counts (and per-sample sums when needed).
+    """
+    _check_average(average)
+    with_samples = average == "samples"
+
+    if _is_sparse(y_true) or _is_sparse(y_pred):
+        if not (_is_sparse(y_true) and _is_sparse(y_pred)):
+            raise TypeError("y_true and y_pred must both be sparse or both be dense.")
+        if y_true.shape != y_pred.shape:
+            raise ValueError(f"Shape mismatch: {y_true.shape} vs {y_pred.shape}")
+        if y_true.shape[0] == 0:
+            raise ValueError("Input cannot be empty")
+        return _sparse_counts(y_true, y_pred, with_samples)
+
+    yt = np.asarray(y_true)
+    yp = np.asarray(y_pred)
+    if yt.shape != yp.shape:
+        raise ValueError(f"Shape mismatch: {yt.shape} vs {yp.shape}")
+    if yt.ndim != 2:
+        raise ValueError("Multilabel inputs must be 2D (n_samples, n_labels) matrices.")
+    if yt.shape[0] == 0:
+        raise ValueError("Input cannot be empty")
+
+    if n_samples is not None:
+        if yt.dtype != np.uint8 or yp.dtype != np.uint8:
+            raise ValueError("Bit-packed inputs must be uint8 arrays from np.packbits(Y, axis=0).")
+        return _packed_counts(yt, yp, int(n_samples), with_samples)
+    return _dense_counts(yt, yp, with_samples)
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise ratio that is 0.0 where the denominator is 0."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / np.maximum(denominator, 1), 0.0)
+
+
+def _average_scores(counts: _Counts, average: Optional[str], kind: int):
+    """
+    Average per-label or per-sample scores.
+
+    Parameters
+    ----------
+    counts : _Counts
+        Counts of the evaluation.
+    average : {"micro", "macro", "samples", "weighted"} or None
+        Averaging mode; None returns the per-label scores.
+    kind : int
+        0 for precision, 1 for recall, 2 for F1.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The averaged score, or one score per label when `average` is None.
+    """
+    if average == "samples":
+        return float(counts.sample_sums[kind] / counts.n_samples)
+
+    if average == "micro":
+        tp = counts.tp.sum()
+        n_pred = counts.n_pred.sum()
+        n_true = counts.n_true.sum()
+        numerator, denominator = [(tp, n_pred), (tp, n_true), (2 * tp, n_pred + n_true)][kind]
+        return float(numerator / denominator) if denominator else 0.0
+
+    tp = counts.tp.astype(np.float64)
+    numerator, denominator = [
+        (tp, counts.n_pred),
+        (tp, counts.n_true),
+        (2 * tp, counts.n_pred + counts.n_true),
+    ][kind]
+    per_label = _safe_ratio(numerator, denominator)
+
+    if average is None:
+        return per_label
+    if average == "weighted":
+        support = counts.n_true
+        if support.sum() == 0:
+            return 0.0
+        return float(np.average(per_label, weights=support))
+    return float(np.mean(per_label))
+
+
+def get_multilabel_precision(
+    y_true: Any, y_pred: Any, *, average: Optional[str] = "micro", n_samples: Optional[int] = None
+):
+    """
+    Calculates the precision of multilabel predictions and returns the result.
+
+    Precision = True Positives / (True Positives + False Positives), counted
+    per label and then averaged. Undefined ratios count as 0.0, as in
+    `get_precision`.
+
+    Parameters
+    ----------
+    y_true : array-like, bit-packed array or scipy.sparse matrix
+        The actual label indicators, of shape (n_samples, n_labels). Non-zero
+        entries mark assigned labels.
+    y_pred : array-like, bit-packed array or scipy.sparse matrix
+        The predicted label indicators, with the same shape and format.
+    average : {"micro", "macro", "samples", "weighted"} or None, default="micro"
+        ``"micro"`` pools the counts of all labels; ``"macro"`` is the
+        unweighted mean of the per-label scores; ``"weighted"`` weights them
+        by support (number of true instances); ``"samples"`` averages the
+        score of each sample's label set. None returns one score per label.
+    n_samples : int, optional
+        When given, `y_true` and `y_pred` are uint8 matrices bit-packed along
+        the sample axis, ``np.packbits(Y, axis=0)``, holding `n_samples` rows.
+        Per-label counts are then popcounts of the packed columns.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The averaged precision, or one precision per label when `average` is None.
+
+    Examples
+    --------
+    >>> y_true = [[1, 0, 1], [0, 1, 0]]
+    >>> y_pred = [[1, 1, 0], [0, 1, 0]]
+    >>> get_multilabel_precision(y_true, y_pred)
+    0.6666666666666666
+    """
+    return _average_scores(_multilabel_counts(y_true, y_pred, average, n_samples), average, 0)
+
+
+def get_multilabel_recall(
+    y_true: Any, y_pred: Any, *, average: Optional[str] = "micro", n_samples: Optional[int] = None
+):
+    """
+    Calculates the recall of multilabel predictions and returns the result.
+
+    Recall = True Positives / (True Positives + False Negatives), counted
+    per label and then averaged. Undefined ratios count as 0.0, as in
+    `get_recall`.
+
+    Parameters
+    ----------
+    y_true : array-like, bit-packed array or scipy.sparse matrix
+        The actual label indicators, of shape (n_samples, n_labels). Non-zero
+        entries mark assigned labels.
+    y_pred : array-like, bit-packed array or scipy.sparse matrix
+        The predicted label indicators, with the same shape and format.
+    average : {"micro", "macro", "samples", "weighted"} or None, default="micro"
+        ``"micro"`` pools the counts of all labels; ``"macro"`` is the
+        unweighted mean of the per-label scores; ``"weighted"`` weights them
+        by support (number of true instances); ``"samples"`` averages the
+        score of each sample's label set. None returns one score per label.
+    n_samples : int, optional
+        When given, `y_true` and `y_pred` are uint8 matrices bit-packed along
+        the sample axis, ``np.packbits(Y, axis=0)``, holding `n_samples` rows.
+        Per-label counts are then popcounts of the packed columns.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The averaged recall, or one recall per label when `average` is None.
+
+    Examples
+    --------
+    >>> y_true = [[1, 0, 1], [0, 1, 0]]
+    >>> y_pred = [[1, 1, 0], [0, 1, 0]]
+    >>> get_multilabel_recall(y_true, y_pred)
+    0.6666666666666666
+    """
+    return _average_scores(_multilabel_counts(y_true, y_pred, average, n_samples), average, 1)
+
+
+def get_multilabel_f1(
+    y_true: Any, y_pred: Any, *, average: Optional[str] = "micro", n_samples: Optional[int] = None
+):
+    """
+    Calculates the F1 score of multilabel predictions and returns the result.
+
+    F1 = 2 * TP / (2 * TP + FP + FN), the harmonic mean of precision and
+    recall, counted per label (or per sample) and then averaged.
+
+    Parameters
+    ----------
+    y_true : array-like, bit-packed array or scipy.sparse matrix
+        The actual label indicators, of shape (n_samples, n_labels). Non-zero
+        entries mark assigned labels.
+    y_pred : array-like, bit-packed array or scipy.sparse matrix
+        The predicted label indicators, with the same shape and format.
+    average : {"micro", "macro", "samples", "weighted"} or None, default="micro"
+        ``"micro"`` pools the counts of all labels; ``"macro"`` is the
+        unweighted mean of the per-label scores; ``"weighted"`` weights them
+        by support (number of true instances); ``"samples"`` averages the
+        score of each sample's label set. None returns one score per label.
+    n_samples : int, optional
+        When given, `y_true` and `y_pred` are uint8 matrices bit-packed along
+        the sample axis, ``np.packbits(Y, axis=0)``, holding `n_samples` rows.
+        Per-label counts are then popcounts of the packed columns.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The averaged F1 score, or one F1 score per label when `average` is None.
+
+    Examples
+    --------
+    >>> y_true = [[1, 0, 1], [0, 1, 0]]
+    >>> y_pred = [[1, 1, 0], [0, 1, 0]]
+    >>> get_multilabel_f1(y_true, y_pred)
+    0.6666666666666666
+    """
+    return _average_scores(_multilabel_counts(y_true, y_pred, average, n_samples), average, 2)
+
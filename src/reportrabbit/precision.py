@@ -1,24 +1,47 @@
 import numpy as np
 
+from reportrabbit.budget import _block_length, _blocked_count
+from reportrabbit.packed import PackedLabels, _packed_counts
+from reportrabbit._sparse import _positive_index_counts, _uses_positive_indices
+from reportrabbit._iterators import _accumulate, _is_iterator
+
+# Peak temporaries per element: the boolean masks of both inputs and their intersection
+_TEMP_BYTES_PER_ELEMENT = 3
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {"get_precision": 0.5}
+
 """
 A module that calculates the precision statistic (proportion of positive predictions that were correct).
 """
 
 
-def get_precision(y_true, y_pred):
+def get_precision(y_true, y_pred, *, n_samples=None):
     """
     Calculates the precision of predictions and returns the result.
     Precision is the proportion of positive predictions that were correct.
     It answers: "Of all the items we predicted as positive, how many were actually positive?"
     Precision = True Positives / (True Positives + False Positives).    
     Scoring is between 0 and 1 with a perfect precision being 1.
+
+    `y_true` and `y_pred` may also both be `PackedLabels`, in which case the
+    counts are computed with popcounts on the packed bits.
     
     Parameters
     ----------
-    y_true : array
+    y_true : array or PackedLabels
         The actual observed values (ground truth).
-    y_pred : array
+    y_pred : array or PackedLabels
         The model predicted values.
+    n_samples : int, optional
+        Total number of samples. When given, `y_true` and `y_pred` are read
+        as sorted arrays of the indices of their positive samples instead of
+        dense label arrays. ``scipy.sparse`` label vectors are also accepted
+        (and set `n_samples` from their length); the other input may then
+        be a dense 0/1 label array of the same length or positive indices.
+        Counts then come from a sorted intersection, so the cost scales
+        with the number of positives.
+
     Returns
     -------
     float
@@ -36,7 +59,25 @@ def get_precision(y_true, y_pred):
     >>> y_pred = [0, 1, 0, 0]
     >>> get_precision(y_true, y_pred)
     0.75
+    >>> # Positive indices out of 1,000,000 samples
+    >>> get_precision([3, 17, 42], [3, 42, 99, 512], n_samples=1_000_000)
+    0.5
     """
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        return _accumulate("classification", y_true, y_pred, n_samples=n_samples).precision()
+
+    if isinstance(y_true, PackedLabels) or isinstance(y_pred, PackedLabels):
+        _, _, tp, fp, _, _ = _packed_counts(y_true, y_pred)
+        if tp + fp == 0:
+            return 0.0
+        return float(tp / (tp + fp))
+
+    if _uses_positive_indices(y_true, y_pred, n_samples):
+        tp, n_pred_positive, _ = _positive_index_counts(y_true, y_pred, n_samples)
+        if n_pred_positive == 0:
+            return 0.0
+        return float(tp / n_pred_positive)
+
     y_true = np.asarray(y_true)
     y_pred = np.asarray(y_pred)
     
@@ -46,6 +87,15 @@ def get_precision(y_true, y_pred):
     if len(y_true) != len(y_pred):
         raise ValueError("Input arrays must be the same length")
     
+    n = len(y_true)
+    block = _block_length(n, _TEMP_BYTES_PER_ELEMENT)
+    if block is not None:
+        n_pred_positive = _blocked_count(lambda i, j: y_pred[i:j] != 0, n, block)
+        if n_pred_positive == 0:
+            return 0.0
+        tp = _blocked_count(lambda i, j: (y_pred[i:j] != 0) & (y_true[i:j] != 0), n, block)
+        return float(tp / n_pred_positive)
+
     # Convert to boolean for positive predictions (non-zero values)
     pred_positive = y_pred != 0
     true_positive = (y_pred != 0) & (y_true != 0)
@@ -0,0 +1,213 @@
+"""
+A module that scores many predictions against one fixed target.
+
+Every ``get_*`` call re-validates `y_true` and recomputes statistics that
+depend on it alone: its mean and total sum of squares for R^2 and R, the
+zero check for MAPE, and the positive mask for precision and recall. A
+`PreparedTarget` computes each of these once, on first use, so scoring
+another model against the same holdout set only costs the pass over
+`y_pred`.
+"""
+
+from __future__ import annotations
+
+import warnings
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+
+from reportrabbit.mse_rmse import _to_1d_numeric_array
+
+
+class PreparedTarget:
+    """
+    A validated target with cached statistics, scored against many predictions.
+
+    The metric methods take only `y_pred` and return exactly what the
+    matching ``get_*`` function returns for ``(y_true, y_pred)``.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        True target values or labels. Values are only checked (for
+        finiteness, zeros, ...) when a metric that needs the check is first
+        used, so labels that are not numeric can still be used with the
+        classification metrics.
+
+    Examples
+    --------
+    >>> from reportrabbit import PreparedTarget
+    >>> target = PreparedTarget([3.0, -0.5, 2.0, 7.0])
+    >>> float(target.r2([2.5, 0.0, 2.0, 8.0]))
+    0.9486081370449679
+    >>> target.mae([3.0, -0.5, 2.0, 8.0])
+    0.25
+    """
+
+    def __init__(self, y_true: Any) -> None:
+        values = np.array(y_true)
+        if values.ndim != 1:
+            raise ValueError("y_true must be a 1D array-like.")
+        if values.shape[0] == 0:
+            raise ValueError("Input arrays cannot be empty.")
+        values.setflags(write=False)
+        self.values = values
+
+    def __repr__(self) -> str:
+        return f"PreparedTarget(n_samples={len(self)})"
+
+    def __len__(self) -> int:
+        return int(self.values.shape[0])
+
+    # ------------------------------------------------------------------
+    # Cached per-target quantities
+    # ------------------------------------------------------------------
+    @cached_property
+    def _float_values(self) -> np.ndarray:
+        """`values` as float64, checked to be finite."""
+        values = _to_1d_numeric_array(self.values, "y_true")
+        if not np.all(np.isfinite(values)):
+            raise ValueError("Inputs must contain only finite values.")
+        return values
+
+    @cached_property
+    def _has_zero(self) -> bool:
+        """Whether `values` contains a zero (MAPE is then undefined)."""
+        return bool(np.any(self._float_values == 0))
+
+    @cached_property
+    def _centered(self) -> np.ndarray:
+        """``values - mean(values)``, shared by R and R^2."""
+        return self.values - np.mean(self.values)
+
+    @cached_property
+    def _sum_sq(self) -> Any:
+        """Total sum of squares of `values` around their mean."""
+        return np.sum(self._centered**2)
+
+    @cached_property
+    def _positive(self) -> np.ndarray:
+        """Mask of positive (non-zero) labels."""
+        return self.values != 0
+
+    @cached_property
+    def _n_positive(self) -> int:
+        """Number of positive labels."""
+        return int(np.count_nonzero(self._positive))
+
+    # ------------------------------------------------------------------
+    # Input handling
+    # ------------------------------------------------------------------
+    def _check_length(self, y_pred: np.ndarray) -> None:
+        if y_pred.shape[0] != len(self):
+            raise ValueError("Input lengths must match.")
+
+    def _float_pred(self, y_pred: Any) -> np.ndarray:
+        """Validated float64 predictions for the error metrics."""
+        y_pred = _to_1d_numeric_array(y_pred, "y_pred")
+        self._check_length(y_pred)
+        self._float_values  # validates y_true first, like the get_* functions
+        if not np.all(np.isfinite(y_pred)):
+            raise ValueError("Inputs must contain only finite values.")
+        return y_pred
+
+    def _label_pred(self, y_pred: Any) -> np.ndarray:
+        """Predictions as an array of labels."""
+        y_pred = np.asarray(y_pred).reshape(-1)
+        self._check_length(y_pred)
+        return y_pred
+
+    def _true_positives(self, y_pred: Any) -> tuple[int, int]:
+        """True positives and predicted positives of `y_pred`."""
+        pred_positive = self._label_pred(y_pred) != 0
+        n_pred_positive = int(np.count_nonzero(pred_positive))
+        pred_positive &= self._positive
+        return int(np.count_nonzero(pred_positive)), n_pred_positive
+
+    # ------------------------------------------------------------------
+    # Regression metrics
+    # ------------------------------------------------------------------
+    def mae(self, y_pred: Any) -> float:
+        """Mean Absolute Error of `y_pred`; same result as `get_mae`."""
+        y_pred = self._float_pred(y_pred)
+        return float(np.mean(np.abs(self._float_values - y_pred)))
+
+    def mse(self, y_pred: Any) -> float:
+        """Mean Squared Error of `y_pred`; same result as `get_mse`."""
+        y_pred = self._float_pred(y_pred)
+        return float(np.mean((self._float_values - y_pred) ** 2))
+
+    def rmse(self, y_pred: Any) -> float:
+        """Root Mean Squared Error of `y_pred`; same result as `get_rmse`."""
+        return float(np.sqrt(self.mse(y_pred)))
+
+    def mape(self, y_pred: Any) -> float:
+        """
+        Mean Absolute Percentage Error of `y_pred`; same result as `get_mape`.
+
+        The zero check on `y_true` is cached. The ratio is still computed by
+        division (not by multiplying with a cached reciprocal), so the result
+        stays bit-for-bit equal to `get_mape`.
+        """
+        y_pred = self._float_pred(y_pred)
+        if self._has_zero:
+            raise ValueError("MAPE is undefined when y_true contains zero values.")
+        y_true = self._float_values
+        return float(np.mean(np.abs((y_true - y_pred) / y_true)))
+
+    def r(self, y_pred: Any) -> float:
+        """Pearson correlation of `y_pred` with the target; same result as `get_r`."""
+        y_pred = np.array(y_pred)
+        self._check_length(y_pred)
+        centered_pred = y_pred - np.mean(y_pred)
+
+        numerator = np.sum(self._centered * centered_pred)
+        denominator = np.sqrt(self._sum_sq * np.sum(centered_pred**2))
+        if denominator == 0:
+            return np.nan
+        return numerator / denominator
+
+    def r2(self, y_pred: Any) -> float:
+        """R^2 of `y_pred`; same result as `get_r2`."""
+        y_pred = np.array(y_pred)
+        self._check_length(y_pred)
+        if len(self) < 2:
+            warnings.warn("R^2 is undefined for fewer than 2 data points.")
+            return np.nan
+
+        ssr = np.sum((self.values - y_pred) ** 2)
+        if self._sum_sq == 0:
+            return 0.0
+        return 1 - (ssr / self._sum_sq)
+
+    # ------------------------------------------------------------------
+    # Classification metrics
+    # ------------------------------------------------------------------
+    def accuracy(self, y_pred: Any) -> float:
+        """Proportion of exactly matching labels; same result as `get_accuracy`."""
+        y_pred = self._label_pred(y_pred)
+        return float(np.count_nonzero(self.values == y_pred) / len(self))
+
+    def precision(self, y_pred: Any) -> float:
+        """Precision of `y_pred`; same result as `get_precision`."""
+        tp, n_pred_positive = self._true_positives(y_pred)
+        if n_pred_positive == 0:
+            return 0.0
+        return float(tp / n_pred_positive)
+
+    def recall(self, y_pred: Any) -> float:
+        """Recall of `y_pred`; same result as `get_recall`."""
+        tp, _ = self._true_positives(y_pred)
+        if self._n_positive == 0:
+            return 0.0
+        return float(tp / self._n_positive)
+
+    def f1(self, y_pred: Any) -> float:
+        """F1 score of `y_pred`; same result as `get_f1`."""
+        tp, n_pred_positive = self._true_positives(y_pred)
+        precision = tp / n_pred_positive if n_pred_positive else 0.0
+        recall = tp / self._n_positive if self._n_positive else 0.0
+        if precision + recall == 0:
+            return 0.0
+        return float(2 * (precision * recall) / (precision + recall))
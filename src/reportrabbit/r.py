@@ -1,10 +1,20 @@
 import numpy as np
 
+from reportrabbit._multioutput import _aggregate_outputs, _to_2d_numeric_arrays
+from reportrabbit.budget import _block_length, _blocked_sum, _reduction_dtype
+from reportrabbit._iterators import _accumulate, _is_iterator
+
+# Peak temporaries per element: both centered inputs and their product
+_TEMP_BYTES_PER_ELEMENT = 24
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {"get_r": 2.25}
+
 """
 A module that calculates the Pearson correlation coefficient (R). 
 This function was first written manually, and then validated and improved with the use of LLMs.
 """
-def get_r(y_true, y_pred):
+def get_r(y_true, y_pred, *, multioutput=None):
     """
     Calculates the Pearson correlation coefficient (R)
     and returns the result.
@@ -18,10 +28,17 @@ def get_r(y_true, y_pred):
         The actual observed values (ground truth).
     y_pred : array or list
         The model predicted values.
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}, optional
+        How to score ``(n_samples, n_outputs)`` inputs. When given, each
+        column is scored separately with one reduction along axis 0;
+        ``"raw_values"`` returns the per-output scores as an array, the
+        other options average them (``"variance_weighted"`` weights each
+        output by the variance of its `y_true` column). By default all
+        values are pooled into a single score.
   
     Returns
     -------
-    float
+    float or numpy.ndarray
         The calculated R value, ranging from -1.0 to 1.0.
    
     Examples
@@ -38,6 +55,9 @@ def get_r(y_true, y_pred):
     >>> get_r(y_true, y_pred)
     -1.0
     """
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        return _accumulate("regression", y_true, y_pred, multioutput=multioutput).r()
+
     # Type Validation
     if not isinstance(y_true, (list, np.ndarray)) or not isinstance(y_pred, (list, np.ndarray)):
         raise TypeError("Inputs must be list or numpy array!")
@@ -49,7 +69,14 @@ def get_r(y_true, y_pred):
     # Content Validation (Empty lists)
     if len(y_true) == 0:
         raise ValueError("Input arrays cannot be empty.")
+
+    if multioutput is not None:
+        return _get_r_multioutput(y_true, y_pred, multioutput)
     
+    block = _block_length(len(y_true), _TEMP_BYTES_PER_ELEMENT)
+    if block is not None:
+        return _get_r_blocked(np.asarray(y_true), np.asarray(y_pred), block)
+
     y_true = np.array(y_true)
     y_pred = np.array(y_pred)
 
@@ -68,4 +95,81 @@ def get_r(y_true, y_pred):
     if denominator == 0:
         return np.nan  # Correlation is undefined if there is no variance
 
-    return numerator / denominator
\ No newline at end of file
+    return numerator / denominator
+
+
+def _get_r_blocked(y_true, y_pred, block):
+    """
+    Calculates the Pearson correlation coefficient block by block under a `MemoryBudget`.
+
+    Gives exactly the same result as the unblocked path, without copying
+    the inputs and with temporaries for only `block` elements at a time.
+
+    Parameters
+    ----------
+    y_true : numpy.ndarray
+        The actual observed values.
+    y_pred : numpy.ndarray
+        The model predicted values.
+    block : int
+        Number of elements per block.
+
+    Returns
+    -------
+    float
+        The calculated Pearson correlation coefficient.
+    """
+    n = y_true.shape[0]
+
+    def mean(values):
+        total = _blocked_sum(lambda i, j: values[i:j], n, block, _reduction_dtype(values))
+        return total.dtype.type(total / n)
+
+    mean_true = mean(y_true)
+    mean_pred = mean(y_pred)
+
+    def products(start, stop):
+        return (y_true[start:stop] - mean_true) * (y_pred[start:stop] - mean_pred)
+
+    numerator = _blocked_sum(products, n, block)
+    sum_sq_true = _blocked_sum(lambda i, j: (y_true[i:j] - mean_true) ** 2, n, block)
+    sum_sq_pred = _blocked_sum(lambda i, j: (y_pred[i:j] - mean_pred) ** 2, n, block)
+
+    denominator = np.sqrt(sum_sq_true * sum_sq_pred)
+
+    if denominator == 0:
+        return np.nan
+
+    return numerator / denominator
+
+
+def _get_r_multioutput(y_true, y_pred, multioutput):
+    """
+    Calculates the Pearson correlation of each output column.
+
+    Parameters
+    ----------
+    y_true : array or list
+        The actual observed values, of shape (n_samples, n_outputs).
+    y_pred : array or list
+        The model predicted values, of shape (n_samples, n_outputs).
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}
+        Aggregation of the per-output scores.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The aggregated R value, or one R value per output for ``"raw_values"``.
+        Outputs without variance give NaN, as in `get_r`.
+    """
+    y_true, y_pred = _to_2d_numeric_arrays(y_true, y_pred, multioutput)
+
+    dev_true = y_true - np.mean(y_true, axis=0)
+    dev_pred = y_pred - np.mean(y_pred, axis=0)
+
+    numerator = np.sum(dev_true * dev_pred, axis=0)
+    denominator = np.sqrt(np.sum(dev_true**2, axis=0) * np.sum(dev_pred**2, axis=0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.where(denominator == 0, np.nan, numerator / denominator)
+    return _aggregate_outputs(r, multioutput, y_true)
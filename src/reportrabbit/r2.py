@@ -1,11 +1,21 @@
 import warnings
 import numpy as np
 
+from reportrabbit._multioutput import _aggregate_outputs, _to_2d_numeric_arrays
+from reportrabbit.budget import _block_length, _blocked_sum, _reduction_dtype
+from reportrabbit._iterators import _accumulate, _is_iterator
+
+# Peak temporaries per element: a difference and its square
+_TEMP_BYTES_PER_ELEMENT = 16
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {"get_r2": 1.75}
+
 """
 A module that calculates the R^2 statistic (coefficient of determination).
 This function was first written manually, and then validated and improved with the use of LLMs.
 """
-def get_r2(y_true, y_pred):
+def get_r2(y_true, y_pred, *, workspace=None, multioutput=None):
     """
     Calculates the R^2 statistic (coefficient of determination) 
     and return the result.
@@ -19,10 +29,21 @@ def get_r2(y_true, y_pred):
         The actual observed values (ground truth).
     y_pred : array or list
         The model predicted values.
+    workspace : MetricWorkspace, optional
+        Preallocated scratch buffers. When given, inputs are coerced to the
+        workspace dtype and the squared deviations are written into the
+        workspace with ``out=`` ufunc calls instead of new arrays.
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}, optional
+        How to score ``(n_samples, n_outputs)`` inputs. When given, each
+        column is scored separately with one reduction along axis 0;
+        ``"raw_values"`` returns the per-output scores as an array, the
+        other options average them (``"variance_weighted"`` weights each
+        output by the variance of its `y_true` column). By default all
+        values are pooled into a single score.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The calculated R^2 statistic.
 
     Examples
@@ -32,14 +53,37 @@ def get_r2(y_true, y_pred):
     >>> get_r2(y_true, y_pred)
     1.0
     """
+    if _is_iterator(y_true) or _is_iterator(y_pred):
+        return _accumulate(
+            "regression", y_true, y_pred, workspace=workspace, multioutput=multioutput
+        ).r2()
+
     # Validation
     if len(y_true) != len(y_pred):
         raise ValueError("Input lengths must match.")
+
+    if multioutput is not None:
+        if workspace is not None:
+            raise ValueError("workspace cannot be combined with multioutput.")
+        return _get_r2_multioutput(y_true, y_pred, multioutput)
+
+    # Same shape checks for every path below (prevents broadcasting)
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"Shape mismatch: {y_true.shape} vs {y_pred.shape}")
     
     if len(y_true) < 2:
         warnings.warn("R^2 is undefined for fewer than 2 data points.")
         return np.nan
     
+    if workspace is not None:
+        return _get_r2_workspace(y_true, y_pred, workspace)
+
+    block = _block_length(len(y_true), _TEMP_BYTES_PER_ELEMENT)
+    if block is not None:
+        return _get_r2_blocked(y_true, y_pred, block)
+
     y_true = np.array(y_true)
     y_pred = np.array(y_pred)
     
@@ -55,4 +99,113 @@ def get_r2(y_true, y_pred):
         return 0.0
         
     r2 = 1 - (ssr / sst)
-    return r2
\ No newline at end of file
+    return r2
+
+
+def _get_r2_workspace(y_true, y_pred, workspace):
+    """
+    Calculates the R^2 statistic into the buffers of a `MetricWorkspace`.
+
+    Parameters
+    ----------
+    y_true : numpy.ndarray
+        The actual observed values (ground truth), already checked to have
+        the shape of `y_pred`.
+    y_pred : numpy.ndarray
+        The model predicted values.
+    workspace : MetricWorkspace
+        Preallocated scratch buffers.
+
+    Returns
+    -------
+    float
+        The calculated R^2 statistic. As in the allocating path, non-finite
+        inputs propagate to a NaN result.
+    """
+    y_true = np.asarray(y_true, dtype=workspace.dtype).reshape(-1)
+    y_pred = np.asarray(y_pred, dtype=workspace.dtype).reshape(-1)
+    residual = workspace._views(y_true.shape[0])[0]
+
+    y_mean = np.mean(y_true)
+
+    np.subtract(y_true, y_mean, out=residual)
+    np.square(residual, out=residual)
+    sst = np.sum(residual)
+
+    np.subtract(y_true, y_pred, out=residual)
+    np.square(residual, out=residual)
+    ssr = np.sum(residual)
+
+    if sst == 0:
+        return 0.0
+
+    r2 = 1 - (ssr / sst)
+    return r2
+
+
+def _get_r2_blocked(y_true, y_pred, block):
+    """
+    Calculates the R^2 statistic block by block under a `MemoryBudget`.
+
+    Gives exactly the same result as the unblocked path, without copying
+    the inputs and with temporaries for only `block` elements at a time.
+
+    Parameters
+    ----------
+    y_true : numpy.ndarray
+        The actual observed values.
+    y_pred : numpy.ndarray
+        The model predicted values.
+    block : int
+        Number of elements per block.
+
+    Returns
+    -------
+    float
+        The calculated R^2 statistic.
+    """
+    n = y_true.shape[0]
+    total = _blocked_sum(lambda i, j: y_true[i:j], n, block, _reduction_dtype(y_true))
+    y_mean = total.dtype.type(total / n)
+
+    sst = _blocked_sum(lambda i, j: (y_true[i:j] - y_mean) ** 2, n, block)
+    ssr = _blocked_sum(lambda i, j: (y_true[i:j] - y_pred[i:j]) ** 2, n, block)
+
+    if sst == 0:
+        return 0.0
+
+    r2 = 1 - (ssr / sst)
+    return r2
+
+
+def _get_r2_multioutput(y_true, y_pred, multioutput):
+    """
+    Calculates the R^2 statistic of each output column.
+
+    Parameters
+    ----------
+    y_true : array or list
+        The actual observed values, of shape (n_samples, n_outputs).
+    y_pred : array or list
+        The model predicted values, of shape (n_samples, n_outputs).
+    multioutput : {"raw_values", "uniform_average", "variance_weighted"}
+        Aggregation of the per-output scores.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The aggregated R^2, or one R^2 per output for ``"raw_values"``.
+        Constant outputs give 0.0, as in `get_r2`.
+    """
+    y_true, y_pred = _to_2d_numeric_arrays(y_true, y_pred, multioutput)
+
+    if y_true.shape[0] < 2:
+        warnings.warn("R^2 is undefined for fewer than 2 data points.")
+        return _aggregate_outputs(np.full(y_true.shape[1], np.nan), multioutput, y_true)
+
+    sst = np.sum((y_true - np.mean(y_true, axis=0)) ** 2, axis=0)
+    ssr = np.sum((y_true - y_pred) ** 2, axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(sst == 0, 0.0, 1 - ssr / sst)
+    return _aggregate_outputs(r2, multioutput, y_true)
@@ -0,0 +1,237 @@
+"""
+A module that calculates rank correlations: Spearman's rho and Kendall's tau-b.
+
+Both statistics start from the same tie-aware ranking of each input. A
+`Ranking` computes it once (one argsort) and can be passed in place
+of `y_true` to score many models against the same target.
+
+Kendall's tau-b uses Knight's algorithm: sort the pairs by ``(y_true,
+y_pred)``, then count the discordant pairs as the inversions of the
+``y_pred`` ranks in that order. With Numba the inversions are counted by a
+compiled merge sort; otherwise one bit of the ranks at a time with a few
+vectorised passes per bit. Both are O(n log n).
+"""
+
+from __future__ import annotations
+
+import math
+from functools import cached_property
+from typing import Any, Union
+
+import numpy as np
+
+from reportrabbit._backend import _resolve_backend, count_inversions
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {
+    "get_spearman": 5.25,
+    "get_kendall_tau": 6.75,
+}
+
+
+class Ranking:
+    """
+    Tie-aware ranks of one array, reusable across rank correlations.
+
+    Parameters
+    ----------
+    values : array-like of shape (n_samples,)
+        Values to rank. Any sortable dtype is accepted; NaN is rejected.
+
+    Attributes
+    ----------
+    dense : numpy.ndarray of shape (n_samples,)
+        Dense ranks: 0 for the smallest value, consecutive integers for the
+        following distinct values, equal for ties.
+    ranks : numpy.ndarray of shape (n_samples,)
+        Average ranks starting at 1, as used by Spearman's rho (tied values
+        share the mean of the positions they occupy).
+    n_tied_pairs : int
+        Number of pairs of samples with equal values.
+
+    Examples
+    --------
+    >>> from reportrabbit import Ranking, get_kendall_tau, get_spearman
+    >>> target = Ranking([1.0, 2.0, 2.0, 4.0])
+    >>> target.ranks
+    array([1. , 2.5, 2.5, 4. ])
+    >>> float(get_spearman(target, [10, 20, 30, 40]))
+    0.9486832980505138
+    >>> float(get_kendall_tau(target, [10, 20, 30, 40]))
+    0.9128709291752769
+    """
+
+    def __init__(self, values: Any) -> None:
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError("Input must be a 1D array-like.")
+        if values.shape[0] == 0:
+            raise ValueError("Input arrays cannot be empty.")
+        if values.dtype.kind in "fc" and np.isnan(values).any():
+            raise ValueError("Inputs must not contain NaN values.")
+
+        n = values.shape[0]
+        order = np.argsort(values)
+        sorted_values = values[order]
+        new_value = np.empty(n, dtype=bool)
+        new_value[0] = True
+        np.not_equal(sorted_values[1:], sorted_values[:-1], out=new_value[1:])
+
+        starts = np.flatnonzero(new_value)
+        counts = np.diff(np.append(starts, n))
+
+        dense = np.empty(n, dtype=np.intp)
+        dense[order] = np.cumsum(new_value) - 1
+
+        self.dense = dense
+        self.n_distinct = int(starts.shape[0])
+        self.n_tied_pairs = int(np.sum(counts * (counts - 1) // 2))
+        self._group_starts = starts
+        self._group_counts = counts
+
+    def __repr__(self) -> str:
+        return f"Ranking(n_samples={len(self)}, n_distinct={self.n_distinct})"
+
+    def __len__(self) -> int:
+        return int(self.dense.shape[0])
+
+    @cached_property
+    def ranks(self) -> np.ndarray:
+        """Average ranks (1-based); computed on first use."""
+        group_rank = self._group_starts + (self._group_counts + 1) / 2
+        return group_rank[self.dense]
+
+    @cached_property
+    def _centered(self) -> np.ndarray:
+        """Average ranks minus their mean, ``(n + 1) / 2``."""
+        return self.ranks - (len(self) + 1) / 2
+
+    @cached_property
+    def _sum_sq(self) -> float:
+        """Sum of squares of the centered ranks."""
+        return float(np.dot(self._centered, self._centered))
+
+
+def _as_ranking(values: Union[Ranking, Any]) -> Ranking:
+    return values if isinstance(values, Ranking) else Ranking(values)
+
+
+def _check_lengths(a: Ranking, b: Ranking) -> None:
+    if len(a) != len(b):
+        raise ValueError("Input lengths must match.")
+
+
+def get_spearman(y_true: Union[Ranking, Any], y_pred: Union[Ranking, Any]) -> float:
+    """
+    Calculates Spearman's rank correlation coefficient (rho).
+
+    Rho is the Pearson correlation of the average ranks of the two inputs,
+    so ties are handled the same way as in `scipy.stats.spearmanr`.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,) or Ranking
+        The actual observed values, or their precomputed `Ranking`.
+    y_pred : array-like of shape (n_samples,) or Ranking
+        The model predicted values, or their precomputed `Ranking`.
+
+    Returns
+    -------
+    float
+        Rho, between -1 and 1. NaN when either input is constant.
+
+    Raises
+    ------
+    ValueError
+        If the inputs are empty, not 1D, contain NaN, or differ in length.
+
+    Examples
+    --------
+    >>> float(get_spearman([1.0, 2.0, 3.0, 4.0], [1.0, 3.0, 2.0, 4.0]))
+    0.8
+    """
+    true_ranking = _as_ranking(y_true)
+    pred_ranking = _as_ranking(y_pred)
+    _check_lengths(true_ranking, pred_ranking)
+
+    denominator = math.sqrt(true_ranking._sum_sq * pred_ranking._sum_sq)
+    if denominator == 0:
+        return np.nan
+    numerator = np.dot(true_ranking._centered, pred_ranking._centered)
+    return float(min(max(numerator / denominator, -1.0), 1.0))
+
+
+def get_kendall_tau(
+    y_true: Union[Ranking, Any],
+    y_pred: Union[Ranking, Any],
+    *,
+    backend: str = "numpy",
+) -> float:
+    """
+    Calculates Kendall's tau-b rank correlation coefficient in O(n log n).
+
+    Tau-b compares the number of concordant and discordant pairs and
+    corrects for ties in either input, matching `scipy.stats.kendalltau`.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,) or Ranking
+        The actual observed values, or their precomputed `Ranking`.
+    y_pred : array-like of shape (n_samples,) or Ranking
+        The model predicted values, or their precomputed `Ranking`.
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Implementation of the discordant-pair count. ``"auto"`` uses the
+        compiled merge sort when Numba is installed.
+
+    Returns
+    -------
+    float
+        Tau-b, between -1 and 1. NaN when either input is constant.
+
+    Raises
+    ------
+    ValueError
+        If the inputs are empty, not 1D, contain NaN, or differ in length.
+    ImportError
+        If ``backend="jit"`` and Numba is not installed.
+
+    Examples
+    --------
+    >>> float(get_kendall_tau([1.0, 2.0, 3.0, 4.0], [1.0, 3.0, 2.0, 4.0]))
+    0.6666666666666666
+    """
+    _resolve_backend(backend)
+    true_ranking = _as_ranking(y_true)
+    pred_ranking = _as_ranking(y_pred)
+    _check_lengths(true_ranking, pred_ranking)
+
+    n = len(true_ranking)
+    n_pairs = n * (n - 1) // 2
+    untied_true = n_pairs - true_ranking.n_tied_pairs
+    untied_pred = n_pairs - pred_ranking.n_tied_pairs
+    if untied_true == 0 or untied_pred == 0:
+        return np.nan
+
+    # Sort by (y_true, y_pred) with one argsort on a combined integer key
+    key = true_ranking.dense * pred_ranking.n_distinct + pred_ranking.dense
+    order = np.argsort(key)
+    sorted_key = key[order]
+
+    # Pairs tied in both inputs
+    new_pair = np.empty(n, dtype=bool)
+    new_pair[0] = True
+    np.not_equal(sorted_key[1:], sorted_key[:-1], out=new_pair[1:])
+    counts = np.diff(np.append(np.flatnonzero(new_pair), n))
+    tied_both = int(np.sum(counts * (counts - 1) // 2))
+
+    # Within a tie in y_true the y_pred ranks are ascending, so every
+    # inversion of y_pred in this order is a discordant pair. The sort
+    # temporaries are released first, as the count needs its own buffers.
+    pred_sorted = pred_ranking.dense[order]
+    del key, order, sorted_key, new_pair, counts
+    discordant = count_inversions(pred_sorted, backend)
+
+    numerator = n_pairs - true_ranking.n_tied_pairs - pred_ranking.n_tied_pairs
+    numerator += tied_both - 2 * discordant
+    tau = numerator / math.sqrt(untied_true * untied_pred)
+    return float(min(max(tau, -1.0), 1.0))
@@ -0,0 +1,256 @@
+"""
+A module of top-k ranking metrics for recommendation and retrieval.
+
+Scores come as an ``(n_users, n_items)`` matrix. Sorting every row to rank
+the items costs O(n_items log n_items) per user; instead each block of rows
+is reduced to its top k items with ``np.argpartition`` along axis 1, and
+only those k items are sorted. Precision@k, recall@k, NDCG@k and MAP@k are
+then computed for the whole block with vectorised reductions, so there is
+no Python loop over users and memory is bounded by the block size.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from reportrabbit._sparse import _is_sparse
+
+RANKING_METRICS = ("precision", "recall", "ndcg", "map")
+
+# Matrix elements (rows x items) scored at a time
+_BLOCK_ELEMENTS = 1 << 18
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {
+    "get_ranking_metrics": 4.0,
+}
+
+
+def _is_csr_tuple(y_true: Any, n_users: int) -> bool:
+    """Whether `y_true` is an ``(indptr, indices[, grades])`` tuple rather than dense rows."""
+    if not isinstance(y_true, tuple) or len(y_true) not in (2, 3):
+        return False
+    indptr = np.asarray(y_true[0])
+    return indptr.ndim == 1 and indptr.shape[0] == n_users + 1
+
+
+def _csr_relevance(y_true: Any, n_users: int, n_items: int) -> tuple:
+    """Validate CSR-style relevance lists and return ``(indptr, indices, grades)``."""
+    if _is_sparse(y_true):
+        csr = y_true.tocsr()
+        if csr.shape != (n_users, n_items):
+            raise ValueError(f"Shape mismatch: {csr.shape} vs {(n_users, n_items)}")
+        if not csr.has_canonical_format:
+            # Repeated entries add up, as in ``csr.toarray()``
+            csr = csr.copy()
+            csr.sum_duplicates()
+        indptr, indices, grades = csr.indptr, csr.indices, csr.data
+    else:
+        indptr = np.asarray(y_true[0])
+        indices = np.asarray(y_true[1])
+        grades = np.asarray(y_true[2]) if len(y_true) == 3 else np.ones(indices.shape[0])
+        if indptr.ndim != 1 or indptr.shape[0] != n_users + 1:
+            raise ValueError(f"indptr must have n_users + 1 = {n_users + 1} entries.")
+        if indptr[0] != 0 or indptr[-1] != indices.shape[0] or np.any(np.diff(indptr) < 0):
+            raise ValueError("indptr must start at 0, be non-decreasing and end at len(indices).")
+        if grades.shape != indices.shape:
+            raise ValueError("indices and relevance grades must have the same length.")
+        if indices.shape[0] and (indices.min() < 0 or indices.max() >= n_items):
+            raise ValueError(f"Item indices must be in [0, {n_items}).")
+        rows = np.repeat(np.arange(n_users), np.diff(indptr))
+        order = np.lexsort((indices, rows))
+        rows, sorted_indices = rows[order], indices[order]
+        if np.any((rows[1:] == rows[:-1]) & (sorted_indices[1:] == sorted_indices[:-1])):
+            raise ValueError("Each relevant item must be listed once per user.")
+    return (
+        np.asarray(indptr, dtype=np.int64),
+        np.asarray(indices, dtype=np.intp),
+        np.asarray(grades, dtype=np.float64),
+    )
+
+
+def _relevance_block(relevance: Any, start: int, stop: int, n_items: int) -> tuple:
+    """
+    Relevance of rows ``start:stop``.
+
+    Returns a dense block (to look up the grades of the ranked items) and
+    the row and grade of each of its positive entries.
+    """
+    if isinstance(relevance, tuple):
+        indptr, indices, grades = relevance
+        lo, hi = indptr[start], indptr[stop]
+        rows = np.repeat(np.arange(stop - start), np.diff(indptr[start : stop + 1]))
+        grades = grades[lo:hi]
+        block = np.zeros((stop - start, n_items))
+        block[rows, indices[lo:hi]] = grades
+    else:
+        block = np.asarray(relevance[start:stop])
+        rows, cols = np.nonzero(block)
+        grades = block[rows, cols].astype(np.float64)
+    if np.any(grades < 0):
+        raise ValueError("Relevance grades must be non-negative.")
+    positive = grades > 0
+    return block, rows[positive], grades[positive]
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores of each row, best first.
+
+    Equal scores are ranked by item index, lowest first, also at the
+    k-th position, so the result does not depend on the partition order.
+    """
+    n_items = scores.shape[1]
+    if k < n_items:
+        top = np.argpartition(scores, n_items - k, axis=1)[:, n_items - k :]
+        threshold = np.take_along_axis(scores, top, axis=1).min(axis=1, keepdims=True)
+        # Rows with more than k scores >= the k-th pick their ties by index
+        tied = np.flatnonzero(np.count_nonzero(scores >= threshold, axis=1) > k)
+        if tied.shape[0]:
+            rows = scores[tied]
+            ties = rows == threshold[tied]
+            missing = k - np.count_nonzero(rows > threshold[tied], axis=1).reshape(-1, 1)
+            selected = (rows > threshold[tied]) | (ties & (np.cumsum(ties, axis=1) <= missing))
+            top[tied] = np.nonzero(selected)[1].reshape(-1, k)
+        top.sort(axis=1)
+    else:
+        top = np.broadcast_to(np.arange(n_items), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1)
+
+
+def _block_metrics(
+    block: np.ndarray,
+    rows: np.ndarray,
+    grades: np.ndarray,
+    scores: np.ndarray,
+    k: int,
+    discounts: np.ndarray,
+) -> tuple:
+    """Per-user precision, recall, NDCG and average precision of one block."""
+    n_rows = scores.shape[0]
+    gains = np.take_along_axis(block, _top_k(scores, k), axis=1).astype(np.float64)
+    hits = gains > 0
+    n_hits = np.count_nonzero(hits, axis=1)
+    n_relevant = np.bincount(rows, minlength=n_rows)
+    has_relevant = n_relevant > 0
+    denominator = np.maximum(n_relevant, 1)
+
+    precision = n_hits / k
+    recall = n_hits / denominator
+
+    # The ideal ranking puts each user's k largest grades first
+    order = np.lexsort((-grades, rows))
+    rows = rows[order]
+    rank = np.arange(rows.shape[0]) - np.searchsorted(rows, rows)
+    keep = rank < k
+    idcg = np.bincount(
+        rows[keep], weights=grades[order][keep] * discounts[rank[keep]], minlength=n_rows
+    )
+    dcg = gains @ discounts
+    ndcg = np.divide(dcg, idcg, out=np.zeros_like(dcg), where=idcg > 0)
+
+    precision_at = np.cumsum(hits, axis=1) / np.arange(1, k + 1)
+    average_precision = (precision_at * hits).sum(axis=1) / np.minimum(denominator, k)
+
+    recall[~has_relevant] = 0.0
+    average_precision[~has_relevant] = 0.0
+    return precision, recall, ndcg, average_precision
+
+
+def get_ranking_metrics(y_true: Any, y_score: Any, k: int = 10) -> dict:
+    """
+    Calculates precision@k, recall@k, NDCG@k and MAP@k for every user.
+
+    Items are ranked by decreasing score; equal scores are ranked by item
+    index. An item is relevant when its grade is positive.
+
+    - precision@k: relevant items in the top k, divided by k.
+    - recall@k: relevant items in the top k, divided by all relevant items.
+    - NDCG@k: DCG of the grades of the top k (linear gain, discount
+      ``1 / log2(rank + 1)``) divided by the DCG of the ideal ranking.
+    - MAP@k: mean over users of the average precision at k, the sum of the
+      precisions at the ranks of the relevant top-k items divided by
+      ``min(k, number of relevant items)``.
+
+    Scores of users without relevant items are 0.0 (except precision), as
+    undefined ratios are in `get_precision` and `get_recall`.
+
+    Parameters
+    ----------
+    y_true : array-like, scipy.sparse matrix or tuple
+        Relevance grades of shape (n_users, n_items), dense or sparse, or
+        CSR-style ragged relevance lists ``(indptr, indices)`` or ``(indptr,
+        indices, grades)``: the relevant items of user ``u`` are
+        ``indices[indptr[u]:indptr[u + 1]]``, each listed once (grade 1
+        unless `grades` is given). A tuple is read as relevance lists only
+        when its first element is 1D with n_users + 1 entries; otherwise
+        it is read as dense rows. Repeated entries of a sparse matrix are
+        summed, as in ``toarray()``.
+    y_score : array-like of shape (n_users, n_items)
+        Predicted scores. A `numpy.memmap` is read block by block.
+    k : int, default=10
+        Cut-off rank, at most n_items.
+
+    Returns
+    -------
+    dict
+        ``"precision"``, ``"recall"``, ``"ndcg"`` and ``"map"``: the means
+        over users. ``"per_user"``: a dict with the same keys mapping to
+        float64 arrays of shape (n_users,).
+
+    Raises
+    ------
+    ValueError
+        If the shapes do not match, there are no users, scores are not
+        finite, grades are negative, a relevance list repeats an item, or
+        `k` is not in ``[1, n_items]``.
+
+    Examples
+    --------
+    >>> from reportrabbit import get_ranking_metrics
+    >>> y_score = [[0.9, 0.1, 0.5, 0.3], [0.2, 0.8, 0.6, 0.4]]
+    >>> y_true = [[1, 0, 0, 1], [0, 0, 1, 0]]
+    >>> out = get_ranking_metrics(y_true, y_score, k=2)
+    >>> out["precision"], out["recall"], out["map"]
+    (0.5, 0.75, 0.5)
+    >>> out["per_user"]["recall"].tolist()
+    [0.5, 1.0]
+    """
+    scores_all = y_score if isinstance(y_score, np.ndarray) else np.asarray(y_score)
+    if scores_all.ndim != 2:
+        raise ValueError("y_score must be a 2D (n_users, n_items) matrix.")
+    n_users, n_items = scores_all.shape
+    if n_users == 0 or n_items == 0:
+        raise ValueError("Input cannot be empty")
+    if isinstance(k, bool) or not isinstance(k, (int, np.integer)) or not 1 <= k <= n_items:
+        raise ValueError(f"k must be a positive integer up to n_items = {n_items}.")
+    k = int(k)
+
+    if _is_sparse(y_true) or _is_csr_tuple(y_true, n_users):
+        relevance = _csr_relevance(y_true, n_users, n_items)
+    else:
+        relevance = y_true if isinstance(y_true, np.ndarray) else np.asarray(y_true)
+        if relevance.shape != scores_all.shape:
+            raise ValueError(f"Shape mismatch: {relevance.shape} vs {scores_all.shape}")
+
+    discounts = 1.0 / np.log2(np.arange(2, k + 2))
+    per_user = {name: np.empty(n_users) for name in RANKING_METRICS}
+    block_rows = max(1, _BLOCK_ELEMENTS // n_items)
+    for start in range(0, n_users, block_rows):
+        stop = min(start + block_rows, n_users)
+        scores = np.asarray(scores_all[start:stop])
+        if scores.dtype.kind != "f":
+            scores = scores.astype(np.float64)
+        if not np.all(np.isfinite(scores)):
+            raise ValueError("Scores must contain only finite values.")
+        block, rows, grades = _relevance_block(relevance, start, stop, n_items)
+        metrics = _block_metrics(block, rows, grades, scores, k, discounts)
+        for name, values in zip(RANKING_METRICS, metrics):
+            per_user[name][start:stop] = values
+
+    result: dict = {name: float(np.mean(values)) for name, values in per_user.items()}
+    result["per_user"] = per_user
+    return result
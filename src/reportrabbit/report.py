@@ -0,0 +1,107 @@
+"""
+A module that computes every regression or classification metric in one call.
+
+The reports summarise the inputs in a single pass with the accumulator
+kernels, instead of calling each ``get_*`` function (and re-validating and
+re-reading the inputs) separately.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from reportrabbit.accumulators import ClassificationAccumulator, RegressionAccumulator
+from reportrabbit.reproducible import ReproducibleRegressionAccumulator
+
+# Peak-memory budgets, as multiples of the input size (see tests/unit/test_peak_memory.py)
+_PEAK_MEMORY_MULTIPLE = {
+    "get_regression_report": 2.75,
+    "get_classification_report": 0.5,
+}
+
+
+def get_regression_report(
+    y_true: Any, y_pred: Any, *, backend: str = "numpy", reproducible: bool = False
+) -> dict:
+    """
+    Compute MAE, MSE, RMSE, MAPE, R and R^2 in a single pass.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        True target values.
+    y_pred : array-like of shape (n_samples,)
+        Predicted target values.
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        ``"numpy"`` uses vectorised NumPy reductions and matches the
+        ``get_*`` functions exactly. ``"jit"`` uses a Numba-compiled loop
+        that reads each value once (results agree to rounding error).
+        ``"auto"`` uses ``"jit"`` when Numba is installed.
+    reproducible : bool, default=False
+        Sum exactly with `ReproducibleRegressionAccumulator`, so the report
+        is bit-identical to any chunked, threaded or sharded evaluation of
+        the same data in this mode (several times slower).
+
+    Returns
+    -------
+    dict
+        Keys ``"mae"``, ``"mse"``, ``"rmse"``, ``"mape"``, ``"r"`` and ``"r2"``.
+        ``"mape"`` is NaN when `y_true` contains zeros, and ``"r"`` is NaN when
+        either input has no variance.
+
+    Raises
+    ------
+    ValueError
+        If the inputs are empty, have different lengths, or are not finite.
+    ImportError
+        If ``backend="jit"`` and Numba is not installed.
+
+    Examples
+    --------
+    >>> from reportrabbit import get_regression_report
+    >>> report = get_regression_report([1.0, 2.0, 3.0], [1.0, 2.0, 4.0], backend="numpy")
+    >>> report["mae"]
+    0.3333333333333333
+    """
+    accumulator_class = ReproducibleRegressionAccumulator if reproducible else RegressionAccumulator
+    acc = accumulator_class(backend=backend)
+    acc.update(y_true, y_pred)
+    return acc.result()
+
+
+def get_classification_report(y_true: Any, y_pred: Any, *, backend: str = "numpy") -> dict:
+    """
+    Compute accuracy, precision, recall and F1 in a single pass.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        True labels. Non-zero labels are treated as positive.
+    y_pred : array-like of shape (n_samples,)
+        Predicted labels.
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        ``"jit"`` counts the confusion matrix in one Numba-compiled loop and
+        requires numeric labels. ``"auto"`` uses it when Numba is installed
+        and the labels are numeric.
+
+    Returns
+    -------
+    dict
+        Keys ``"accuracy"``, ``"precision"``, ``"recall"`` and ``"f1"``.
+
+    Raises
+    ------
+    ValueError
+        If the inputs are empty or have different lengths.
+    ImportError
+        If ``backend="jit"`` and Numba is not installed.
+
+    Examples
+    --------
+    >>> from reportrabbit import get_classification_report
+    >>> get_classification_report([0, 1, 1, 0], [0, 1, 0, 0], backend="numpy")
+    {'accuracy': 0.75, 'precision': 1.0, 'recall': 0.5, 'f1': 0.6666666666666666}
+    """
+    acc = ClassificationAccumulator(backend=backend)
+    acc.update(y_true, y_pred)
+    return acc.result()
@@ -0,0 +1,250 @@
+"""
+A module of regression sums that do not depend on chunking, threads or shards.
+
+Floating-point addition is not associative, so the sums inside the
+accumulators (and therefore MSE, R^2, ...) move by a few ULPs when the same
+data is split into different chunks, threads or shards. The
+`ReproducibleRegressionAccumulator` instead keeps every sum *exactly*, as a
+Python integer in units of 2**-1075 (half the smallest subnormal), and
+rounds only once when a metric is read.
+
+The bits of each term are split into its integer significand and exponent,
+the significands are cut into two halves, and the halves are summed per
+exponent in integer bins (`exact_regression_bins` in `_backend`, with
+``np.bincount`` or a compiled loop). The bins of a block are then folded
+into the Python integers. Products (``y_true**2``, ``y_true * y_pred``, ...)
+are made exact with Dekker's two-product, so the centered second moments of
+R and R^2 are computed without any rounding before the final one.
+"""
+
+from __future__ import annotations
+
+import math
+import warnings
+from fractions import Fraction
+from typing import Any
+
+import numpy as np
+
+from reportrabbit._backend import (
+    EXACT_FIELDS,
+    EXACT_HALF_BITS,
+    _resolve_backend,
+    exact_regression_bins,
+)
+from reportrabbit._iterators import _is_iterator, _paired_blocks
+from reportrabbit.mse_rmse import _to_1d_numeric_array
+
+# Sums are kept in units of 2**-1075, the weight of bin 0
+_SCALE_BITS = 1075
+# Rows binned per kernel call, so that the bins never overflow
+_BLOCK_SIZE = 1 << 20
+
+REPRODUCIBLE_FIELDS = ("n", "n_zero_true", *EXACT_FIELDS)
+
+
+def _bins_to_ints(bins: np.ndarray) -> tuple:
+    """Collapse exponent bins into one exact integer per field."""
+    totals = []
+    for field_bins in bins:
+        total = 0
+        for index in np.flatnonzero(field_bins.any(axis=1)).tolist():
+            high, low = field_bins[index].tolist()
+            total += ((high << EXACT_HALF_BITS) + low) << index
+        totals.append(total)
+    return tuple(totals)
+
+
+def _to_fraction(total: int) -> Fraction:
+    return Fraction(total, 1 << _SCALE_BITS)
+
+
+class ReproducibleRegressionAccumulator:
+    """
+    Regression accumulator whose results do not depend on how the data is split.
+
+    Keeps exact sums of ``y_true``, ``y_pred``, their squares and product,
+    and of the absolute, squared and absolute percentage errors. The error
+    terms of each row are the same float64 values that `get_mae`,
+    `get_mse` and `get_mape` sum; their totals, and all moments, are exact,
+    and each metric is rounded once. Any chunking, thread count, shard
+    layout or merge order therefore gives bit-identical results.
+
+    Parameters
+    ----------
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Kernel used to bin each chunk. ``"jit"`` bins every row in one
+        compiled pass; ``"numpy"`` uses ``np.bincount``.
+        Both give identical results.
+
+    Examples
+    --------
+    >>> from reportrabbit import ReproducibleRegressionAccumulator
+    >>> a = ReproducibleRegressionAccumulator()
+    >>> a.update([0.1, 0.2, 0.3], [0.3, 0.2, 0.1])
+    >>> b = ReproducibleRegressionAccumulator()
+    >>> b.update([0.3], [0.1])
+    >>> b.update([0.1, 0.2], [0.3, 0.2])
+    >>> a.mse() == b.mse(), a.r2() == b.r2()
+    (True, True)
+    """
+
+    _FIELDS = REPRODUCIBLE_FIELDS
+
+    def __init__(self, backend: str = "numpy") -> None:
+        _resolve_backend(backend)
+        self.backend = backend
+        for name in self._FIELDS:
+            setattr(self, name, 0)
+
+    def __repr__(self) -> str:
+        return f"ReproducibleRegressionAccumulator(n={self.n})"
+
+    def update(self, y_true: Any, y_pred: Any) -> None:
+        """
+        Add a chunk of observations.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,) or iterator
+            True target values of the chunk.
+        y_pred : array-like of shape (n_samples,) or iterator
+            Predicted target values of the chunk.
+
+        Raises
+        ------
+        ValueError
+            If the chunk is empty, lengths differ, or values are not finite,
+            and "Inputs are too large to be summed exactly." if a square,
+            product or percentage error overflows float64. The accumulator
+            is left unchanged.
+        """
+        if _is_iterator(y_true) or _is_iterator(y_pred):
+            # Fill a private accumulator, so a failing block leaves this one unchanged
+            chunk = ReproducibleRegressionAccumulator(self.backend)
+            for yt, yp in _paired_blocks(y_true, y_pred, np.float64):
+                chunk.update(yt, yp)
+            self._merge_state(chunk._state())
+            return
+
+        yt = _to_1d_numeric_array(y_true, "y_true")
+        yp = _to_1d_numeric_array(y_pred, "y_pred")
+        if yt.shape[0] != yp.shape[0]:
+            raise ValueError("Input lengths must match.")
+        if not (np.all(np.isfinite(yt)) and np.all(np.isfinite(yp))):
+            raise ValueError("Inputs must contain only finite values.")
+
+        sums = [0] * len(EXACT_FIELDS)
+        for start in range(0, yt.shape[0], _BLOCK_SIZE):
+            stop = start + _BLOCK_SIZE
+            bins = exact_regression_bins(yt[start:stop], yp[start:stop], self.backend)
+            sums = [a + b for a, b in zip(sums, _bins_to_ints(bins))]
+        self._merge_state((yt.shape[0], int(yt.shape[0] - np.count_nonzero(yt)), *sums))
+
+    def merge(
+        self, other: "ReproducibleRegressionAccumulator"
+    ) -> "ReproducibleRegressionAccumulator":
+        """
+        Merge the sums of another accumulator into this one.
+
+        Parameters
+        ----------
+        other : ReproducibleRegressionAccumulator
+            Accumulator built on a disjoint set of observations.
+
+        Returns
+        -------
+        ReproducibleRegressionAccumulator
+            This accumulator, updated in place.
+        """
+        if not isinstance(other, ReproducibleRegressionAccumulator):
+            raise TypeError("Can only merge another ReproducibleRegressionAccumulator.")
+        self._merge_state(other._state())
+        return self
+
+    def _state(self) -> tuple:
+        """Return the exact sums in the order of `REPRODUCIBLE_FIELDS`."""
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def _merge_state(self, state: tuple) -> None:
+        """Add a tuple of exact sums to this accumulator."""
+        for name, value in zip(self._FIELDS, state):
+            setattr(self, name, getattr(self, name) + value)
+
+    def _check_not_empty(self) -> None:
+        if self.n == 0:
+            raise ValueError("Input arrays cannot be empty.")
+
+    def _mean(self, total: int) -> float:
+        self._check_not_empty()
+        return float(_to_fraction(total) / self.n)
+
+    def _comoment(self, sum_xy: int, sum_x: int, sum_y: int) -> Fraction:
+        """Exact ``sum((x - mean_x) * (y - mean_y))``."""
+        return _to_fraction(sum_xy) - _to_fraction(sum_x) * _to_fraction(sum_y) / self.n
+
+    def mae(self) -> float:
+        """Mean Absolute Error, correctly rounded."""
+        return self._mean(self.sum_abs)
+
+    def mse(self) -> float:
+        """Mean Squared Error, correctly rounded."""
+        return self._mean(self.sum_sq)
+
+    def rmse(self) -> float:
+        """Root Mean Squared Error."""
+        return math.sqrt(self.mse())
+
+    def mape(self) -> float:
+        """
+        Mean Absolute Percentage Error, correctly rounded.
+
+        Raises
+        ------
+        ValueError
+            If any observed `y_true` value was zero.
+        """
+        self._check_not_empty()
+        if self.n_zero_true:
+            raise ValueError("MAPE is undefined when y_true contains zero values.")
+        return self._mean(self.sum_ape)
+
+    def r(self) -> float:
+        """Pearson correlation coefficient; NaN when either side has no variance."""
+        self._check_not_empty()
+        m2_true = self._comoment(self.sum_true_sq, self.sum_true, self.sum_true)
+        m2_pred = self._comoment(self.sum_pred_sq, self.sum_pred, self.sum_pred)
+        if m2_true == 0 or m2_pred == 0:
+            return np.nan
+        covariance = self._comoment(self.sum_true_pred, self.sum_true, self.sum_pred)
+        r = float(covariance) / math.sqrt(float(m2_true) * float(m2_pred))
+        return min(max(r, -1.0), 1.0)
+
+    def r2(self) -> float:
+        """Coefficient of determination, following the conventions of `get_r2`."""
+        if self.n < 2:
+            warnings.warn("R^2 is undefined for fewer than 2 data points.")
+            return np.nan
+        m2_true = self._comoment(self.sum_true_sq, self.sum_true, self.sum_true)
+        if m2_true == 0:
+            return 0.0
+        return float(1 - _to_fraction(self.sum_sq) / m2_true)
+
+    def result(self) -> dict:
+        """
+        Return all regression metrics as a dictionary.
+
+        Returns
+        -------
+        dict
+            Keys ``"mae"``, ``"mse"``, ``"rmse"``, ``"mape"``, ``"r"`` and
+            ``"r2"``. ``"mape"`` is NaN when `y_true` contained zeros.
+        """
+        return {
+            "mae": self.mae(),
+            "mse": self.mse(),
+            "rmse": self.rmse(),
+            "mape": np.nan if self.n_zero_true else self.mape(),
+            "r": self.r(),
+            "r2": self.r2(),
+        }
@@ -0,0 +1,256 @@
+"""
+A module that evaluates predictions stored as sharded ``.npy`` files on a process pool.
+
+Each worker summarises one shard pair into the sufficient statistics of a
+`RegressionAccumulator` or `ClassificationAccumulator`. Only those few
+numbers travel back to the parent, which merges them in shard order.
+
+When a single ground-truth file is split across many prediction shards, the
+parent loads it once into `multiprocessing.shared_memory`; workers attach to
+the block and read their slice in place instead of receiving a pickled copy.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from reportrabbit.accumulators import ClassificationAccumulator, RegressionAccumulator
+from reportrabbit.reproducible import ReproducibleRegressionAccumulator
+
+REGRESSION_METRICS = ("mae", "mse", "rmse", "mape", "r", "r2")
+CLASSIFICATION_METRICS = ("accuracy", "precision", "recall", "f1")
+
+
+def _natural_key(path: str) -> list:
+    """Sort key that orders ``shard_2`` before ``shard_10``."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", path)]
+
+
+def _expand(pattern: str, name: str) -> list[str]:
+    """Paths matching a glob pattern, in natural order."""
+    paths = sorted(glob.glob(pattern), key=_natural_key)
+    if not paths:
+        raise ValueError(f"{name} matched no files: {pattern!r}")
+    return paths
+
+
+def _shard_length(path: str) -> int:
+    """Number of samples in a ``.npy`` shard, read from its header only."""
+    return int(np.load(path, mmap_mode="r").shape[0])
+
+
+def _accumulator_class(metrics: Sequence[str], reproducible: bool = False) -> type:
+    """Accumulator that produces all requested metrics."""
+    if all(name in REGRESSION_METRICS for name in metrics):
+        return ReproducibleRegressionAccumulator if reproducible else RegressionAccumulator
+    if all(name in CLASSIFICATION_METRICS for name in metrics):
+        return ClassificationAccumulator
+    raise ValueError(
+        f"metrics must all be regression metrics {REGRESSION_METRICS} "
+        f"or all classification metrics {CLASSIFICATION_METRICS}."
+    )
+
+
+def _start_worker(accumulator_class: type, backend: str) -> None:
+    """
+    Worker initializer: load the backend before any shard is timed.
+
+    For the compiled backend this imports Numba and loads (or compiles) the
+    float64 kernels once per process, instead of inside the first shard.
+    """
+    accumulator_class(backend=backend).update(np.zeros(1), np.zeros(1))
+
+
+def _evaluate_shard(task: tuple) -> tuple:
+    """
+    Worker: summarise one shard pair.
+
+    `task` is ``(accumulator_class, backend, true_source, pred_path)`` where
+    `true_source` is either a ``.npy`` path or a ``(name, length, dtype,
+    start, stop)`` slice of a shared-memory block.
+
+    Returns the accumulator state, the worker pid, the number of samples and
+    the elapsed seconds. An empty shard returns the state of an empty
+    accumulator.
+    """
+    accumulator_class, backend, true_source, pred_path = task
+    start_time = time.perf_counter()
+    acc = accumulator_class(backend=backend)
+    y_pred = np.load(pred_path, mmap_mode="r")
+
+    if y_pred.shape[0] == 0:
+        return acc._state(), os.getpid(), 0, time.perf_counter() - start_time
+
+    if isinstance(true_source, str):
+        acc.update(np.load(true_source, mmap_mode="r"), y_pred)
+    else:
+        name, length, dtype, start, stop = true_source
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            y_true = np.ndarray((length,), dtype=dtype, buffer=shm.buf)
+            acc.update(y_true[start:stop], y_pred)
+            del y_true  # release the buffer export before closing
+        finally:
+            shm.close()
+
+    return acc._state(), os.getpid(), int(y_pred.shape[0]), time.perf_counter() - start_time
+
+
+def evaluate_shards(
+    pattern_true: str,
+    pattern_pred: str,
+    metrics: Union[str, Sequence[str]],
+    *,
+    max_workers: Optional[int] = None,
+    backend: str = "numpy",
+    reproducible: bool = False,
+) -> dict:
+    """
+    Evaluate sharded ``.npy`` predictions on a process pool.
+
+    Shards are matched in natural filename order (``part_2`` before
+    ``part_10``). Either both patterns match the same number of shards,
+    which are paired one to one, or `pattern_true` matches a single file
+    that is split across the prediction shards in order. In the second case
+    the ground truth is placed in shared memory once and every worker reads
+    its slice from there. Empty shards are skipped.
+
+    Parameters
+    ----------
+    pattern_true : str
+        Glob pattern (or path) of the ground-truth ``.npy`` file(s).
+    pattern_pred : str
+        Glob pattern of the prediction ``.npy`` shards.
+    metrics : str or sequence of str
+        Metrics to report: regression metrics (``"mae"``, ``"mse"``,
+        ``"rmse"``, ``"mape"``, ``"r"``, ``"r2"``) or classification metrics
+        (``"accuracy"``, ``"precision"``, ``"recall"``, ``"f1"``), not both.
+    max_workers : int, optional
+        Number of worker processes; defaults to the number of CPUs.
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Accumulator kernel used by the workers. With ``"jit"`` (or
+        ``"auto"``) each worker loads Numba and its kernels once, when it
+        starts, so this is not counted in the per-worker busy time.
+    reproducible : bool, default=False
+        Sum regression metrics exactly with
+        `ReproducibleRegressionAccumulator`, so the result does not depend
+        on how the data is split into shards. Classification counts are
+        always exact.
+
+    Returns
+    -------
+    dict
+        ``"metrics"``: the requested metrics over all shards.
+        ``"n_samples"`` and ``"n_shards"``: totals.
+        ``"workers"``: one dict per worker process with ``"pid"``,
+        ``"n_shards"``, ``"n_samples"``, ``"seconds"`` (busy time) and
+        ``"samples_per_second"``.
+
+    Raises
+    ------
+    ValueError
+        If a pattern matches no files, the shard counts or lengths do not
+        line up, every shard is empty, or the metrics are unknown or mixed.
+
+    Examples
+    --------
+    >>> import numpy as np, tempfile, os
+    >>> from reportrabbit import evaluate_shards
+    >>> tmp = tempfile.mkdtemp()
+    >>> np.save(os.path.join(tmp, "y_true.npy"), np.arange(1.0, 7.0))
+    >>> np.save(os.path.join(tmp, "pred_0.npy"), np.array([1.0, 2.0, 3.0]))
+    >>> np.save(os.path.join(tmp, "pred_1.npy"), np.array([4.0, 5.0, 7.0]))
+    >>> out = evaluate_shards(
+    ...     os.path.join(tmp, "y_true.npy"), os.path.join(tmp, "pred_*.npy"), ["mae"],
+    ...     max_workers=2, backend="numpy",
+    ... )
+    >>> out["metrics"], out["n_shards"]
+    ({'mae': 0.16666666666666666}, 2)
+    """
+    metrics = [metrics] if isinstance(metrics, str) else list(metrics)
+    if not metrics:
+        raise ValueError("metrics must name at least one metric.")
+    accumulator_class = _accumulator_class(metrics, reproducible)
+    accumulator_class(backend=backend)  # validate the backend before starting workers
+
+    true_paths = _expand(pattern_true, "pattern_true")
+    pred_paths = _expand(pattern_pred, "pattern_pred")
+    pred_lengths = [_shard_length(path) for path in pred_paths]
+
+    shm = None
+    try:
+        if len(true_paths) == len(pred_paths):
+            for true_path, pred_path, length in zip(true_paths, pred_paths, pred_lengths):
+                if _shard_length(true_path) != length:
+                    raise ValueError(f"Shard lengths differ: {true_path} vs {pred_path}")
+            true_sources = true_paths
+        elif len(true_paths) == 1:
+            y_true = np.load(true_paths[0], mmap_mode="r")
+            if y_true.ndim != 1 or y_true.shape[0] != sum(pred_lengths):
+                raise ValueError(
+                    f"The prediction shards hold {sum(pred_lengths)} samples, "
+                    f"but {true_paths[0]} has shape {y_true.shape}."
+                )
+            shm = shared_memory.SharedMemory(create=True, size=max(y_true.nbytes, 1))
+            shared = np.ndarray(y_true.shape, dtype=y_true.dtype, buffer=shm.buf)
+            shared[:] = y_true
+            del shared
+            bounds = np.concatenate([[0], np.cumsum(pred_lengths)])
+            true_sources = [
+                (shm.name, y_true.shape[0], y_true.dtype.str, int(start), int(stop))
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+        else:
+            raise ValueError(
+                f"pattern_true matched {len(true_paths)} files and pattern_pred matched "
+                f"{len(pred_paths)}; expected equal counts or a single ground-truth file."
+            )
+
+        tasks = [
+            (accumulator_class, backend, source, pred_path)
+            for source, pred_path in zip(true_sources, pred_paths)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_start_worker,
+            initargs=(accumulator_class, backend),
+        ) as executor:
+            results = list(executor.map(_evaluate_shard, tasks))
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    # Merge in shard order so the result does not depend on scheduling
+    acc = accumulator_class(backend=backend)
+    workers: dict[int, dict] = {}
+    for state, pid, n_samples, seconds in results:
+        acc._merge_state(state)
+        worker = workers.setdefault(
+            pid, {"pid": pid, "n_shards": 0, "n_samples": 0, "seconds": 0.0}
+        )
+        worker["n_shards"] += 1
+        worker["n_samples"] += n_samples
+        worker["seconds"] += seconds
+
+    for worker in workers.values():
+        seconds = worker["seconds"]
+        worker["samples_per_second"] = worker["n_samples"] / seconds if seconds > 0 else np.inf
+
+    if acc.n == 0:
+        raise ValueError("Input cannot be empty: every prediction shard is empty.")
+    report = acc.result()
+    return {
+        "metrics": {name: report[name] for name in metrics},
+        "n_samples": acc.n,
+        "n_shards": len(pred_paths),
+        "workers": sorted(workers.values(), key=lambda worker: worker["pid"]),
+    }
@@ -0,0 +1,188 @@
+"""
+A module of accumulators that many threads can update at the same time.
+
+Each thread that calls ``update`` gets its own slot: a private accumulator
+that only that thread mutates, and the last state it published (an
+immutable tuple, replaced with a single reference assignment). Updates
+therefore never wait for each other; the chunk statistics are computed by
+the same kernels as the single-threaded accumulators, which release the GIL
+for NumPy reductions and compiled loops.
+
+``snapshot`` merges the published states of all slots into a regular
+accumulator. Each update is either fully included or not at all, and every
+update that completed before ``snapshot`` was called is included. Slots of
+threads that have exited are folded into a retired state, so thread pools
+that replace their workers do not grow the registry without bound.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional
+
+from reportrabbit._backend import _resolve_backend
+from reportrabbit.accumulators import ClassificationAccumulator, RegressionAccumulator
+from reportrabbit.reproducible import ReproducibleRegressionAccumulator
+
+
+class _Slot:
+    """Per-thread partial state."""
+
+    __slots__ = ("owner", "accumulator", "state")
+
+    def __init__(self, accumulator: Any) -> None:
+        self.owner = threading.current_thread()
+        self.accumulator = accumulator
+        self.state = accumulator._state()
+
+
+class _ConcurrentAccumulator:
+    """Shared machinery of the concurrent accumulators."""
+
+    _ACCUMULATOR: type
+
+    def __init__(self, backend: str = "numpy") -> None:
+        _resolve_backend(backend)
+        self.backend = backend
+        self._local = threading.local()
+        self._registry_lock = threading.Lock()
+        self._slots: list[_Slot] = []
+        self._retired: Optional[tuple] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(n_threads={len(self._slots)}, backend={self.backend!r})"
+        )
+
+    def _slot(self) -> _Slot:
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            slot = _Slot(self._ACCUMULATOR(backend=self.backend))
+            with self._registry_lock:
+                self._slots.append(slot)
+            self._local.slot = slot
+        return slot
+
+    def update(self, y_true: Any, y_pred: Any) -> None:
+        """
+        Add a chunk of observations from the calling thread.
+
+        Never blocks on other threads' updates. Accepts the same inputs as
+        the ``update`` method of the matching single-threaded accumulator and
+        raises the same errors; a chunk that raises is not recorded.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,) or iterator
+            True values or labels of the chunk.
+        y_pred : array-like of shape (n_samples,) or iterator
+            Predicted values or labels of the chunk.
+        """
+        slot = self._slot()
+        # A chunk (or an iterator that fails midway) is summarised into its
+        # own accumulator first, so a chunk that raises leaves the slot intact
+        chunk = self._ACCUMULATOR(backend=self.backend)
+        chunk.update(y_true, y_pred)
+        slot.accumulator._merge_state(chunk._state())
+        slot.state = slot.accumulator._state()
+
+    def snapshot(self) -> Any:
+        """
+        Merge the updates of all threads into a new single-threaded accumulator.
+
+        Returns
+        -------
+        RegressionAccumulator or ClassificationAccumulator
+            A fresh accumulator holding every update completed before this
+            call (and possibly some that completed during it). Later updates
+            do not change it.
+        """
+        merged = self._ACCUMULATOR(backend=self.backend)
+        with self._registry_lock:
+            live = []
+            for slot in self._slots:
+                if slot.owner.is_alive():
+                    live.append(slot)
+                else:
+                    # The owner cannot update again, so its state is final
+                    retired = self._ACCUMULATOR(backend=self.backend)
+                    if self._retired is not None:
+                        retired._merge_state(self._retired)
+                    retired._merge_state(slot.state)
+                    self._retired = retired._state()
+            self._slots = live
+            states = [slot.state for slot in live]
+            if self._retired is not None:
+                states.insert(0, self._retired)
+        for state in states:
+            merged._merge_state(state)
+        return merged
+
+    def result(self) -> dict:
+        """Return all metrics of the current snapshot as a dictionary."""
+        return self.snapshot().result()
+
+
+class ConcurrentRegressionAccumulator(_ConcurrentAccumulator):
+    """
+    A `RegressionAccumulator` that many threads can update without locking.
+
+    Every thread accumulates into its own partial state; `snapshot` merges
+    them lazily when the metrics are read.
+
+    Parameters
+    ----------
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Kernel used to summarise each chunk, as in `RegressionAccumulator`.
+    reproducible : bool, default=False
+        Keep exact per-thread sums with `ReproducibleRegressionAccumulator`,
+        so the metrics do not depend on how chunks were spread over threads.
+
+    Examples
+    --------
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from reportrabbit import ConcurrentRegressionAccumulator
+    >>> acc = ConcurrentRegressionAccumulator(backend="numpy")
+    >>> with ThreadPoolExecutor(4) as pool:
+    ...     _ = list(pool.map(lambda i: acc.update([float(i)], [i + 0.5]), range(100)))
+    >>> acc.snapshot().mae()
+    0.5
+    """
+
+    _ACCUMULATOR = RegressionAccumulator
+
+    def __init__(self, backend: str = "numpy", *, reproducible: bool = False) -> None:
+        super().__init__(backend)
+        if reproducible:
+            self._ACCUMULATOR = ReproducibleRegressionAccumulator
+
+
+class ConcurrentClassificationAccumulator(_ConcurrentAccumulator):
+    """
+    A `ClassificationAccumulator` that many threads can update without locking.
+
+    Every thread accumulates into its own partial counts; `snapshot` sums
+    them lazily when the metrics are read.
+
+    Parameters
+    ----------
+    backend : {"auto", "numpy", "jit"}, default="numpy"
+        Kernel used to count each chunk, as in `ClassificationAccumulator`.
+
+    Examples
+    --------
+    >>> import threading
+    >>> from reportrabbit import ConcurrentClassificationAccumulator
+    >>> acc = ConcurrentClassificationAccumulator(backend="numpy")
+    >>> threads = [
+    ...     threading.Thread(target=acc.update, args=([1, 0, 1], [1, 0, 0])) for _ in range(8)
+    ... ]
+    >>> for t in threads:
+    ...     t.start()
+    >>> for t in threads:
+    ...     t.join()
+    >>> acc.snapshot().recall()
+    0.5
+    """
+
+    _ACCUMULATOR = ClassificationAccumulator
@@ -0,0 +1,105 @@
+"""
+A module that provides preallocated scratch buffers for repeated metric evaluations.
+
+Metrics such as `get_mse`, `get_mae`, `get_mape` and `get_r2` normally allocate
+several temporary arrays the size of the input on every call. Passing a
+`MetricWorkspace` lets them write those intermediate results into buffers that
+are allocated once and reused across calls.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+class MetricWorkspace:
+    """
+    Preallocated scratch buffers for repeated metric evaluations.
+
+    A workspace owns one residual buffer and one boolean mask buffer of
+    length `n`. Metrics that accept a ``workspace`` argument
+    compute with ``out=`` ufunc calls into these buffers, so evaluating inputs
+    of length ``<= n`` in steady state does not allocate new arrays.
+
+    Parameters
+    ----------
+    n : int
+        Capacity of the workspace (the largest batch size it can evaluate).
+    dtype : data-type, optional
+        Floating point type used for the buffers and the computation.
+        Inputs already stored in this dtype are used without copying.
+        Defaults to ``numpy.float64``.
+
+    Raises
+    ------
+    ValueError
+        If `n` is not a positive integer or `dtype` is not a floating point type.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from reportrabbit import MetricWorkspace, get_mae
+    >>> ws = MetricWorkspace(3)
+    >>> get_mae(np.array([1.0, 2.0, 3.0]), np.array([2.0, 2.0, 4.0]), workspace=ws)
+    0.6666666666666666
+    """
+
+    def __init__(self, n: int, dtype: Any = np.float64) -> None:
+        if isinstance(n, bool) or not isinstance(n, (int, np.integer)) or n < 1:
+            raise ValueError("n must be a positive integer.")
+        dtype = np.dtype(dtype)
+        if dtype.kind != "f":
+            raise ValueError("dtype must be a floating point type.")
+
+        self.n = int(n)
+        self.dtype = dtype
+        self.residual = np.empty(self.n, dtype=dtype)
+        self.mask = np.empty(self.n, dtype=bool)
+
+    def __repr__(self) -> str:
+        return f"MetricWorkspace(n={self.n}, dtype={self.dtype.name})"
+
+    def _views(self, size: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return views of the buffers sized for an input of `size` elements.
+
+        Parameters
+        ----------
+        size : int
+            Number of elements of the input being evaluated.
+
+        Returns
+        -------
+        residual, mask : numpy.ndarray
+            Views of length `size` into the workspace buffers.
+
+        Raises
+        ------
+        ValueError
+            If `size` exceeds the workspace capacity.
+        """
+        if size > self.n:
+            raise ValueError(
+                f"Input of size {size} does not fit in a workspace of size {self.n}."
+            )
+        return self.residual[:size], self.mask[:size]
+
+    def _all_finite(self, arr: np.ndarray) -> bool:
+        """
+        Check that a 1D array contains only finite values using the mask buffer.
+
+        Parameters
+        ----------
+        arr : numpy.ndarray
+            1D array to check.
+
+        Returns
+        -------
+        bool
+            True if every element of `arr` is finite.
+        """
+        mask = self._views(arr.shape[0])[1]
+        np.isfinite(arr, out=mask)
+        return bool(mask.all())
@@ -0,0 +1,101 @@
+"""
+A test module that tests RegressionAccumulator and ClassificationAccumulator.
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import (
+    ClassificationAccumulator,
+    RegressionAccumulator,
+    get_classification_report,
+    get_regression_report,
+)
+
+
+def test_regression_chunks_match_single_pass():
+    """Test: updating in chunks gives the same metrics as one pass."""
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(5.0, 2.0, 999)
+    y_pred = y_true + rng.normal(0.0, 0.5, 999)
+
+    acc = RegressionAccumulator(backend="numpy")
+    for start in range(0, 999, 100):
+        acc.update(y_true[start : start + 100], y_pred[start : start + 100])
+
+    expected = get_regression_report(y_true, y_pred, backend="numpy")
+    for key, value in acc.result().items():
+        assert value == pytest.approx(expected[key], rel=1e-12)
+
+
+def test_regression_merge_matches_single_pass():
+    """Test: merging accumulators from two shards equals one accumulator."""
+    y_true = np.arange(1.0, 11.0)
+    y_pred = y_true[::-1].copy()
+
+    left = RegressionAccumulator(backend="numpy")
+    right = RegressionAccumulator(backend="numpy")
+    left.update(y_true[:3], y_pred[:3])
+    right.update(y_true[3:], y_pred[3:])
+    left.merge(right)
+
+    assert left.n == 10
+    assert left.r() == pytest.approx(-1.0)
+    assert left.mae() == pytest.approx(np.mean(np.abs(y_true - y_pred)))
+
+
+def test_regression_single_chunk_is_exact():
+    """Test: the first merged chunk is stored without rounding."""
+    acc = RegressionAccumulator(backend="numpy")
+    acc.update([0.1, 0.2, 0.7], [0.3, 0.2, 0.1])
+    assert acc.mean_true == np.mean([0.1, 0.2, 0.7])
+
+
+def test_regression_empty_accumulator_raises():
+    """Test: asking for a metric before any update raises ValueError."""
+    with pytest.raises(ValueError, match="empty"):
+        RegressionAccumulator(backend="numpy").mae()
+
+
+def test_regression_r2_warns_below_two_points():
+    """Test: R^2 follows get_r2 and warns for fewer than 2 points."""
+    acc = RegressionAccumulator(backend="numpy")
+    acc.update([1.0], [1.0])
+    with pytest.warns(UserWarning):
+        assert np.isnan(acc.r2())
+
+
+def test_regression_mape_zero_raises():
+    """Test: MAPE raises once a zero target has been seen."""
+    acc = RegressionAccumulator(backend="numpy")
+    acc.update([0.0, 1.0], [1.0, 1.0])
+    with pytest.raises(ValueError, match="zero"):
+        acc.mape()
+
+
+def test_classification_chunks_match_single_pass():
+    """Test: classification counts add up across chunks and merges."""
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 2, 500)
+    y_pred = rng.integers(0, 2, 500)
+
+    first = ClassificationAccumulator(backend="numpy")
+    second = ClassificationAccumulator(backend="numpy")
+    first.update(y_true[:200], y_pred[:200])
+    second.update(y_true[200:], y_pred[200:])
+    first.merge(second)
+
+    assert first.n == first.tp + first.fp + first.fn + first.tn == 500
+    assert first.result() == get_classification_report(y_true, y_pred, backend="numpy")
+
+
+def test_classification_rejects_mismatch():
+    """Test: chunks with different lengths are rejected."""
+    with pytest.raises(ValueError, match="same length"):
+        ClassificationAccumulator(backend="numpy").update([0, 1], [0])
+
+
+def test_merge_type_check():
+    """Test: accumulators of different kinds cannot be merged."""
+    with pytest.raises(TypeError):
+        RegressionAccumulator(backend="numpy").merge(ClassificationAccumulator(backend="numpy"))
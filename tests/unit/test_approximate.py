@@ -0,0 +1,179 @@
+"""
+A test module that tests approximate_metric().
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import approximate_metric, get_accuracy, get_mae, get_mape, get_mse, get_rmse
+
+N = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def regression():
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(100, 10, N)
+    return y_true, y_true + rng.normal(0, 5, N)
+
+
+@pytest.mark.parametrize("metric", [get_mae, get_mse, get_rmse, get_mape])
+def test_interval_contains_exact_value(regression, metric):
+    """Test: the estimate meets the tolerance and its interval covers the exact metric."""
+    y_true, y_pred = regression
+    result = approximate_metric(y_true, y_pred, metric, tolerance=0.01, random_state=1)
+    lower, upper = result["interval"]
+    assert result["converged"]
+    assert result["fraction"] < 0.5
+    assert max(upper - result["estimate"], result["estimate"] - lower) <= 0.01 * result["estimate"]
+    assert lower <= metric(y_true, y_pred) <= upper
+
+
+def test_interval_coverage_matches_confidence(regression):
+    """Test: over many seeds, about `confidence` of the intervals cover the exact value."""
+    y_true, y_pred = regression
+    exact = get_mae(y_true, y_pred)
+    hits = 0
+    for seed in range(100):
+        lower, upper = approximate_metric(
+            y_true, y_pred, "mae", tolerance=0.02, random_state=seed
+        )["interval"]
+        hits += lower <= exact <= upper
+    assert 85 <= hits <= 100
+
+
+def test_accuracy_absolute_tolerance():
+    """Test: accuracy is estimated on labels with an absolute tolerance."""
+    rng = np.random.default_rng(2)
+    y_true = rng.integers(0, 3, N)
+    y_pred = np.where(rng.random(N) < 0.8, y_true, (y_true + 1) % 3)
+    result = approximate_metric(
+        y_true, y_pred, "accuracy", tolerance=0.005, relative=False, confidence=0.999,
+        random_state=0,
+    )
+    lower, upper = result["interval"]
+    assert result["converged"]
+    assert upper - lower <= 0.01
+    assert lower <= get_accuracy(y_true, y_pred) <= upper
+
+
+def test_stratified_sampling_needs_fewer_rows():
+    """Test: sampling within strata of very different error reaches the tolerance sooner."""
+    rng = np.random.default_rng(3)
+    group = np.repeat([0, 1], N // 2)
+    y_true = rng.normal(100, 10, N)
+    y_pred = y_true + rng.normal(0, 1, N) * np.where(group == 0, 1, 20)
+    strata = [np.flatnonzero(group == 0), np.flatnonzero(group == 1)]
+
+    uniform = approximate_metric(y_true, y_pred, "mae", tolerance=0.005, random_state=0)
+    stratified = approximate_metric(
+        y_true, y_pred, "mae", tolerance=0.005, strata=strata, random_state=0
+    )
+    assert stratified["n_sampled"] < uniform["n_sampled"]
+    lower, upper = stratified["interval"]
+    assert lower <= get_mae(y_true, y_pred) <= upper
+
+
+def test_memmap_inputs(regression, tmp_path):
+    """Test: memory-mapped inputs are sampled in place."""
+    y_true, y_pred = regression
+    np.save(tmp_path / "y_true.npy", y_true)
+    np.save(tmp_path / "y_pred.npy", y_pred)
+    mapped = approximate_metric(
+        np.load(tmp_path / "y_true.npy", mmap_mode="r"),
+        np.load(tmp_path / "y_pred.npy", mmap_mode="r"),
+        "mae",
+        random_state=4,
+    )
+    in_memory = approximate_metric(y_true, y_pred, "mae", random_state=4)
+    assert mapped == in_memory
+
+
+def test_small_inputs_are_evaluated_exactly():
+    """Test: when sampling would touch every row, the exact metric is returned."""
+    result = approximate_metric([1.0, 2.0, 3.0], [1.0, 2.0, 4.0], "mse")
+    assert result == {
+        "estimate": get_mse([1.0, 2.0, 3.0], [1.0, 2.0, 4.0]),
+        "interval": (1 / 3, 1 / 3),
+        "fraction": 1.0,
+        "n_sampled": 3,
+        "converged": True,
+    }
+
+
+def test_max_fraction_stops_without_converging(regression):
+    """Test: the sample budget is respected even if the tolerance is not met."""
+    y_true, y_pred = regression
+    result = approximate_metric(
+        y_true, y_pred, "mae", tolerance=1e-6, max_fraction=0.05, random_state=0
+    )
+    assert not result["converged"]
+    assert result["fraction"] <= 0.05 + 1e-6
+
+
+def test_validation():
+    """Test: bad metrics, arguments, strata and sampled values are rejected."""
+    with pytest.raises(ValueError, match="metric"):
+        approximate_metric([1.0], [1.0], "r2")
+    with pytest.raises(ValueError, match="tolerance"):
+        approximate_metric([1.0], [1.0], tolerance=0)
+    with pytest.raises(ValueError, match="confidence"):
+        approximate_metric([1.0], [1.0], confidence=1.0)
+    with pytest.raises(ValueError, match="lengths"):
+        approximate_metric([1.0, 2.0], [1.0])
+    with pytest.raises(ValueError, match="strata"):
+        approximate_metric([1.0, 2.0], [1.0, 2.0], strata=[[0]])
+    # Right total size, but overlapping, out of range or non-integer indices
+    for strata in ([[0], [0]], [[0], [2]], [[-1], [1]], [[0.0], [1.0]]):
+        with pytest.raises(ValueError, match="strata"):
+            approximate_metric([1.0, 2.0], [1.0, 2.0], strata=strata)
+    approximate_metric([1.0, 2.0], [1.0, 2.0], strata=[[1], [], [0]])
+    y_true = np.ones(100_000)
+    y_true[::2] = 0.0
+    with pytest.raises(ValueError, match="zero"):
+        approximate_metric(y_true, np.ones(100_000), "mape", random_state=0)
+
+
+def test_zero_variance_sample_is_not_converged():
+    """Test: a sample that missed every rare large error keeps growing."""
+    y_true = np.zeros(N)
+    y_pred = np.zeros(N)
+    y_pred[:: N // 100] = 5000.0  # MAE 0.5, carried by 0.01% of the rows
+    exact = get_mae(y_true, y_pred)
+    for seed in range(10):
+        result = approximate_metric(y_true, y_pred, "mae", random_state=seed)
+        lower, upper = result["interval"]
+        assert result["estimate"] > 0
+        assert lower <= exact <= upper
+
+    # A budget too small to see any large error cannot converge; pick a
+    # seed whose single round of 10,000 rows misses all of them
+    seed = next(
+        s for s in range(100)
+        if not np.any(y_pred[np.random.default_rng(s).integers(0, N, 10_000)])
+    )
+    result = approximate_metric(y_true, y_pred, "mae", max_fraction=0.01, random_state=seed)
+    assert result["estimate"] == 0.0
+    assert not result["converged"]
+
+
+def test_accuracy_interval_within_unit_range():
+    """Test: the accuracy interval is a Wilson interval clamped to [0, 1]."""
+    y_true = np.zeros(N, dtype=np.int64)
+    y_pred = y_true.copy()
+    y_pred[::5000] = 1  # accuracy 0.9998
+    result = approximate_metric(
+        y_true, y_pred, "accuracy", tolerance=1e-3, random_state=0, initial_size=2000
+    )
+    lower, upper = result["interval"]
+    assert 0.0 <= lower <= result["estimate"] <= upper <= 1.0
+    assert lower <= get_accuracy(y_true, y_pred) <= upper
+
+    # Every sampled prediction right: the interval still has a width below 1
+    perfect = approximate_metric(
+        y_true, y_true, "accuracy", tolerance=1e-6, relative=False, max_fraction=0.01,
+        random_state=0,
+    )
+    lower, upper = perfect["interval"]
+    assert upper == 1.0 and lower < 1.0
+    assert not perfect["converged"]
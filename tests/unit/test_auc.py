@@ -0,0 +1,127 @@
+"""
+A test module that tests get_roc_auc(), get_pr_auc() and ScoreHistogram.
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import ScoreHistogram, get_pr_auc, get_roc_auc
+
+
+def _pairwise_roc_auc(y_true, y_score):
+    """Reference O(n^2) ROC AUC with half credit for ties."""
+    y_true = np.asarray(y_true) != 0
+    y_score = np.asarray(y_score, dtype=float)
+    pos = y_score[y_true][:, None]
+    neg = y_score[~y_true][None, :]
+    return float(np.mean((pos > neg) + 0.5 * (pos == neg)))
+
+
+def _reference_average_precision(y_true, y_score):
+    """Reference AP evaluated threshold by threshold."""
+    y_true = np.asarray(y_true) != 0
+    y_score = np.asarray(y_score, dtype=float)
+    ap, prev_recall = 0.0, 0.0
+    for threshold in np.unique(y_score)[::-1]:
+        predicted = y_score >= threshold
+        tp = np.sum(predicted & y_true)
+        recall = tp / y_true.sum()
+        ap += (recall - prev_recall) * tp / predicted.sum()
+        prev_recall = recall
+    return ap
+
+
+@pytest.fixture
+def scores():
+    """Noisy scores with many ties (rounded to 2 decimals)."""
+    rng = np.random.default_rng(11)
+    y_true = rng.integers(0, 2, 2000)
+    y_score = np.clip(np.round(0.3 * y_true + rng.random(2000) * 0.7, 2), 0.0, 1.0)
+    return y_true, y_score
+
+
+def test_roc_auc_examples():
+    """Test: perfect, inverted and tied rankings."""
+    assert get_roc_auc([0, 0, 1, 1], [0.1, 0.2, 0.8, 0.9]) == 1.0
+    assert get_roc_auc([0, 0, 1, 1], [0.9, 0.8, 0.2, 0.1]) == 0.0
+    assert get_roc_auc([0, 1, 0, 1], [0.5, 0.5, 0.5, 0.5]) == 0.5
+
+
+def test_roc_auc_exact_matches_pairwise(scores):
+    """Test: exact mode equals the O(n^2) pairwise definition, ties included."""
+    y_true, y_score = scores
+    assert get_roc_auc(y_true, y_score) == pytest.approx(_pairwise_roc_auc(y_true, y_score))
+
+
+def test_pr_auc_exact_matches_reference(scores):
+    """Test: exact average precision matches a threshold-by-threshold loop."""
+    y_true, y_score = scores
+    expected = _reference_average_precision(y_true, y_score)
+    assert get_pr_auc(y_true, y_score) == pytest.approx(expected)
+
+
+def test_binned_within_error_bound(scores):
+    """Test: binned AUCs are within their documented error bounds."""
+    y_true, y_score = scores
+    hist = ScoreHistogram(n_bins=16)
+    hist.update(y_true, y_score)
+    assert abs(hist.roc_auc() - get_roc_auc(y_true, y_score)) <= hist.roc_auc_error_bound()
+    assert abs(hist.pr_auc() - get_pr_auc(y_true, y_score)) <= hist.pr_auc_error_bound()
+
+
+def test_binned_is_exact_when_bins_separate_scores(scores):
+    """Test: with one distinct score per bin, binned equals exact."""
+    y_true, y_score = scores
+    exact = get_roc_auc(y_true, y_score)
+    # Scores are multiples of 0.01 on [0, 1]; shift the range so they sit mid-bin
+    binned = get_roc_auc(y_true, y_score, mode="binned", n_bins=101, score_range=(-0.005, 1.005))
+    assert binned == pytest.approx(exact)
+    assert get_pr_auc(
+        y_true, y_score, mode="binned", n_bins=101, score_range=(-0.005, 1.005)
+    ) == pytest.approx(get_pr_auc(y_true, y_score))
+
+
+def test_histogram_merge_equals_single_pass(scores):
+    """Test: merging shard histograms equals one histogram over all data."""
+    y_true, y_score = scores
+    whole = ScoreHistogram(n_bins=64)
+    whole.update(y_true, y_score)
+
+    shards = [ScoreHistogram(n_bins=64) for _ in range(3)]
+    for shard, idx in zip(shards, np.array_split(np.arange(2000), 3)):
+        shard.update(y_true[idx], y_score[idx])
+    merged = shards[0].merge(shards[1]).merge(shards[2])
+
+    np.testing.assert_array_equal(merged.pos, whole.pos)
+    np.testing.assert_array_equal(merged.neg, whole.neg)
+    assert merged.roc_auc() == whole.roc_auc()
+
+
+def test_histogram_merge_requires_same_bins():
+    """Test: histograms with different binning cannot be merged."""
+    with pytest.raises(ValueError, match="n_bins"):
+        ScoreHistogram(n_bins=8).merge(ScoreHistogram(n_bins=16))
+
+
+def test_roc_auc_single_class_raises():
+    """Test: ROC AUC is undefined without both classes."""
+    with pytest.raises(ValueError, match="one class"):
+        get_roc_auc([1, 1, 1], [0.1, 0.2, 0.3])
+
+
+def test_pr_auc_no_positives_raises():
+    """Test: PR AUC is undefined without positives."""
+    with pytest.raises(ValueError, match="no positives"):
+        get_pr_auc([0, 0], [0.1, 0.2])
+
+
+def test_auc_input_validation():
+    """Test: empty, mismatched and non-finite inputs are rejected."""
+    with pytest.raises(ValueError, match="empty"):
+        get_roc_auc([], [])
+    with pytest.raises(ValueError, match="same length"):
+        get_roc_auc([0, 1], [0.5])
+    with pytest.raises(ValueError, match="finite"):
+        get_roc_auc([0, 1], [0.5, np.nan])
+    with pytest.raises(ValueError, match="mode"):
+        get_roc_auc([0, 1], [0.1, 0.9], mode="approx")
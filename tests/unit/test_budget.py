@@ -0,0 +1,173 @@
+"""
+A test module that tests MemoryBudget and the blocked evaluation of the metrics.
+"""
+
+import threading
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from reportrabbit import (
+    MemoryBudget,
+    get_accuracy,
+    get_f1,
+    get_mae,
+    get_mape,
+    get_memory_budget,
+    get_mse,
+    get_mse_rmse,
+    get_precision,
+    get_r,
+    get_r2,
+    get_recall,
+    get_rmse,
+    set_memory_budget,
+)
+
+N = 300_007  # not a multiple of the block length
+SMALL_BUDGET = 400_000  # a few 8192-element blocks for every metric
+
+
+@pytest.fixture(autouse=True)
+def _no_global_budget():
+    yield
+    set_memory_budget(None)
+
+
+def _regression_data(dtype):
+    rng = np.random.default_rng(0)
+    y_true = rng.lognormal(3, 1, N) * rng.choice([-1, 1], N)
+    y_pred = y_true + rng.standard_cauchy(N)
+    if np.issubdtype(dtype, np.integer):
+        return np.round(y_true).astype(dtype) + 1000, np.round(y_pred).astype(dtype)
+    return y_true.astype(dtype), y_pred.astype(dtype)
+
+
+@pytest.mark.parametrize("func", [get_mae, get_mape, get_mse, get_rmse, get_r, get_r2])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+def test_blocked_regression_is_bit_identical(func, dtype):
+    """Test: blocked regression metrics equal the unblocked results exactly."""
+    y_true, y_pred = _regression_data(dtype)
+    expected = func(y_true, y_pred)
+    with MemoryBudget(SMALL_BUDGET) as budget:
+        out = func(y_true, y_pred)
+    assert budget.n_blocked_calls >= 1
+    assert out == expected
+    assert type(out) is type(expected)
+
+
+def test_blocked_weighted_mse_is_bit_identical():
+    """Test: blocked weighted MSE equals np.average exactly."""
+    y_true, y_pred = _regression_data(np.float64)
+    weights = np.random.default_rng(1).random(N)
+    expected = get_mse_rmse(y_true, y_pred, sample_weight=weights)
+    with MemoryBudget(SMALL_BUDGET):
+        assert get_mse_rmse(y_true, y_pred, sample_weight=weights) == expected
+        with pytest.raises(ZeroDivisionError):
+            get_mse(y_true, y_pred, sample_weight=np.zeros(N))
+
+
+@pytest.mark.parametrize("func", [get_accuracy, get_precision, get_recall, get_f1])
+def test_blocked_classification_is_identical(func):
+    """Test: blocked classification counts give the unblocked result."""
+    rng = np.random.default_rng(2)
+    y_true = rng.integers(0, 3, 5 * N)
+    y_pred = rng.integers(0, 3, 5 * N)
+    expected = func(y_true, y_pred)
+    with MemoryBudget(40_000) as budget:
+        assert func(y_true, y_pred) == expected
+    assert budget.n_blocked_calls >= 1
+
+
+def test_blocked_errors_match_unblocked():
+    """Test: validation errors are the same with and without blocking."""
+    y_true, y_pred = _regression_data(np.float64)
+    y_true[10] = 0.0  # zero early, NaN late: the finiteness error still wins
+    y_pred[-1] = np.nan
+    with MemoryBudget(SMALL_BUDGET):
+        with pytest.raises(ValueError, match="finite"):
+            get_mape(y_true, y_pred)
+        with pytest.raises(ValueError, match="finite"):
+            get_mae(y_true, y_pred)
+        y_pred[-1] = 0.0
+        with pytest.raises(ValueError, match="zero"):
+            get_mape(y_true, y_pred)
+        with pytest.raises(ValueError, match="numeric"):
+            get_mse(np.array(["a"] * N), y_pred)
+
+
+def test_plan_is_reported_and_traced_allocations_stay_under_budget():
+    """Test: the reported peak and the traced peak both respect the budget."""
+    y_true, y_pred = _regression_data(np.float32)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        get_mape(y_true, y_pred)
+        unblocked_peak = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.reset_peak()
+        with MemoryBudget(1_000_000) as budget:
+            get_mape(y_true, y_pred)
+        blocked_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert unblocked_peak > 5_000_000
+    assert budget.planned_temp_bytes <= 1_000_000
+    assert blocked_peak < 1_000_000 + 100_000
+
+
+def test_small_calls_run_unblocked_but_are_recorded():
+    """Test: calls that fit are not blocked, but their footprint is still recorded."""
+    with MemoryBudget(10_000) as budget:
+        get_mae([1.0, 2.0, 3.0], [1.0, 2.0, 4.0])
+    assert budget.n_blocked_calls == 0
+    assert budget.planned_temp_bytes == 3 * 32
+
+
+def test_mse_without_budget_coerces_inputs_once():
+    """Test: without a budget get_mse converts each input once, not once per code path."""
+
+    class CountingArray:
+        def __init__(self, values):
+            self.values = np.asarray(values)
+            self.n_conversions = 0
+
+        def __array__(self, dtype=None, copy=None):
+            self.n_conversions += 1
+            return self.values
+
+    y_true = CountingArray([1.0, 2.0, 3.0])
+    y_pred = CountingArray([1.0, 2.0, 4.0])
+    assert get_mse(y_true, y_pred) == pytest.approx(1 / 3)
+    assert (y_true.n_conversions, y_pred.n_conversions) == (1, 1)
+
+
+def test_global_budget_and_nesting():
+    """Test: the innermost context wins, then the global budget; contexts are per thread."""
+    global_budget = set_memory_budget(1_000_000)
+    assert get_memory_budget() is global_budget
+    with MemoryBudget(500_000) as outer:
+        with MemoryBudget(250_000) as inner:
+            assert get_memory_budget() is inner
+        assert get_memory_budget() is outer
+
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(get_memory_budget()))
+        thread.start()
+        thread.join()
+        assert seen == [global_budget]
+    assert get_memory_budget() is global_budget
+    set_memory_budget(None)
+    assert get_memory_budget() is None
+
+
+def test_budget_validation():
+    """Test: non-positive budgets and budgets below one block are rejected."""
+    with pytest.raises(ValueError, match="positive"):
+        MemoryBudget(0)
+    y_true, y_pred = _regression_data(np.float64)
+    with MemoryBudget(1000):
+        with pytest.raises(ValueError, match="too small"):
+            get_mae(y_true, y_pred)
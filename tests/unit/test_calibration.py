@@ -0,0 +1,109 @@
+"""
+A test module that tests CalibrationAccumulator.
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import CalibrationAccumulator
+
+
+def _data(n=50_000, seed=0):
+    rng = np.random.default_rng(seed)
+    score = rng.random(n)
+    y_true = (rng.random(n) < score**1.5).astype(int)  # over-confident model
+    return y_true, score
+
+
+def _reference(y_true, score, n_bins):
+    """ECE, MCE and Brier score computed directly from all the samples."""
+    bins = np.minimum((score * n_bins).astype(int), n_bins - 1)
+    gaps, weights = [], []
+    for b in range(n_bins):
+        in_bin = bins == b
+        if in_bin.any():
+            gaps.append(abs(score[in_bin].mean() - y_true[in_bin].mean()))
+            weights.append(in_bin.mean())
+    return np.dot(gaps, weights), max(gaps), np.mean((score - y_true) ** 2)
+
+
+@pytest.mark.parametrize("n_bins", [1, 10, 15, 100])
+def test_matches_direct_computation(n_bins):
+    """Test: chunked updates give the ECE, MCE and Brier score of the full data."""
+    y_true, score = _data()
+    acc = CalibrationAccumulator(n_bins=n_bins)
+    for start in range(0, len(score), 7919):
+        acc.update(y_true[start:start + 7919], score[start:start + 7919])
+
+    ece, mce, brier = _reference(y_true, score, n_bins)
+    result = acc.result()
+    assert result["ece"] == pytest.approx(ece, abs=1e-12)
+    assert result["mce"] == pytest.approx(mce, abs=1e-12)
+    assert result["brier"] == pytest.approx(brier, abs=1e-12)
+    assert acc.n == len(score)
+
+
+def test_merge_across_shards():
+    """Test: merging shard accumulators equals one accumulator over everything."""
+    y_true, score = _data()
+    whole = CalibrationAccumulator()
+    whole.update(y_true, score)
+
+    shards = [CalibrationAccumulator() for _ in range(4)]
+    for i, shard in enumerate(shards):
+        shard.update(y_true[i::4], score[i::4])
+    merged = shards[0].merge(shards[1]).merge(shards[2]).merge(shards[3])
+
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    np.testing.assert_array_equal(merged.n_positive, whole.n_positive)
+    assert merged.ece() == pytest.approx(whole.ece(), abs=1e-12)
+    assert merged.brier_score() == pytest.approx(whole.brier_score(), abs=1e-12)
+
+
+def test_perfectly_calibrated_bins():
+    """Test: bins whose mean score equals the positive rate have no gap."""
+    acc = CalibrationAccumulator(n_bins=4)
+    acc.update([1, 0, 1, 1], [0.5, 0.5, 1.0, 1.0])
+    assert acc.ece() == 0.0
+    assert acc.mce() == 0.0
+    assert acc.brier_score() == 0.125
+
+
+def test_reliability_arrays():
+    """Test: the reliability diagram has one entry per bin and NaN for empty bins."""
+    acc = CalibrationAccumulator(n_bins=4)
+    acc.update([0, 1, 1, 0], [0.1, 0.2, 0.9, 1.0])
+    diagram = acc.reliability()
+    np.testing.assert_allclose(diagram["bin_edges"], [0.0, 0.25, 0.5, 0.75, 1.0])
+    np.testing.assert_array_equal(diagram["counts"], [2, 0, 0, 2])
+    np.testing.assert_allclose(diagram["mean_score"], [0.15, np.nan, np.nan, 0.95])
+    np.testing.assert_allclose(diagram["fraction_positive"], [0.5, np.nan, np.nan, 0.5])
+
+
+def test_memory_is_independent_of_the_number_of_samples():
+    """Test: the state is O(n_bins) no matter how many samples are added."""
+    acc = CalibrationAccumulator(n_bins=20)
+    y_true, score = _data(n=10_000)
+    for _ in range(10):
+        acc.update(y_true, score)
+    state = [acc.counts, acc.n_positive, acc.sum_score]
+    assert all(a.shape == (20,) for a in state)
+
+
+def test_validation():
+    """Test: bad bins, scores, merges and empty accumulators are rejected."""
+    with pytest.raises(ValueError, match="n_bins"):
+        CalibrationAccumulator(n_bins=0)
+    acc = CalibrationAccumulator()
+    with pytest.raises(ValueError, match="empty"):
+        acc.ece()
+    with pytest.raises(ValueError, match="probabilities"):
+        acc.update([0, 1], [0.5, 1.5])
+    with pytest.raises(ValueError, match="finite"):
+        acc.update([0, 1], [0.5, np.nan])
+    with pytest.raises(ValueError, match="same length"):
+        acc.update([0, 1], [0.5])
+    with pytest.raises(ValueError, match="n_bins"):
+        acc.merge(CalibrationAccumulator(n_bins=3))
+    with pytest.raises(TypeError):
+        acc.merge(object())
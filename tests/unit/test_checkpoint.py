@@ -0,0 +1,139 @@
+"""
+A test module that tests save_checkpoint() and load_checkpoint().
+"""
+
+import os
+import struct
+
+import numpy as np
+import pytest
+
+from reportrabbit import (
+    ClassificationAccumulator,
+    RegressionAccumulator,
+    ReproducibleRegressionAccumulator,
+    load_checkpoint,
+    save_checkpoint,
+)
+from reportrabbit.checkpoint import CHECKPOINT_VERSION
+
+CHUNK = 997
+
+
+def _stream(kind, n=20_000):
+    rng = np.random.default_rng(0)
+    if kind is RegressionAccumulator:
+        y_true = rng.normal(0, 10, n)
+        y_true[::50] = 0.0  # exercise the n_zero_true counter
+        return y_true, y_true + rng.standard_t(3, n)
+    return rng.integers(0, 3, n), rng.integers(0, 3, n)
+
+
+@pytest.mark.parametrize("kind", [RegressionAccumulator, ClassificationAccumulator])
+def test_resume_is_bit_identical(kind, tmp_path):
+    """Test: a run interrupted and resumed from a checkpoint matches an uninterrupted run."""
+    y_true, y_pred = _stream(kind)
+    path = tmp_path / "eval.ckpt"
+
+    uninterrupted = kind(backend="numpy")
+    for start in range(0, len(y_true), CHUNK):
+        uninterrupted.update(y_true[start:start + CHUNK], y_pred[start:start + CHUNK])
+
+    acc = kind(backend="numpy")
+    for start in range(0, 9 * CHUNK, CHUNK):
+        acc.update(y_true[start:start + CHUNK], y_pred[start:start + CHUNK])
+        save_checkpoint(path, acc, cursor=start + CHUNK, durable=False)
+    del acc  # "preempted"
+
+    resumed, cursor = load_checkpoint(path)
+    assert cursor == 9 * CHUNK
+    for start in range(cursor, len(y_true), CHUNK):
+        resumed.update(y_true[start:start + CHUNK], y_pred[start:start + CHUNK])
+
+    assert resumed._state() == uninterrupted._state()
+    np.testing.assert_equal(resumed.result(), uninterrupted.result())
+
+
+def test_checkpoint_is_small_and_replaced_atomically(tmp_path):
+    """Test: the file is a few dozen bytes and no temporary file is left behind."""
+    acc = RegressionAccumulator(backend="numpy")
+    acc.update([1.0, 2.0, 3.0], [1.0, 2.5, 2.0])
+    path = tmp_path / "eval.ckpt"
+    save_checkpoint(path, acc, cursor=3)
+    save_checkpoint(path, acc, cursor=3)
+    assert os.listdir(tmp_path) == ["eval.ckpt"]
+    assert path.stat().st_size < 128
+
+
+def test_backend_is_restored_or_overridden(tmp_path):
+    """Test: the saved backend is restored unless another one is requested."""
+    acc = ClassificationAccumulator(backend="numpy")
+    acc.update([0, 1], [1, 1])
+    save_checkpoint(tmp_path / "c.ckpt", acc)
+    assert load_checkpoint(tmp_path / "c.ckpt")[0].backend == "numpy"
+    assert load_checkpoint(tmp_path / "c.ckpt", backend="auto")[0].backend == "auto"
+
+
+def test_corrupt_and_foreign_files_are_rejected(tmp_path):
+    """Test: bad magic, version, size and checksum are all detected."""
+    acc = RegressionAccumulator(backend="numpy")
+    acc.update([1.0, 2.0], [1.0, 3.0])
+    path = tmp_path / "eval.ckpt"
+    save_checkpoint(path, acc)
+    data = bytearray(path.read_bytes())
+
+    (tmp_path / "foreign").write_bytes(b"not a checkpoint at all, just text")
+    with pytest.raises(ValueError, match="not a reportrabbit checkpoint"):
+        load_checkpoint(tmp_path / "foreign")
+
+    flipped = bytearray(data)
+    flipped[30] ^= 0x01
+    (tmp_path / "flipped").write_bytes(flipped)
+    with pytest.raises(ValueError, match="corrupt"):
+        load_checkpoint(tmp_path / "flipped")
+
+    (tmp_path / "truncated").write_bytes(data[:-3])
+    with pytest.raises(ValueError, match="corrupt"):
+        load_checkpoint(tmp_path / "truncated")
+
+    future = bytearray(data)
+    struct.pack_into("<H", future, 4, CHECKPOINT_VERSION + 1)
+    (tmp_path / "future").write_bytes(future)
+    with pytest.raises(ValueError, match="version"):
+        load_checkpoint(tmp_path / "future")
+
+
+def test_save_validation(tmp_path):
+    """Test: unsupported objects and negative cursors are rejected."""
+    with pytest.raises(TypeError, match="accumulator"):
+        save_checkpoint(tmp_path / "x.ckpt", object())
+    with pytest.raises(ValueError, match="cursor"):
+        save_checkpoint(tmp_path / "x.ckpt", RegressionAccumulator(backend="numpy"), cursor=-1)
+
+
+def test_reproducible_accumulator_resumes_exactly(tmp_path):
+    """Test: exact integer sums round-trip and a resumed run matches bit for bit."""
+    y_true, y_pred = _stream(RegressionAccumulator)
+    y_pred[:10] = -1e12  # negative and large sums
+    path = tmp_path / "exact.ckpt"
+
+    uninterrupted = ReproducibleRegressionAccumulator(backend="numpy")
+    uninterrupted.update(y_true, y_pred)
+
+    acc = ReproducibleRegressionAccumulator(backend="numpy")
+    acc.update(y_true[:5 * CHUNK], y_pred[:5 * CHUNK])
+    save_checkpoint(path, acc, cursor=5 * CHUNK, durable=False)
+    resumed, cursor = load_checkpoint(path)
+    assert type(resumed) is ReproducibleRegressionAccumulator
+    assert resumed._state() == acc._state()
+    for start in range(cursor, len(y_true), CHUNK):
+        resumed.update(y_true[start:start + CHUNK], y_pred[start:start + CHUNK])
+    assert resumed._state() == uninterrupted._state()
+    np.testing.assert_equal(resumed.result(), uninterrupted.result())
+
+    data = path.read_bytes()
+    (tmp_path / "truncated").write_bytes(data[:-3])
+    with pytest.raises(ValueError, match="corrupt"):
+        load_checkpoint(tmp_path / "truncated")
+    save_checkpoint(path, ReproducibleRegressionAccumulator(), durable=False)
+    assert load_checkpoint(path)[0]._state() == ReproducibleRegressionAccumulator()._state()
@@ -0,0 +1,123 @@
+"""
+A test module that tests compare_models().
+"""
+
+import numpy as np
+import pytest
+
+import reportrabbit.compare as compare_module
+from reportrabbit import (
+    compare_models,
+    get_accuracy,
+    get_f1,
+    get_mae,
+    get_mape,
+    get_mse,
+    get_precision,
+    get_r,
+    get_r2,
+    get_recall,
+    get_rmse,
+)
+
+REGRESSION = [get_mae, get_mse, get_rmse, get_mape, get_r, get_r2]
+CLASSIFICATION = [get_accuracy, get_precision, get_recall, get_f1]
+HIGHER_IS_BETTER = {get_r, get_r2, get_accuracy, get_precision, get_recall, get_f1}
+
+
+def _data(func, n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    if func in CLASSIFICATION:
+        y_true = rng.integers(0, 3, n)
+        return y_true, np.where(rng.random(n) < 0.7, y_true, 0), rng.integers(0, 3, n)
+    y_true = rng.normal(10, 2, n)
+    return y_true, y_true + rng.normal(0, 1, n), y_true + rng.normal(0.3, 1.5, n)
+
+
+@pytest.mark.parametrize("func", REGRESSION + CLASSIFICATION)
+def test_observed_scores_match_metrics(func):
+    """Test: the observed scores equal the get_* functions."""
+    y_true, pred_a, pred_b = _data(func)
+    result = compare_models(y_true, pred_a, pred_b, func, n_permutations=10, random_state=0)
+    assert result["metric_a"] == pytest.approx(func(y_true, pred_a))
+    assert result["metric_b"] == pytest.approx(func(y_true, pred_b))
+
+
+@pytest.mark.parametrize("func", REGRESSION + CLASSIFICATION)
+@pytest.mark.parametrize("alternative", ["greater", "two-sided"])
+def test_p_value_matches_metric_loop(func, alternative, monkeypatch):
+    """Test: the vectorised permutations equal re-running the metric per permutation."""
+    monkeypatch.setattr(compare_module, "_BLOCK_ELEMENTS", 400)  # 10 permutations per block
+    y_true, pred_a, pred_b = _data(func, seed=3)
+    result = compare_models(
+        y_true, pred_a, pred_b, func, n_permutations=200, alternative=alternative, random_state=7
+    )
+
+    # Rebuild the masks block by block exactly as compare_models draws them
+    rng = np.random.default_rng(7)
+    masks = np.vstack([compare_module._swap_masks(rng, 10, 40, float) for _ in range(20)])
+    sign = 1 if func in HIGHER_IS_BETTER else -1
+    permuted = []
+    for swap in masks != 0:
+        a = np.where(swap, pred_b, pred_a)
+        b = np.where(swap, pred_a, pred_b)
+        permuted.append(sign * (func(y_true, b) - func(y_true, a)))
+    permuted = np.array(permuted)
+    observed = result["difference"]
+    if alternative == "greater":
+        extreme = permuted >= observed - 1e-12
+    else:
+        extreme = np.abs(permuted) >= abs(observed) - 1e-12
+    assert result["p_value"] == pytest.approx((extreme.sum() + 1) / 201)
+
+
+def test_clearly_better_model_is_significant():
+    """Test: a much better model B gets a small p-value, and the reverse does not."""
+    y_true, pred_a, _ = _data(get_mae, n=200)
+    pred_b = y_true + np.random.default_rng(1).normal(0, 0.1, 200)
+    better = compare_models(y_true, pred_a, pred_b, "rmse", n_permutations=2000, random_state=0)
+    worse = compare_models(y_true, pred_b, pred_a, "rmse", n_permutations=2000, random_state=0)
+    assert better["difference"] > 0
+    assert better["p_value"] == pytest.approx(1 / 2001)
+    assert worse["p_value"] == 1.0
+
+
+def test_identical_models_have_p_value_one():
+    """Test: swapping identical predictions never changes the difference."""
+    y_true, pred_a, _ = _data(get_f1)
+    result = compare_models(y_true, pred_a, pred_a, "f1", n_permutations=50)
+    assert result["difference"] == 0.0
+    assert result["p_value"] == 1.0
+
+
+@pytest.mark.parametrize("func", REGRESSION + CLASSIFICATION)
+def test_rounded_ties_are_counted(func, monkeypatch):
+    """Test: permutations that tie the observed statistic up to rounding count as extreme."""
+    # Swapping every sample gives exactly minus the observed difference, but
+    # computed from totals that differ in the last bits
+    monkeypatch.setattr(
+        compare_module, "_swap_masks", lambda rng, n_rows, n, dtype: np.ones((n_rows, n), dtype)
+    )
+    for seed in range(5):
+        y_true, pred_a, pred_b = _data(func, seed=seed)
+        result = compare_models(
+            y_true, pred_a, pred_b, func, n_permutations=20, alternative="two-sided"
+        )
+        assert result["p_value"] == 1.0
+
+
+def test_compare_validation():
+    """Test: unknown metrics, alternatives and invalid inputs are rejected."""
+    y_true, pred_a, pred_b = _data(get_mae)
+    with pytest.raises(ValueError, match="metric"):
+        compare_models(y_true, pred_a, pred_b, "auc")
+    with pytest.raises(ValueError, match="alternative"):
+        compare_models(y_true, pred_a, pred_b, "mae", alternative="less")
+    with pytest.raises(ValueError, match="n_permutations"):
+        compare_models(y_true, pred_a, pred_b, "mae", n_permutations=0)
+    with pytest.raises(ValueError, match="lengths"):
+        compare_models(y_true, pred_a, pred_b[:-1], "mae")
+    with pytest.raises(ValueError, match="zero"):
+        compare_models(np.zeros(3), [1, 2, 3], [1, 2, 3], "mape")
+    with pytest.raises(ValueError, match="same length"):
+        compare_models([0, 1], [0, 1], [1], "f1")
@@ -0,0 +1,125 @@
+"""
+A test module that tests SparseConfusion.
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import SparseConfusion, get_accuracy
+from reportrabbit import confusion as confusion_module
+
+
+@pytest.fixture
+def labels():
+    """Skewed labels over 50 classes, some of them never predicted."""
+    rng = np.random.default_rng(0)
+    y_true = rng.zipf(1.5, 5000) % 50
+    y_pred = np.where(rng.random(5000) < 0.6, y_true, rng.integers(0, 40, 5000))
+    return y_true, y_pred
+
+
+def _dense_scores(y_true, y_pred, k):
+    """Per-class precision, recall and F1 from a dense k x k confusion matrix."""
+    matrix = np.zeros((k, k), dtype=np.int64)
+    np.add.at(matrix, (y_true, y_pred), 1)
+    tp = np.diag(matrix).astype(float)
+    n_pred = matrix.sum(axis=0)
+    n_true = matrix.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(n_pred > 0, tp / n_pred, 0.0)
+        recall = np.where(n_true > 0, tp / n_true, 0.0)
+        f1 = np.where(n_pred + n_true > 0, 2 * tp / (n_pred + n_true), 0.0)
+    return matrix, precision, recall, f1, (n_pred + n_true) > 0
+
+
+def test_matches_dense_confusion(labels):
+    """Test: per-class and averaged scores equal those of a dense matrix."""
+    y_true, y_pred = labels
+    confusion = SparseConfusion()
+    confusion.update(y_true, y_pred)
+    matrix, precision, recall, f1, seen = _dense_scores(y_true, y_pred, 50)
+
+    assert confusion.n_classes == 50
+    assert confusion.n_pairs == np.count_nonzero(matrix)
+    tp, fp, fn = confusion.class_counts()
+    np.testing.assert_array_equal(tp, np.diag(matrix))
+    np.testing.assert_array_equal(fp, matrix.sum(axis=0) - np.diag(matrix))
+    np.testing.assert_array_equal(fn, matrix.sum(axis=1) - np.diag(matrix))
+
+    np.testing.assert_allclose(confusion.precision(None), precision)
+    np.testing.assert_allclose(confusion.recall(None), recall)
+    np.testing.assert_allclose(confusion.f1(None), f1)
+    assert confusion.f1("macro") == pytest.approx(f1[seen].mean())
+    assert confusion.recall("weighted") == pytest.approx(
+        np.average(recall, weights=matrix.sum(axis=1))
+    )
+    assert confusion.f1("micro") == pytest.approx(get_accuracy(y_true, y_pred))
+
+
+def test_chunks_and_merge_match_one_shot(labels, monkeypatch):
+    """Test: chunked updates and merged shards give the same pairs."""
+    monkeypatch.setattr(confusion_module, "_CHUNK_SIZE", 64)
+    y_true, y_pred = labels
+    whole = SparseConfusion()
+    whole.update(y_true, y_pred)
+
+    left = SparseConfusion()
+    right = SparseConfusion()
+    for start in range(0, 2500, 300):
+        left.update(y_true[start : min(start + 300, 2500)], y_pred[start : min(start + 300, 2500)])
+    right.update(y_true[2500:], y_pred[2500:])
+    left.merge(right)
+
+    assert left.n == whole.n == 5000
+    for merged, expected in zip(left.pairs(), whole.pairs()):
+        np.testing.assert_array_equal(merged, expected)
+
+
+def test_top_confused():
+    """Test: the most frequent off-diagonal pairs, ties ordered by class ids."""
+    confusion = SparseConfusion()
+    confusion.update([3, 3, 3, 1, 1, 2, 0, 0, 0, 0], [1, 1, 1, 3, 3, 0, 0, 0, 0, 0])
+    true, pred, counts = confusion.top_confused(2)
+    assert true.tolist() == [3, 1]
+    assert pred.tolist() == [1, 3]
+    assert counts.tolist() == [3, 2]
+    assert confusion.top_confused(10)[2].tolist() == [3, 2, 1]
+
+
+def test_millions_of_classes():
+    """Test: memory follows the distinct pairs, not n_classes squared."""
+    rng = np.random.default_rng(1)
+    n_classes = 2_000_000
+    y_true = rng.integers(0, n_classes, 20_000)
+    y_pred = np.where(rng.random(20_000) < 0.5, y_true, rng.integers(0, n_classes, 20_000))
+    confusion = SparseConfusion(n_classes)
+    confusion.update(y_true, y_pred)
+    assert confusion.n_pairs <= 20_000
+    assert confusion.f1(None).shape == (n_classes,)
+    assert confusion.f1("micro") == pytest.approx(np.mean(y_true == y_pred))
+
+
+def test_validation():
+    """Test: bad labels, lengths, n_classes, averages and k are rejected."""
+    with pytest.raises(ValueError, match="LabelEncoder"):
+        SparseConfusion().update(["a"], ["b"])
+    with pytest.raises(ValueError, match="lengths"):
+        SparseConfusion().update([1, 2], [1])
+    with pytest.raises(ValueError, match="empty"):
+        SparseConfusion().update([], [])
+    with pytest.raises(ValueError, match=r"\[0, 3\)"):
+        SparseConfusion(3).update([0, 3], [0, 1])
+    with pytest.raises(ValueError, match="Class ids"):
+        SparseConfusion().update([-1], [0])
+    with pytest.raises(ValueError, match="n_classes"):
+        SparseConfusion(0)
+    with pytest.raises(ValueError, match="n_classes"):
+        SparseConfusion(3).merge(SparseConfusion(4))
+    confusion = SparseConfusion()
+    with pytest.raises(ValueError, match="empty"):
+        confusion.f1()
+    confusion.update([0, 1], [1, 1])
+    with pytest.raises(ValueError, match="average"):
+        confusion.f1("samples")
+    with pytest.raises(ValueError, match="k must"):
+        confusion.top_confused(0)
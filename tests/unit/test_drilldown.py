@@ -0,0 +1,97 @@
+"""
+A test module that tests worst_errors() and WorstErrors.
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import WorstErrors, worst_errors
+from reportrabbit import drilldown
+
+
+def _expected(y_true, y_pred, k, kind):
+    """Worst rows by a full stable sort: largest error first, then lowest index."""
+    residual = y_true - y_pred
+    errors = {
+        "abs": np.abs(residual),
+        "pct": np.abs(residual / y_true),
+        "squared": residual**2,
+    }[kind]
+    order = np.lexsort((np.arange(len(errors)), -errors))[:k]
+    return order, errors[order]
+
+
+@pytest.mark.parametrize("kind", ["abs", "pct", "squared"])
+@pytest.mark.parametrize("k", [1, 7, 1000])
+def test_matches_full_sort(kind, k):
+    """Test: the indices and errors equal those of a full sort, ties included."""
+    rng = np.random.default_rng(k)
+    y_true = rng.integers(1, 20, 5000).astype(float)  # many ties
+    y_pred = rng.integers(0, 20, 5000).astype(float)
+    indices, errors = worst_errors(y_true, y_pred, k, kind)
+    expected_indices, expected_errors = _expected(y_true, y_pred, k, kind)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_array_equal(errors, expected_errors)
+
+
+def test_chunk_boundaries(monkeypatch):
+    """Test: candidates from many small chunks merge into the global top k."""
+    monkeypatch.setattr(drilldown, "_CHUNK_SIZE", 64)
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(0, 1, 3000)
+    y_pred = rng.normal(0, 1, 3000)
+    indices, errors = worst_errors(y_true, y_pred, 100)
+    expected_indices, expected_errors = _expected(y_true, y_pred, 100, "abs")
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_array_equal(errors, expected_errors)
+
+
+def test_streaming_matches_one_shot():
+    """Test: updating WorstErrors chunk by chunk numbers rows globally."""
+    rng = np.random.default_rng(1)
+    y_true = rng.normal(10, 2, 10_000)
+    y_pred = y_true + rng.standard_t(2, 10_000)
+    worst = WorstErrors(k=25, kind="squared")
+    for start in range(0, 10_000, 999):
+        worst.update(y_true[start:start + 999], y_pred[start:start + 999])
+    assert worst.n == 10_000
+    indices, errors = worst.result()
+    expected_indices, expected_errors = worst_errors(y_true, y_pred, 25, "squared")
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_array_equal(errors, expected_errors)
+
+
+def test_k_larger_than_input():
+    """Test: all rows are returned, worst first, when k exceeds n."""
+    indices, errors = worst_errors([1.0, 2.0, 3.0], [1.0, 4.0, 2.0], k=10)
+    assert indices.tolist() == [1, 2, 0]
+    assert errors.tolist() == [2.0, 1.0, 0.0]
+
+
+def test_memmap_input(tmp_path):
+    """Test: memory-mapped inputs are scanned in chunks."""
+    rng = np.random.default_rng(2)
+    y_true = rng.normal(size=50_000)
+    y_pred = rng.normal(size=50_000)
+    np.save(tmp_path / "t.npy", y_true)
+    np.save(tmp_path / "p.npy", y_pred)
+    mapped = worst_errors(
+        np.load(tmp_path / "t.npy", mmap_mode="r"), np.load(tmp_path / "p.npy", mmap_mode="r"), 10
+    )
+    np.testing.assert_array_equal(mapped[0], worst_errors(y_true, y_pred, 10)[0])
+
+
+def test_validation():
+    """Test: bad k, kind, lengths, values and zero targets for "pct" are rejected."""
+    with pytest.raises(ValueError, match="k must"):
+        worst_errors([1.0], [1.0], k=0)
+    with pytest.raises(ValueError, match="kind"):
+        worst_errors([1.0], [1.0], k=1, kind="log")
+    with pytest.raises(ValueError, match="lengths"):
+        worst_errors([1.0, 2.0], [1.0], k=1)
+    with pytest.raises(ValueError, match="empty"):
+        worst_errors([], [], k=1)
+    with pytest.raises(ValueError, match="finite"):
+        worst_errors([1.0, np.nan], [1.0, 2.0], k=1)
+    with pytest.raises(ValueError, match="zero"):
+        worst_errors([0.0, 2.0], [1.0, 2.0], k=1, kind="pct")
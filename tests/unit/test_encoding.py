@@ -0,0 +1,78 @@
+"""
+A test module that tests LabelEncoder and the classification metrics on
+its codes.
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import LabelEncoder, get_accuracy, get_f1, get_precision, get_recall
+
+
+def test_transform_builds_sorted_vocabulary():
+    """Test: the first transform builds a sorted vocabulary with compact codes."""
+    encoder = LabelEncoder()
+    codes = encoder.transform(["cat", "dog", "ant", "dog"])
+    np.testing.assert_array_equal(codes, [1, 2, 0, 2])
+    assert codes.dtype == np.uint8
+    np.testing.assert_array_equal(encoder.classes_, ["ant", "cat", "dog"])
+
+
+def test_negative_label_gets_code_zero():
+    """Test: negative_label is always encoded as 0."""
+    encoder = LabelEncoder(["spam", "ham", "eggs"], negative_label="spam")
+    np.testing.assert_array_equal(encoder.transform(["spam", "eggs", "ham"]), [0, 1, 2])
+
+
+def test_vocabulary_is_cached_and_extended():
+    """Test: existing codes stay stable when unseen labels are appended."""
+    encoder = LabelEncoder()
+    first = encoder.transform(["b", "c"])
+    second = encoder.transform(["a", "b", "c"])
+    np.testing.assert_array_equal(first, [0, 1])
+    np.testing.assert_array_equal(second, [2, 0, 1])
+    np.testing.assert_array_equal(encoder.inverse_transform(second), ["a", "b", "c"])
+
+
+def test_extend_false_rejects_unseen():
+    """Test: unseen labels raise when extension is disabled."""
+    encoder = LabelEncoder(["a", "b"])
+    with pytest.raises(ValueError, match="not in the vocabulary"):
+        encoder.transform(["a", "z"], extend=False)
+
+
+def test_fit_resets_vocabulary():
+    """Test: fit replaces the vocabulary but keeps negative_label first."""
+    encoder = LabelEncoder(["x", "y"], negative_label="neg")
+    encoder.fit(["b", "a"])
+    np.testing.assert_array_equal(encoder.classes_, ["neg", "a", "b"])
+
+
+def test_compact_code_dtype_grows():
+    """Test: the code dtype widens with the vocabulary size."""
+    encoder = LabelEncoder()
+    codes = encoder.transform([f"label{i}" for i in range(300)])
+    assert codes.dtype == np.uint16
+
+
+@pytest.mark.parametrize("func", [get_accuracy, get_precision, get_recall, get_f1])
+def test_metrics_on_codes_match_integer_labels(func):
+    """Test: metrics on encoded strings match the same metrics on integer labels."""
+    rng = np.random.default_rng(9)
+    names = np.array(["none", "fraud", "abuse"])
+    int_true = rng.integers(0, 3, 500)
+    int_pred = rng.integers(0, 3, 500)
+
+    encoder = LabelEncoder(names, negative_label="none")
+    out = func(encoder.transform(names[int_true]), encoder.transform(names[int_pred]))
+    assert out == func(int_true, int_pred)
+
+
+def test_negative_label_fixes_the_positive_class():
+    """Test: with negative_label the codes do not depend on how the labels sort."""
+    yes_no = LabelEncoder(negative_label="no")
+    spam_ham = LabelEncoder(negative_label="ham")
+    assert get_precision(
+        yes_no.transform(["yes", "no"]), yes_no.transform(["yes", "yes"])
+    ) == get_precision(spam_ham.transform(["spam", "ham"]), spam_ham.transform(["spam", "spam"]))
+
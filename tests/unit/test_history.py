@@ -0,0 +1,136 @@
+"""
+A test module that tests MetricHistory.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from reportrabbit import MetricHistory, get_f1, get_mse_rmse
+from reportrabbit.history import _MODELS
+
+METRICS = ("mse", "rmse", "f1")
+
+
+def _fill(history, n_models=7, n_minutes=50, seed=0):
+    """Append shuffled-within-minute results; return them as a list of rows."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for minute in range(n_minutes):
+        for m in rng.permutation(n_models).tolist():
+            values = rng.random(3).tolist()
+            history.append(f"model-{m}", 60 * minute, dict(zip(METRICS, values)))
+            rows.append((f"model-{m}", 60 * minute, *values))
+    return rows
+
+
+def _expected(rows, model=None, start=None, stop=None):
+    kept = [
+        row for row in rows
+        if (model is None or row[0] == model)
+        and (start is None or row[1] >= start)
+        and (stop is None or row[1] < stop)
+    ]
+    kept.sort(key=lambda row: row[1])  # stable: append order within a minute
+    return kept
+
+
+@pytest.mark.parametrize("segment_records", [1, 16, 10_000])
+def test_range_reads_match_scan(tmp_path, segment_records):
+    """Test: indexed range reads return the same rows as a full scan."""
+    history = MetricHistory(tmp_path / "h", METRICS, segment_records=segment_records)
+    rows = _fill(history)
+    assert len(history) == len(rows)
+    for model, start, stop in [
+        ("model-3", None, None),
+        ("model-0", 600, 1800),
+        ("model-6", 1234, 1235),
+        (None, 300, 660),
+        (None, None, None),
+    ]:
+        out = history.read(model, start, stop)
+        expected = _expected(rows, model, start, stop)
+        assert out["timestamp"].dtype == np.int64
+        assert out["timestamp"].tolist() == [row[1] for row in expected]
+        for j, name in enumerate(METRICS):
+            assert out[name].tolist() == [row[2 + j] for row in expected]
+        if model is None:
+            assert out["model"].tolist() == [row[0] for row in expected]
+        else:
+            assert "model" not in out
+    history.close()
+
+
+def test_reopen_and_recover(tmp_path):
+    """Test: a reopened store keeps every record and continues appending."""
+    path = tmp_path / "h"
+    history = MetricHistory(path, METRICS, segment_records=32)
+    rows = _fill(history, n_minutes=10)
+    history.close()
+
+    # An interrupted writer may leave full segments unsealed
+    history = MetricHistory(path)
+    assert history.metrics == METRICS and history.segment_records == 32
+    rows += _fill(history, n_minutes=5, seed=1)
+    del history
+    os.remove(path / "segment-000002.idx")
+    with open(path / "history.json") as f:
+        manifest = f.read()
+    with open(path / "history.json", "w") as f:
+        f.write(manifest.replace(manifest[manifest.index('"segments"'):], '"segments": []}'))
+
+    history = MetricHistory(path)
+    assert len(history) == len(rows)
+    assert history.read("model-2", 120, 480)["f1"].tolist() == [
+        row[4] for row in _expected(rows, "model-2", 120, 480)
+    ]
+    with pytest.raises(ValueError, match="do not match"):
+        MetricHistory(path, ["mae"])
+    history.close()
+
+
+def test_metric_outputs_and_selection(tmp_path):
+    """Test: results dicts of the metric functions, missing metrics and datetime64 times."""
+    with MetricHistory(tmp_path / "h", ["mse", "rmse", "f1"]) as history:
+        time = np.datetime64("2026-01-01T00:00")
+        history.append("reg", time, get_mse_rmse([1.0, 2.0], [1.0, 4.0]))
+        history.append("clf", time, {"f1": get_f1([1, 0, 1], [1, 1, 1])})
+        out = history.read("reg", start=time, metrics=["rmse"])
+        assert list(out) == ["timestamp", "rmse"]
+        assert out["timestamp"].tolist() == [int(time.astype("datetime64[s]").astype(int))]
+        assert out["rmse"].tolist() == [np.sqrt(2.0)]
+        assert np.isnan(history.read("clf")["mse"][0])
+        assert history.models == ("reg", "clf")
+    with open(tmp_path / "h" / _MODELS) as f:
+        assert f.read() == "reg\nclf\n"
+
+
+def test_validation(tmp_path):
+    """Test: bad schemas, metrics, values, timestamps and model ids are rejected."""
+    with pytest.raises(ValueError, match="required"):
+        MetricHistory(tmp_path / "a")
+    with pytest.raises(ValueError, match="distinct"):
+        MetricHistory(tmp_path / "b", ["mse", "mse"])
+    with pytest.raises(ValueError, match="cannot be metric names"):
+        MetricHistory(tmp_path / "c", ["timestamp"])
+    with pytest.raises(ValueError, match="segment_records"):
+        MetricHistory(tmp_path / "d", ["mse"], segment_records=0)
+
+    history = MetricHistory(tmp_path / "e", ["mse"])
+    with pytest.raises(ValueError, match="Unknown metric"):
+        history.append("m", 0, {"mae": 1.0})
+    with pytest.raises(ValueError, match="must be a number"):
+        history.append("m", 0, {"mse": [1.0, 2.0]})
+    with pytest.raises(ValueError, match="timestamp"):
+        history.append("m", 1.5, {"mse": 1.0})
+    with pytest.raises(ValueError, match="newlines"):
+        history.append("a\nb", 0, {"mse": 1.0})
+    with pytest.raises(ValueError, match="Unknown model"):
+        history.read("m")
+    history.append("m", 0, {"mse": 1.0})
+    with pytest.raises(ValueError, match="Unknown metric"):
+        history.read("m", metrics=["mae"])
+    history.close()
+    with pytest.raises(ValueError, match="closed"):
+        history.append("m", 1, {"mse": 1.0})
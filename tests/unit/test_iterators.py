@@ -0,0 +1,122 @@
+"""
+A test module that tests iterator and generator inputs to the metric functions.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from reportrabbit import (
+    RegressionAccumulator,
+    get_accuracy,
+    get_classification_report,
+    get_f1,
+    get_mae,
+    get_mape,
+    get_mse,
+    get_mse_rmse,
+    get_precision,
+    get_r,
+    get_r2,
+    get_recall,
+    get_regression_report,
+    get_rmse,
+)
+from reportrabbit._iterators import _BLOCK_SIZE
+
+REGRESSION = [get_mae, get_mape, get_mse, get_rmse, get_r, get_r2]
+CLASSIFICATION = [get_accuracy, get_precision, get_recall, get_f1]
+
+N = 2 * _BLOCK_SIZE + 123  # several full blocks and a partial one
+
+
+@pytest.fixture(scope="module")
+def regression():
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(10, 2, N)
+    return y_true, y_true + rng.normal(0, 1, N)
+
+
+@pytest.fixture(scope="module")
+def labels():
+    rng = np.random.default_rng(1)
+    return rng.integers(0, 3, N), rng.integers(0, 3, N)
+
+
+@pytest.mark.parametrize("metric", REGRESSION)
+def test_regression_generators_match_arrays(regression, metric):
+    """Test: generators on either or both sides give the array result up to rounding."""
+    y_true, y_pred = regression
+    expected = metric(y_true, y_pred)
+    assert metric((v for v in y_true), (v for v in y_pred)) == pytest.approx(expected, rel=1e-10)
+    assert metric(iter(y_true.tolist()), y_pred) == pytest.approx(expected, rel=1e-10)
+    assert metric(y_true, map(float, y_pred)) == pytest.approx(expected, rel=1e-10)
+
+
+@pytest.mark.parametrize("metric", CLASSIFICATION)
+def test_classification_generators_match_arrays(labels, metric):
+    """Test: label generators give exactly the array result."""
+    y_true, y_pred = labels
+    assert metric((int(v) for v in y_true), iter(y_pred)) == metric(y_true, y_pred)
+
+
+def test_mse_rmse_and_reports_accept_generators(regression, labels):
+    """Test: the combined functions and reports stream generators too."""
+    y_true, y_pred = regression
+    combined = get_mse_rmse(iter(y_true), iter(y_pred))
+    assert combined["mse"] == pytest.approx(get_mse(y_true, y_pred), rel=1e-10)
+    assert combined["rmse"] == pytest.approx(get_rmse(y_true, y_pred), rel=1e-10)
+
+    report = get_regression_report(iter(y_true), iter(y_pred), backend="numpy")
+    assert report["r2"] == pytest.approx(get_r2(y_true, y_pred), rel=1e-10)
+    assert get_classification_report(iter(labels[0]), iter(labels[1]), backend="numpy") == (
+        get_classification_report(*labels, backend="numpy")
+    )
+
+
+def test_string_labels():
+    """Test: non-numeric labels are read block by block as well."""
+    y_true = ["cat", "dog", "cat", "dog"]
+    y_pred = ["cat", "cat", "cat", "dog"]
+    assert get_accuracy(iter(y_true), iter(y_pred)) == get_accuracy(y_true, y_pred)
+
+
+def test_memory_stays_constant():
+    """Test: streaming a long generator never materialises it."""
+    n = 2_000_000
+    tracemalloc.start()
+    try:
+        get_mae((float(i) for i in range(n)), (i + 0.5 for i in range(n)))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 8 * 8 * _BLOCK_SIZE  # a few blocks, far below the 32 MB of two arrays
+
+
+def test_accumulator_update_accepts_iterators(regression):
+    """Test: accumulators consume iterators, so chunked generators can be fed directly."""
+    y_true, y_pred = regression
+    acc = RegressionAccumulator(backend="numpy")
+    acc.update(iter(y_true[:1000]), iter(y_pred[:1000]))
+    acc.update(y_true[1000:], y_pred[1000:])
+    assert acc.n == N
+    assert acc.mae() == pytest.approx(get_mae(y_true, y_pred), rel=1e-12)
+
+
+def test_iterator_errors():
+    """Test: length mismatches, empty iterators and unsupported options are rejected."""
+    with pytest.raises(ValueError, match="lengths"):
+        get_mae(iter([1.0, 2.0]), iter([1.0]))
+    with pytest.raises(ValueError, match="lengths"):
+        get_accuracy(iter(range(_BLOCK_SIZE + 1)), range(_BLOCK_SIZE))
+    with pytest.raises(ValueError, match="empty"):
+        get_mae(iter([]), iter([]))
+    with pytest.raises(ValueError, match="empty"):
+        get_f1(iter([]), iter([]))
+    with pytest.raises(ValueError, match="multioutput"):
+        get_r(iter([1.0, 2.0]), iter([1.0, 2.0]), multioutput="raw_values")
+    with pytest.raises(ValueError, match="sample_weight"):
+        get_mse(iter([1.0]), iter([1.0]), sample_weight=[1.0])
+    with pytest.raises(ValueError, match="finite"):
+        get_mae(iter([1.0, np.inf]), iter([1.0, 2.0]))
@@ -0,0 +1,112 @@
+"""
+A test module that tests get_multilabel_precision(), get_multilabel_recall()
+and get_multilabel_f1() on dense, bit-packed and CSR indicator matrices.
+"""
+
+import numpy as np
+import pytest
+
+import reportrabbit.multilabel as multilabel_module
+from reportrabbit import (
+    get_f1,
+    get_multilabel_f1,
+    get_multilabel_precision,
+    get_multilabel_recall,
+    get_precision,
+    get_recall,
+)
+
+MULTILABEL = [get_multilabel_precision, get_multilabel_recall, get_multilabel_f1]
+PER_LABEL = dict(zip(MULTILABEL, [get_precision, get_recall, get_f1]))
+
+
+@pytest.fixture
+def indicators():
+    """Random 301 x 12 indicator matrices (301 is not a multiple of 8)."""
+    rng = np.random.default_rng(21)
+    y_true = (rng.random((301, 12)) < 0.2).astype(np.int8)
+    y_pred = (rng.random((301, 12)) < 0.2).astype(np.int8)
+    y_pred[:, 3] = 0  # a label never predicted
+    return y_true, y_pred
+
+
+def _per_sample_reference(y_true, y_pred, kind):
+    """Reference 'samples' average computed row by row."""
+    scores = []
+    for t, p in zip(y_true != 0, y_pred != 0):
+        tp = np.sum(t & p)
+        denominator = [p.sum(), t.sum(), p.sum() + t.sum()][kind]
+        numerator = 2 * tp if kind == 2 else tp
+        scores.append(numerator / denominator if denominator else 0.0)
+    return np.mean(scores)
+
+
+@pytest.mark.parametrize("func", MULTILABEL)
+def test_per_label_matches_column_loop(func, indicators):
+    """Test: average=None equals scoring every label column separately."""
+    y_true, y_pred = indicators
+    expected = [PER_LABEL[func](y_true[:, j], y_pred[:, j]) for j in range(12)]
+    np.testing.assert_allclose(func(y_true, y_pred, average=None), expected)
+
+
+@pytest.mark.parametrize("func", MULTILABEL)
+def test_macro_and_weighted(func, indicators):
+    """Test: macro and weighted averages of the per-label scores."""
+    y_true, y_pred = indicators
+    per_label = func(y_true, y_pred, average=None)
+    assert func(y_true, y_pred, average="macro") == pytest.approx(per_label.mean())
+    expected = np.average(per_label, weights=(y_true != 0).sum(axis=0))
+    assert func(y_true, y_pred, average="weighted") == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("func", MULTILABEL)
+def test_micro_pools_counts(func, indicators):
+    """Test: micro averaging equals the binary metric on the flattened matrices."""
+    y_true, y_pred = indicators
+    assert func(y_true, y_pred) == pytest.approx(PER_LABEL[func](y_true.ravel(), y_pred.ravel()))
+
+
+@pytest.mark.parametrize("kind,func", list(enumerate(MULTILABEL)))
+def test_samples_average(kind, func, indicators):
+    """Test: samples averaging equals the row-by-row reference."""
+    y_true, y_pred = indicators
+    expected = _per_sample_reference(y_true, y_pred, kind)
+    assert func(y_true, y_pred, average="samples") == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("func", MULTILABEL)
+@pytest.mark.parametrize("average", ["micro", "macro", "samples", "weighted"])
+def test_bit_packed_matches_dense(func, average, indicators, monkeypatch):
+    """Test: matrices packed along the sample axis give the dense result."""
+    monkeypatch.setattr(multilabel_module, "_BLOCK_ROWS", 64)
+    y_true, y_pred = indicators
+    packed_true = np.packbits(y_true, axis=0)
+    packed_pred = np.packbits(y_pred, axis=0)
+    # Garbage in the padding bits of the last packed row must be ignored
+    packed_true[-1] |= 0x07
+    packed_pred[-1] |= 0x07
+    out = func(packed_true, packed_pred, average=average, n_samples=301)
+    assert out == pytest.approx(func(y_true, y_pred, average=average))
+
+
+@pytest.mark.parametrize("func", MULTILABEL)
+@pytest.mark.parametrize("average", ["micro", "macro", "samples", "weighted"])
+def test_csr_matches_dense(func, average, indicators):
+    """Test: CSR sparse indicator matrices give the dense result."""
+    sparse = pytest.importorskip("scipy.sparse")
+    y_true, y_pred = indicators
+    out = func(sparse.csr_matrix(y_true), sparse.csr_matrix(y_pred), average=average)
+    assert out == pytest.approx(func(y_true, y_pred, average=average))
+
+
+def test_multilabel_validation(indicators):
+    """Test: invalid averages, shapes and mixed formats are rejected."""
+    y_true, y_pred = indicators
+    with pytest.raises(ValueError, match="average"):
+        get_multilabel_f1(y_true, y_pred, average="binary")
+    with pytest.raises(ValueError, match="Shape mismatch"):
+        get_multilabel_f1(y_true, y_pred[:, :5])
+    with pytest.raises(ValueError, match="2D"):
+        get_multilabel_f1(y_true[:, 0], y_pred[:, 0])
+    with pytest.raises(ValueError, match="uint8"):
+        get_multilabel_f1(y_true, y_pred, n_samples=301)
@@ -0,0 +1,100 @@
+"""
+A test module that tests the multioutput option of the regression metrics
+(get_mae, get_mape, get_mse, get_rmse, get_mse_rmse, get_r and get_r2).
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import get_mae, get_mape, get_mse, get_mse_rmse, get_r, get_r2, get_rmse
+
+METRICS = [get_mae, get_mape, get_mse, get_rmse, get_r, get_r2]
+
+
+@pytest.fixture
+def data():
+    """Forecasts for 4 horizons with different scales."""
+    rng = np.random.default_rng(3)
+    y_true = rng.normal(10.0, 1.0, (200, 4)) * np.array([1.0, 2.0, 5.0, 10.0])
+    y_pred = y_true + rng.normal(0.0, 1.0, (200, 4))
+    return y_true, y_pred
+
+
+@pytest.mark.parametrize("func", METRICS)
+def test_raw_values_match_column_by_column(func, data):
+    """Test: raw_values equals calling the metric once per column."""
+    y_true, y_pred = data
+    out = func(y_true, y_pred, multioutput="raw_values")
+    expected = [func(y_true[:, j].copy(), y_pred[:, j].copy()) for j in range(4)]
+    assert out.shape == (4,)
+    np.testing.assert_allclose(out, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("func", METRICS)
+def test_uniform_average(func, data):
+    """Test: uniform_average is the mean of the per-output scores."""
+    y_true, y_pred = data
+    raw = func(y_true, y_pred, multioutput="raw_values")
+    assert func(y_true, y_pred, multioutput="uniform_average") == pytest.approx(np.mean(raw))
+
+
+def test_variance_weighted_r2(data):
+    """Test: variance_weighted weights outputs by the variance of y_true."""
+    y_true, y_pred = data
+    raw = get_r2(y_true, y_pred, multioutput="raw_values")
+    expected = np.average(raw, weights=np.var(y_true, axis=0))
+    assert get_r2(y_true, y_pred, multioutput="variance_weighted") == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("func", METRICS)
+def test_fortran_order_matches_c_order(func, data):
+    """Test: memory layout of the inputs does not change the scores."""
+    y_true, y_pred = data
+    c_out = func(y_true, y_pred, multioutput="raw_values")
+    f_out = func(np.asfortranarray(y_true), y_pred, multioutput="raw_values")
+    np.testing.assert_allclose(f_out, c_out, rtol=1e-12)
+
+
+def test_mse_rmse_multioutput_with_weights(data):
+    """Test: get_mse_rmse returns per-output arrays and supports weights."""
+    y_true, y_pred = data
+    weights = np.linspace(1.0, 2.0, 200)
+    out = get_mse_rmse(y_true, y_pred, sample_weight=weights, multioutput="raw_values")
+    expected = np.average((y_true - y_pred) ** 2, axis=0, weights=weights)
+    np.testing.assert_allclose(out["mse"], expected)
+    np.testing.assert_allclose(out["rmse"], np.sqrt(expected))
+
+
+def test_one_dimensional_input_is_single_output():
+    """Test: 1D inputs are scored as a single output."""
+    out = get_mae([1.0, 2.0, 3.0], [2.0, 2.0, 4.0], multioutput="raw_values")
+    np.testing.assert_allclose(out, [2 / 3])
+
+
+def test_constant_output_conventions():
+    """Test: constant columns follow get_r (NaN) and get_r2 (0.0)."""
+    y_true = np.array([[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]])
+    y_pred = np.array([[1.0, 2.0], [2.0, 1.0], [3.0, 0.0]])
+    r = get_r(y_true, y_pred, multioutput="raw_values")
+    r2 = get_r2(y_true, y_pred, multioutput="raw_values")
+    assert r[0] == pytest.approx(1.0) and np.isnan(r[1])
+    np.testing.assert_allclose(r2, [1.0, 0.0])
+
+
+def test_invalid_multioutput_option(data):
+    """Test: unknown multioutput options raise ValueError."""
+    y_true, y_pred = data
+    with pytest.raises(ValueError, match="multioutput"):
+        get_mae(y_true, y_pred, multioutput="median")
+
+
+def test_multioutput_shape_mismatch():
+    """Test: mismatched 2D shapes raise ValueError."""
+    with pytest.raises(ValueError, match="Shape mismatch"):
+        get_mse(np.ones((3, 2)), np.ones((3, 3)), multioutput="raw_values")
+
+
+def test_mape_multioutput_rejects_zero():
+    """Test: MAPE is undefined with zero targets in any output."""
+    with pytest.raises(ValueError, match="zero"):
+        get_mape([[1.0, 0.0], [2.0, 1.0]], [[1.0, 1.0], [2.0, 1.0]], multioutput="raw_values")
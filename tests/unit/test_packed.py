@@ -0,0 +1,81 @@
+"""
+A test module that tests PackedLabels and packed inputs to the classification metrics.
+"""
+
+import numpy as np
+import pytest
+
+import reportrabbit.packed as packed_module
+from reportrabbit import (
+    ClassificationAccumulator,
+    PackedLabels,
+    get_accuracy,
+    get_classification_report,
+    get_f1,
+    get_precision,
+    get_recall,
+)
+
+METRICS = [get_accuracy, get_precision, get_recall, get_f1]
+
+
+def _labels(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 2, n), rng.integers(0, 2, n)
+
+
+@pytest.mark.parametrize("func", METRICS)
+@pytest.mark.parametrize("n", [1, 7, 8, 63, 64, 65, 1000, 4096, 4099])
+def test_packed_matches_dense(func, n):
+    """Test: packed labels give the dense result for word-aligned and ragged lengths."""
+    y_true, y_pred = _labels(n, seed=n)
+    packed_true = PackedLabels.from_labels(y_true)
+    packed_pred = PackedLabels.from_labels(y_pred)
+    assert func(packed_true, packed_pred) == func(y_true, y_pred)
+
+
+@pytest.mark.parametrize("bitorder", ["big", "little"])
+@pytest.mark.parametrize("n", [61, 64, 70])
+def test_padding_bits_are_ignored(bitorder, n):
+    """Test: garbage in the padding bits of the last byte does not change counts."""
+    y_true, y_pred = _labels(n, seed=1)
+    bits_true = np.packbits(y_true, bitorder=bitorder)
+    bits_pred = np.packbits(y_pred, bitorder=bitorder)
+    expected = get_classification_report(y_true, y_pred, backend="numpy")
+
+    if n % 8:
+        pad = 0xFF & ~PackedLabels(bits_true, n, bitorder)._tail_mask()
+        bits_true[-1] |= pad
+        bits_pred[-1] |= pad
+    acc = ClassificationAccumulator(backend="numpy")
+    acc.update(PackedLabels(bits_true, n, bitorder), PackedLabels(bits_pred, n, bitorder))
+    assert acc.result() == expected
+
+
+def test_small_blocks_match(monkeypatch):
+    """Test: counting in many small word blocks gives the same result."""
+    monkeypatch.setattr(packed_module, "_BLOCK_WORDS", 3)
+    y_true, y_pred = _labels(5000, seed=2)
+    packed = PackedLabels.from_labels(y_true), PackedLabels.from_labels(y_pred)
+    assert get_f1(*packed) == get_f1(y_true, y_pred)
+
+
+def test_unpack_round_trip():
+    """Test: unpack returns the binarised labels."""
+    labels = [0, 2, 1, 0, 0, 1, 1, 1, 0, 1]
+    np.testing.assert_array_equal(
+        PackedLabels.from_labels(labels).unpack(), np.asarray(labels) != 0
+    )
+
+
+def test_packed_validation():
+    """Test: mismatched, mixed and malformed packed inputs are rejected."""
+    a = PackedLabels.from_labels([0, 1, 1])
+    with pytest.raises(ValueError, match="same length"):
+        get_accuracy(a, PackedLabels.from_labels([0, 1]))
+    with pytest.raises(TypeError, match="both"):
+        get_precision(a, [0, 1, 1])
+    with pytest.raises(ValueError, match="bytes"):
+        PackedLabels(np.zeros(2, dtype=np.uint8), 3)
+    with pytest.raises(ValueError, match="empty"):
+        get_recall(PackedLabels.from_labels([]), PackedLabels.from_labels([]))
@@ -0,0 +1,98 @@
+"""
+A test module that guards the peak memory of every public get_* metric.
+
+Each metric module declares a ``_PEAK_MEMORY_MULTIPLE`` table next to the
+functions it defines. Every metric is run under tracemalloc on standard
+inputs, and the peak traced allocation must stay within the declared
+multiple of the combined size of the two input arrays, so an extra
+full-size copy fails the build like a wrong answer does.
+"""
+
+import importlib
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import reportrabbit
+
+# Public get_* functions that are not metrics of (y_true, y_pred)
+NOT_METRICS = {"get_memory_budget"}
+
+LABEL_METRICS = {
+    "get_accuracy", "get_precision", "get_recall", "get_f1", "get_classification_report",
+}
+SCORE_METRICS = {"get_roc_auc", "get_pr_auc"}
+MULTILABEL_METRICS = {"get_multilabel_precision", "get_multilabel_recall", "get_multilabel_f1"}
+RANKING_METRICS = {"get_ranking_metrics"}
+
+METRICS = sorted(
+    name for name in reportrabbit.__all__ if name.startswith("get_") and name not in NOT_METRICS
+)
+
+
+def _inputs(name, n):
+    """Standard inputs of `n` values per array for the metric `name`."""
+    rng = np.random.default_rng(0)
+    if name in LABEL_METRICS:
+        return rng.integers(0, 2, n), rng.integers(0, 2, n)
+    if name in SCORE_METRICS:
+        return rng.integers(0, 2, n), rng.random(n)
+    if name in MULTILABEL_METRICS:
+        shape = (n // 8, 8)
+        return rng.integers(0, 2, shape).astype(np.int8), rng.integers(0, 2, shape).astype(np.int8)
+    if name in RANKING_METRICS:
+        shape = (n // 100, 100)
+        return (rng.random(shape) < 0.1).astype(np.int8), rng.random(shape)
+    return rng.normal(10, 2, n) + 0.5, rng.normal(10, 2, n)
+
+
+def _budget(name):
+    func = getattr(reportrabbit, name)
+    table = getattr(importlib.import_module(func.__module__), "_PEAK_MEMORY_MULTIPLE", {})
+    return func, table.get(name)
+
+
+@pytest.mark.parametrize("name", METRICS)
+def test_every_metric_declares_a_budget(name):
+    """Test: each public metric has an entry in its module's budget table."""
+    _, multiple = _budget(name)
+    assert multiple is not None, f"{name} has no _PEAK_MEMORY_MULTIPLE entry"
+
+
+@pytest.mark.parametrize("name", METRICS)
+@pytest.mark.parametrize("n", [100_000, 1_000_000])
+def test_peak_allocation_within_budget(name, n):
+    """Test: the traced peak stays within the declared multiple of the input size."""
+    func, multiple = _budget(name)
+    y_true, y_pred = _inputs(name, n)
+    func(y_true, y_pred)  # warm up one-time caches (imports, compiled kernels)
+
+    tracemalloc.start()
+    try:
+        func(y_true, y_pred)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    input_bytes = y_true.nbytes + y_pred.nbytes
+    assert peak <= multiple * input_bytes, (
+        f"{name} peaked at {peak / input_bytes:.2f}x its input size "
+        f"(budget {multiple}x)"
+    )
+
+
+@pytest.mark.parametrize("n", [100_000, 1_000_000])
+def test_kendall_tau_numpy_backend_within_budget(n):
+    """Test: the NumPy inversion count fits the same budget as the compiled one."""
+    _, multiple = _budget("get_kendall_tau")
+    y_true, y_pred = _inputs("get_kendall_tau", n)
+
+    tracemalloc.start()
+    try:
+        reportrabbit.get_kendall_tau(y_true, y_pred, backend="numpy")
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert peak <= multiple * (y_true.nbytes + y_pred.nbytes)
@@ -0,0 +1,99 @@
+"""
+A test module that tests PreparedTarget.
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import (
+    PreparedTarget,
+    get_accuracy,
+    get_f1,
+    get_mae,
+    get_mape,
+    get_mse,
+    get_precision,
+    get_r,
+    get_r2,
+    get_recall,
+    get_rmse,
+)
+
+REGRESSION = {
+    "mae": get_mae, "mse": get_mse, "rmse": get_rmse, "mape": get_mape, "r": get_r, "r2": get_r2,
+}
+CLASSIFICATION = {
+    "accuracy": get_accuracy, "precision": get_precision, "recall": get_recall, "f1": get_f1,
+}
+
+
+@pytest.mark.parametrize("name", REGRESSION)
+@pytest.mark.parametrize("dtype", [np.float64, np.int64])
+def test_regression_methods_match_functions(name, dtype):
+    """Test: every regression method returns exactly the get_* result for several models."""
+    rng = np.random.default_rng(0)
+    y_true = (rng.normal(50, 10, 1000)).astype(dtype)
+    target = PreparedTarget(y_true)
+    for seed in range(3):
+        y_pred = (y_true + np.random.default_rng(seed).normal(0, 5, 1000)).astype(dtype)
+        assert getattr(target, name)(y_pred) == REGRESSION[name](y_true, y_pred)
+
+
+@pytest.mark.parametrize("name", CLASSIFICATION)
+def test_classification_methods_match_functions(name):
+    """Test: every classification method returns exactly the get_* result."""
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 3, 1000)
+    target = PreparedTarget(y_true)
+    for seed in range(3):
+        y_pred = np.random.default_rng(seed).integers(0, 3, 1000)
+        assert getattr(target, name)(y_pred) == CLASSIFICATION[name](y_true, y_pred)
+
+
+def test_edge_cases_match_functions():
+    """Test: undefined results follow the get_* conventions."""
+    constant = PreparedTarget([2.0, 2.0, 2.0])
+    assert constant.r2([1.0, 2.0, 3.0]) == 0.0
+    assert np.isnan(constant.r([1.0, 2.0, 3.0]))
+    negatives = PreparedTarget([0, 0, 0])
+    assert negatives.recall([1, 0, 1]) == 0.0
+    assert negatives.precision([0, 0, 0]) == 0.0
+    assert negatives.f1([1, 1, 0]) == 0.0
+    with pytest.warns(UserWarning, match="fewer than 2"):
+        assert np.isnan(PreparedTarget([1.0]).r2([1.0]))
+
+
+def test_string_labels_work_for_classification():
+    """Test: non-numeric targets support the label metrics."""
+    target = PreparedTarget(np.array(["a", "b", "a"], dtype=object))
+    assert target.accuracy(["a", "a", "a"]) == pytest.approx(2 / 3)
+    with pytest.raises(ValueError, match="numeric"):
+        target.mae([1.0, 2.0, 3.0])
+
+
+def test_cached_quantities_are_reused():
+    """Test: per-target statistics are computed once and the target is read-only."""
+    target = PreparedTarget([1.0, 2.0, 4.0])
+    target.r2([1.0, 2.0, 3.0])
+    sum_sq = target.__dict__["_sum_sq"]
+    target.r([3.0, 2.0, 1.0])
+    assert target.__dict__["_sum_sq"] is sum_sq
+    with pytest.raises(ValueError):
+        target.values[0] = 5.0
+
+
+def test_prepared_validation():
+    """Test: invalid targets and predictions raise the get_* errors."""
+    with pytest.raises(ValueError, match="empty"):
+        PreparedTarget([])
+    with pytest.raises(ValueError, match="1D"):
+        PreparedTarget([[1.0, 2.0]])
+    target = PreparedTarget([1.0, 0.0, 3.0])
+    with pytest.raises(ValueError, match="lengths"):
+        target.mse([1.0, 2.0])
+    with pytest.raises(ValueError, match="finite"):
+        target.mae([1.0, np.nan, 3.0])
+    with pytest.raises(ValueError, match="zero"):
+        target.mape([1.0, 2.0, 3.0])
+    with pytest.raises(ValueError, match="finite"):
+        PreparedTarget([1.0, np.inf]).rmse([1.0, 2.0])
@@ -0,0 +1,114 @@
+"""
+A test module that tests get_spearman(), get_kendall_tau() and Ranking.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from reportrabbit import Ranking, get_kendall_tau, get_r, get_spearman
+from reportrabbit._backend import _jit_kernels, count_inversions
+
+BACKENDS = ["numpy"] + (["jit"] if _jit_kernels() is not None else [])
+
+
+def _naive_average_ranks(x):
+    x = np.asarray(x)
+    return np.array([np.sum(x < v) + (np.sum(x == v) + 1) / 2 for v in x])
+
+
+def _naive_kendall_tau_b(x, y):
+    concordant = discordant = tied_x = tied_y = 0
+    for i, j in itertools.combinations(range(len(x)), 2):
+        dx, dy = np.sign(x[i] - x[j]), np.sign(y[i] - y[j])
+        tied_x += dx == 0
+        tied_y += dy == 0
+        concordant += dx * dy > 0
+        discordant += dx * dy < 0
+    n_pairs = len(x) * (len(x) - 1) // 2
+    return (concordant - discordant) / np.sqrt((n_pairs - tied_x) * (n_pairs - tied_y))
+
+
+def _samples():
+    rng = np.random.default_rng(0)
+    for n in [2, 3, 17, 64, 200]:
+        yield rng.normal(size=n), rng.normal(size=n)
+        yield rng.integers(0, 4, n).astype(float), rng.integers(0, 3, n)
+        x = rng.normal(size=n)
+        yield x, x + rng.normal(0, 0.5, n).round(1)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_kendall_tau_matches_pairwise_definition(backend):
+    """Test: tau-b equals the O(n^2) pair count, with and without ties."""
+    for x, y in _samples():
+        expected = _naive_kendall_tau_b(x, y)
+        assert get_kendall_tau(x, y, backend=backend) == pytest.approx(expected, abs=1e-12)
+
+
+def test_spearman_is_pearson_of_average_ranks():
+    """Test: rho equals the Pearson correlation of the average ranks."""
+    for x, y in _samples():
+        expected = get_r(_naive_average_ranks(x), _naive_average_ranks(y))
+        assert get_spearman(x, y) == pytest.approx(expected, abs=1e-12)
+
+
+def test_perfect_and_reversed_orderings():
+    """Test: monotone relations give +1 and -1, whatever the scale."""
+    x = np.arange(1000.0)
+    assert get_spearman(x, np.exp(x / 100)) == 1.0
+    assert get_kendall_tau(x, -(x**3)) == -1.0
+
+
+def test_constant_input_returns_nan():
+    """Test: the coefficients are undefined when one input is constant."""
+    assert np.isnan(get_spearman([1, 2, 3], [5, 5, 5]))
+    assert np.isnan(get_kendall_tau([1, 2, 3], [5, 5, 5]))
+    assert np.isnan(get_kendall_tau([1.0], [2.0]))
+
+
+def test_ranking_is_reusable_across_models():
+    """Test: a precomputed Ranking of y_true gives the same results as the raw array."""
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 50, 5000)
+    target = Ranking(y_true)
+    for seed in range(3):
+        y_pred = y_true + np.random.default_rng(seed).normal(0, 10, 5000)
+        assert get_spearman(target, y_pred) == get_spearman(y_true, y_pred)
+        assert get_kendall_tau(target, y_pred) == get_kendall_tau(y_true, y_pred)
+        assert get_kendall_tau(target, Ranking(y_pred)) == get_kendall_tau(y_true, y_pred)
+
+
+def test_ranking_attributes():
+    """Test: dense ranks, average ranks and tie counts."""
+    ranking = Ranking(["b", "a", "b", "c", "b"])
+    np.testing.assert_array_equal(ranking.dense, [1, 0, 1, 2, 1])
+    np.testing.assert_array_equal(ranking.ranks, [3.0, 1.0, 3.0, 5.0, 3.0])
+    assert ranking.n_tied_pairs == 3
+    assert ranking.n_distinct == 3
+    assert len(ranking) == 5
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_count_inversions(backend):
+    """Test: both inversion counters agree with the quadratic count."""
+    rng = np.random.default_rng(2)
+    for n in [0, 1, 2, 9, 300]:
+        values = rng.integers(0, 40, n)
+        expected = sum(a > b for a, b in itertools.combinations(values, 2))
+        assert count_inversions(values, backend) == expected
+
+
+def test_input_validation():
+    """Test: empty, 2D, NaN and mismatched inputs, and unknown backends, are rejected."""
+    with pytest.raises(ValueError, match="empty"):
+        get_spearman([], [])
+    with pytest.raises(ValueError, match="1D"):
+        get_kendall_tau([[1, 2]], [[1, 2]])
+    with pytest.raises(ValueError, match="NaN"):
+        Ranking([1.0, np.nan])
+    with pytest.raises(ValueError, match="lengths"):
+        get_kendall_tau(Ranking([1, 2, 3]), [1, 2])
+    with pytest.raises(ValueError, match="backend"):
+        get_kendall_tau([1, 2], [1, 2], backend="gpu")
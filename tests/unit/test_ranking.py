@@ -0,0 +1,140 @@
+"""
+A test module that tests get_ranking_metrics().
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import get_ranking_metrics
+from reportrabbit import ranking as ranking_module
+
+
+def _reference(relevance, scores, k):
+    """Per-user metrics from a full stable sort, one user at a time."""
+    out = {name: [] for name in ("precision", "recall", "ndcg", "map")}
+    discounts = 1 / np.log2(np.arange(2, k + 2))
+    for grades, row in zip(relevance, scores):
+        order = np.lexsort((np.arange(len(row)), -row))[:k]
+        gains = grades[order]
+        hits = gains > 0
+        n_relevant = np.count_nonzero(grades > 0)
+        ideal = np.sort(grades)[::-1][:k]
+        out["precision"].append(hits.sum() / k)
+        out["recall"].append(hits.sum() / n_relevant if n_relevant else 0.0)
+        idcg = ideal @ discounts
+        out["ndcg"].append(gains @ discounts / idcg if idcg > 0 else 0.0)
+        precision_at = np.cumsum(hits) / np.arange(1, k + 1)
+        out["map"].append((precision_at * hits).sum() / min(n_relevant, k) if n_relevant else 0.0)
+    return {name: np.array(values) for name, values in out.items()}
+
+
+@pytest.fixture
+def ratings():
+    """Graded relevance and tied, rounded scores; some users have no relevant items."""
+    rng = np.random.default_rng(0)
+    relevance = np.where(rng.random((300, 40)) < 0.15, rng.integers(1, 4, (300, 40)), 0)
+    relevance[:5] = 0
+    scores = np.round(rng.random((300, 40)), 1)  # many ties
+    return relevance.astype(float), scores
+
+
+@pytest.mark.parametrize("k", [1, 5, 40])
+def test_matches_full_sort(ratings, k):
+    """Test: per-user values and means equal a full stable sort per user."""
+    relevance, scores = ratings
+    out = get_ranking_metrics(relevance, scores, k=k)
+    expected = _reference(relevance, scores, k)
+    for name, values in expected.items():
+        np.testing.assert_allclose(out["per_user"][name], values, atol=1e-12)
+        assert out[name] == pytest.approx(values.mean())
+
+
+def test_blocks(ratings, monkeypatch):
+    """Test: small row blocks give the same result as one block."""
+    relevance, scores = ratings
+    expected = get_ranking_metrics(relevance, scores, k=7)
+    monkeypatch.setattr(ranking_module, "_BLOCK_ELEMENTS", 100)
+    out = get_ranking_metrics(relevance, scores, k=7)
+    for name in ("precision", "recall", "ndcg", "map"):
+        np.testing.assert_array_equal(out["per_user"][name], expected["per_user"][name])
+
+
+def test_csr_and_sparse_relevance(ratings):
+    """Test: CSR-style tuples and scipy.sparse matrices match the dense grades."""
+    relevance, scores = ratings
+    expected = get_ranking_metrics(relevance, scores, k=5)
+    rows, cols = np.nonzero(relevance)
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=300))])
+    graded = get_ranking_metrics((indptr, cols, relevance[rows, cols]), scores, k=5)
+    assert graded["ndcg"] == pytest.approx(expected["ndcg"])
+
+    binary = get_ranking_metrics((indptr, cols), scores, k=5)
+    assert binary["map"] == pytest.approx(expected["map"])
+    assert binary["precision"] == pytest.approx(expected["precision"])
+
+    sparse = pytest.importorskip("scipy.sparse")
+    out = get_ranking_metrics(sparse.csr_matrix(relevance), scores, k=5)
+    np.testing.assert_allclose(out["per_user"]["ndcg"], expected["per_user"]["ndcg"])
+
+
+def test_duplicate_relevant_items():
+    """Test: repeated items are rejected in lists and summed in sparse matrices."""
+    scores = [[0.9, 0.1, 0.5], [0.2, 0.8, 0.6]]
+    with pytest.raises(ValueError, match="listed once"):
+        get_ranking_metrics(([0, 2, 3], [0, 0, 1]), scores, k=1)
+    out = get_ranking_metrics(([0, 1, 2], [0, 1]), scores, k=1)
+    assert out["per_user"]["recall"].tolist() == [1.0, 1.0]
+
+    sparse = pytest.importorskip("scipy.sparse")
+    duplicated = sparse.csr_matrix(
+        (np.ones(3), np.array([0, 0, 1]), np.array([0, 2, 3])), shape=(2, 3)
+    )
+    expected = get_ranking_metrics(duplicated.toarray(), scores, k=1)
+    out = get_ranking_metrics(duplicated, scores, k=1)
+    for name in ("precision", "recall", "ndcg", "map"):
+        np.testing.assert_array_equal(out["per_user"][name], expected["per_user"][name])
+    assert out["per_user"]["recall"].tolist() == [1.0, 1.0]
+
+
+@pytest.mark.parametrize("n_users", [2, 3])
+def test_dense_tuple_of_rows(n_users):
+    """Test: a tuple of 2 or 3 dense rows is not mistaken for CSR relevance lists."""
+    rng = np.random.default_rng(n_users)
+    relevance = (rng.random((n_users, 6)) < 0.5).astype(int)
+    scores = rng.random((n_users, 6))
+    out = get_ranking_metrics(tuple(relevance), scores, k=3)
+    expected = get_ranking_metrics(relevance, scores, k=3)
+    for name in ("precision", "recall", "ndcg", "map"):
+        np.testing.assert_array_equal(out["per_user"][name], expected["per_user"][name])
+
+
+def test_memmap_scores(tmp_path, ratings):
+    """Test: memory-mapped score matrices are read block by block."""
+    relevance, scores = ratings
+    np.save(tmp_path / "scores.npy", scores)
+    mapped = np.load(tmp_path / "scores.npy", mmap_mode="r")
+    out = get_ranking_metrics(relevance, mapped, k=3)
+    assert out["ndcg"] == get_ranking_metrics(relevance, scores, k=3)["ndcg"]
+
+
+def test_validation():
+    """Test: bad shapes, k, scores, grades and CSR arrays are rejected."""
+    scores = np.array([[0.1, 0.2, 0.3]])
+    with pytest.raises(ValueError, match="2D"):
+        get_ranking_metrics([1, 0, 0], [0.1, 0.2, 0.3])
+    with pytest.raises(ValueError, match="Shape mismatch"):
+        get_ranking_metrics([[1, 0]], scores, k=2)
+    with pytest.raises(ValueError, match="k must"):
+        get_ranking_metrics([[1, 0, 0]], scores, k=4)
+    with pytest.raises(ValueError, match="k must"):
+        get_ranking_metrics([[1, 0, 0]], scores, k=0)
+    with pytest.raises(ValueError, match="finite"):
+        get_ranking_metrics([[1, 0, 0]], [[0.1, np.nan, 0.3]], k=2)
+    with pytest.raises(ValueError, match="non-negative"):
+        get_ranking_metrics([[1, -1, 0]], scores, k=2)
+    with pytest.raises(ValueError, match="empty"):
+        get_ranking_metrics(np.zeros((0, 3)), np.zeros((0, 3)), k=2)
+    with pytest.raises(ValueError, match="indptr"):
+        get_ranking_metrics(([0, 2], [0]), scores, k=2)
+    with pytest.raises(ValueError, match="Item indices"):
+        get_ranking_metrics(([0, 1], [3]), scores, k=2)
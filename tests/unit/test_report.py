@@ -0,0 +1,140 @@
+"""
+A test module that tests get_regression_report() and get_classification_report(),
+including parity of the "numpy" and "jit" backends with the get_* functions.
+"""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import reportrabbit._backend as backend_module
+from reportrabbit import (
+    get_accuracy,
+    get_classification_report,
+    get_f1,
+    get_mae,
+    get_mape,
+    get_mse,
+    get_precision,
+    get_r,
+    get_r2,
+    get_recall,
+    get_regression_report,
+    get_rmse,
+)
+
+BACKENDS = [
+    "numpy",
+    pytest.param(
+        "jit",
+        marks=pytest.mark.skipif(
+            backend_module._jit_kernels() is None, reason="numba not installed"
+        ),
+    ),
+]
+
+
+@pytest.fixture
+def regression_data():
+    """Random regression targets without zeros."""
+    rng = np.random.default_rng(42)
+    y_true = rng.normal(10.0, 3.0, 1000)
+    y_pred = y_true + rng.normal(0.0, 1.0, 1000)
+    return y_true, y_pred
+
+
+@pytest.fixture
+def classification_data():
+    """Random multi-class labels."""
+    rng = np.random.default_rng(7)
+    return rng.integers(0, 3, 1000), rng.integers(0, 3, 1000)
+
+
+def test_regression_report_numpy_matches_exactly(regression_data):
+    """Test: the numpy backend reproduces the get_* functions bit for bit."""
+    y_true, y_pred = regression_data
+    report = get_regression_report(y_true, y_pred, backend="numpy")
+    assert report["mae"] == get_mae(y_true, y_pred)
+    assert report["mse"] == get_mse(y_true, y_pred)
+    assert report["rmse"] == get_rmse(y_true, y_pred)
+    assert report["mape"] == get_mape(y_true, y_pred)
+    assert report["r"] == get_r(y_true, y_pred)
+    assert report["r2"] == get_r2(y_true, y_pred)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_regression_report_parity(backend, regression_data):
+    """Test: every backend agrees with the get_* functions."""
+    y_true, y_pred = regression_data
+    report = get_regression_report(y_true, y_pred, backend=backend)
+    assert report["mae"] == pytest.approx(get_mae(y_true, y_pred))
+    assert report["mse"] == pytest.approx(get_mse(y_true, y_pred))
+    assert report["mape"] == pytest.approx(get_mape(y_true, y_pred))
+    assert report["r"] == pytest.approx(get_r(y_true, y_pred))
+    assert report["r2"] == pytest.approx(get_r2(y_true, y_pred))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_classification_report_parity(backend, classification_data):
+    """Test: every backend agrees with the classification get_* functions."""
+    y_true, y_pred = classification_data
+    report = get_classification_report(y_true, y_pred, backend=backend)
+    assert report == {
+        "accuracy": get_accuracy(y_true, y_pred),
+        "precision": get_precision(y_true, y_pred),
+        "recall": get_recall(y_true, y_pred),
+        "f1": get_f1(y_true, y_pred),
+    }
+
+
+def test_regression_report_zero_targets():
+    """Test: MAPE is NaN in a report when y_true contains zeros."""
+    report = get_regression_report([0.0, 1.0, 2.0], [0.5, 1.0, 2.0], backend="numpy")
+    assert np.isnan(report["mape"])
+    assert report["mae"] == pytest.approx(0.5 / 3)
+
+
+def test_regression_report_rejects_nan():
+    """Test: non-finite values are rejected."""
+    with pytest.raises(ValueError, match="finite"):
+        get_regression_report([1.0, np.nan], [1.0, 2.0], backend="numpy")
+
+
+def test_report_rejects_unknown_backend():
+    """Test: an unknown backend name raises ValueError."""
+    with pytest.raises(ValueError, match="backend"):
+        get_regression_report([1.0, 2.0], [1.0, 2.0], backend="cuda")
+
+
+@pytest.mark.skipif(backend_module._jit_kernels() is not None, reason="numba is installed")
+def test_jit_backend_requires_numba():
+    """Test: requesting the jit backend without numba raises ImportError."""
+    with pytest.raises(ImportError, match="numba"):
+        get_classification_report([0, 1], [0, 1], backend="jit")
+
+
+def test_import_does_not_load_numba():
+    """Test: Numba is only imported once a backend needs it; "numpy" is the default."""
+    code = (
+        "import sys, reportrabbit\n"
+        "reportrabbit.RegressionAccumulator().update([1.0], [2.0])\n"
+        "reportrabbit.get_regression_report([1.0, 2.0], [2.0, 2.0])\n"
+        "print('numba' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_auto_backend_falls_back(classification_data):
+    """Test: backend='auto' always works, with or without numba."""
+    y_true, y_pred = classification_data
+    report = get_classification_report(y_true, y_pred, backend="auto")
+    assert report["accuracy"] == get_accuracy(y_true, y_pred)
+
+
+def test_classification_report_string_labels():
+    """Test: non-numeric labels are counted with the NumPy kernel."""
+    report = get_classification_report(["a", "b"], ["a", "a"], backend="auto")
+    assert report["accuracy"] == 0.5
@@ -0,0 +1,183 @@
+"""
+A test module that tests ReproducibleRegressionAccumulator and reproducible=True.
+"""
+
+import threading
+import warnings
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from reportrabbit import (
+    ConcurrentRegressionAccumulator,
+    ReproducibleRegressionAccumulator,
+    evaluate_shards,
+    get_mae,
+    get_mape,
+    get_mse,
+    get_r,
+    get_r2,
+    get_regression_report,
+)
+from reportrabbit._backend import _jit_kernels, _two_product, exact_regression_bins
+from reportrabbit.reproducible import _bins_to_ints, _to_fraction
+
+BACKENDS = ["numpy"] + (["jit"] if _jit_kernels() is not None else [])
+
+N = 20_000
+
+
+@pytest.fixture(scope="module")
+def data():
+    """Large offset and mixed magnitudes, where float summation order matters."""
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(1e6, 1, N)
+    y_pred = y_true + rng.normal(0, 1, N) * 10.0 ** rng.integers(-8, 3, N)
+    return y_true, y_pred
+
+
+def _chunked(y_true, y_pred, sizes, backend="auto"):
+    acc = ReproducibleRegressionAccumulator(backend=backend)
+    bounds = np.cumsum([0] + sizes)
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        acc.update(y_true[start:stop], y_pred[start:stop])
+    return acc
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_exact_sum(backend):
+    """Test: sums and sums of squares equal the exact rational sums."""
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=3000) * 10.0 ** rng.integers(-140, 140, 3000)
+    values[:3] = [5e-324, -5e-324, 0.0]  # subnormal squares are rounded
+    sums = _bins_to_ints(exact_regression_bins(values, values, backend))
+    exact = [Fraction(v) for v in values.tolist()]
+    assert _to_fraction(sums[0]) == sum(exact)
+    assert _to_fraction(sums[2]) == sum(v * v for v in exact[3:])
+
+
+@pytest.mark.skipif(_jit_kernels() is None, reason="numba not installed")
+def test_backends_bin_identically(data):
+    """Test: the NumPy and compiled kernels produce the same bins."""
+    y_true, y_pred = data
+    np.testing.assert_array_equal(
+        exact_regression_bins(y_true, y_pred, "numpy"),
+        exact_regression_bins(y_true, y_pred, "jit"),
+    )
+
+
+def test_two_product_is_exact():
+    """Test: product + error equals the exact product."""
+    rng = np.random.default_rng(2)
+    a = rng.normal(size=500) * 1e5
+    b = rng.normal(size=500) * 1e-7
+    for x, y, p, e in zip(a, b, *_two_product(a, b)):
+        assert Fraction(x) * Fraction(y) == Fraction(p) + Fraction(e)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bit_identical_across_chunkings(data, backend):
+    """Test: any chunking, merge order and backend gives exactly the same metrics."""
+    y_true, y_pred = data
+    expected = _chunked(y_true, y_pred, [N], "numpy").result()
+    rng = np.random.default_rng(3)
+    for _ in range(3):
+        cuts = np.sort(rng.choice(np.arange(1, N), 20, replace=False))
+        sizes = np.diff(np.concatenate([[0], cuts, [N]])).tolist()
+        assert _chunked(y_true, y_pred, sizes, backend).result() == expected
+
+    # Merging shard accumulators in reverse order
+    parts = [
+        _chunked(y_true[i : i + 3000], y_pred[i : i + 3000], [3000], backend)
+        for i in range(0, N, 3000)
+    ]
+    merged = ReproducibleRegressionAccumulator()
+    for part in reversed(parts):
+        merged.merge(part)
+    assert merged.result() == expected
+
+
+def test_agrees_with_get_functions(data):
+    """Test: the correctly rounded metrics agree with the regular ones to rounding error."""
+    y_true, y_pred = data
+    acc = _chunked(y_true, y_pred, [N])
+    assert acc.mae() == pytest.approx(get_mae(y_true, y_pred), rel=1e-12)
+    assert acc.mse() == pytest.approx(get_mse(y_true, y_pred), rel=1e-12)
+    assert acc.mape() == pytest.approx(get_mape(y_true, y_pred), rel=1e-12)
+    assert acc.r() == pytest.approx(get_r(y_true, y_pred), rel=1e-9)
+    assert acc.r2() == pytest.approx(get_r2(y_true, y_pred), rel=1e-9)
+
+
+def test_threads_and_report(data):
+    """Test: the concurrent and report entry points match the exact result."""
+    y_true, y_pred = data
+    expected = get_regression_report(y_true, y_pred, reproducible=True)
+    acc = ConcurrentRegressionAccumulator(reproducible=True)
+    threads = [
+        threading.Thread(
+            target=lambda i=i: [
+                acc.update(y_true[j : j + 100], y_pred[j : j + 100])
+                for j in range(i * 100, N, 400)
+            ]
+        )
+        for i in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert acc.result() == expected
+
+
+def test_shard_layout_independent(tmp_path, data):
+    """Test: evaluate_shards gives the same bits for different shard layouts."""
+    y_true, y_pred = data
+    np.save(tmp_path / "y_true.npy", y_true)
+    results = []
+    for layout, sizes in enumerate([[N], [5000, 7000, 8000], [1000] * 20]):
+        bounds = np.cumsum([0] + sizes)
+        for i, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+            np.save(tmp_path / f"pred{layout}_{i}.npy", y_pred[start:stop])
+        out = evaluate_shards(
+            str(tmp_path / "y_true.npy"), str(tmp_path / f"pred{layout}_*.npy"),
+            ["mse", "r2"], max_workers=2, reproducible=True,
+        )
+        results.append(out["metrics"])
+    assert results[0] == results[1] == results[2]
+    assert results[0]["mse"] == get_regression_report(y_true, y_pred, reproducible=True)["mse"]
+
+
+def test_edge_cases():
+    """Test: constant targets, zeros, empty state and non-finite values."""
+    acc = ReproducibleRegressionAccumulator()
+    with pytest.raises(ValueError, match="empty"):
+        acc.mse()
+    acc.update([0.0, 0.0], [1.0, 2.0])
+    assert acc.r2() == 0.0
+    assert np.isnan(acc.r())
+    assert np.isnan(acc.result()["mape"])
+    with pytest.raises(ValueError, match="zero"):
+        acc.mape()
+    with pytest.raises(ValueError, match="finite"):
+        acc.update([1.0, np.nan], [1.0, 2.0])
+    with pytest.raises(ValueError, match="exactly"):
+        acc.update([1e200], [1.0])
+    with pytest.warns(UserWarning):
+        assert np.isnan(_chunked(np.array([1.0]), np.array([2.0]), [1]).r2())
+
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_overflow_raises_without_warning_and_leaves_state(backend):
+    """Test: an overflowing chunk raises ValueError, warns nothing and merges nothing."""
+    acc = ReproducibleRegressionAccumulator(backend)
+    acc.update([1.0, 2.0], [2.0, 2.5])
+    before = acc._state()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(ValueError, match="too large"):
+            acc.update([1.0, 1e200], [1.0, 1.0])
+        with pytest.raises(ValueError, match="too large"):
+            acc.update(iter([1.0, 1e200]), iter([1.0, 1.0]))
+    assert acc._state() == before
@@ -0,0 +1,161 @@
+"""
+A test module that tests evaluate_shards().
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from reportrabbit import (
+    RegressionAccumulator,
+    evaluate_shards,
+    get_f1,
+    get_mae,
+    get_precision,
+    get_r2,
+    get_rmse,
+)
+from reportrabbit.shards import _evaluate_shard
+
+
+def _write_shards(directory, prefix, values, sizes):
+    bounds = np.cumsum([0] + sizes)
+    for i, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+        np.save(directory / f"{prefix}_{i}.npy", values[start:stop])
+
+
+@pytest.fixture
+def regression_shards(tmp_path):
+    """Eleven shards (so natural ordering matters: _2 before _10)."""
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(5, 2, 5000)
+    y_pred = y_true + rng.normal(0, 1, 5000)
+    sizes = [500, 300, 700, 100, 400, 600, 500, 450, 550, 200, 700]
+    _write_shards(tmp_path, "true", y_true, sizes)
+    _write_shards(tmp_path, "pred", y_pred, sizes)
+    np.save(tmp_path / "y_true.npy", y_true)
+    return tmp_path, y_true, y_pred
+
+
+def test_paired_shards(regression_shards):
+    """Test: paired shards reduce to the metrics of the concatenated data."""
+    tmp, y_true, y_pred = regression_shards
+    out = evaluate_shards(
+        str(tmp / "true_*.npy"), str(tmp / "pred_*.npy"), ["mae", "rmse", "r2"],
+        max_workers=2, backend="numpy",
+    )
+    assert out["n_shards"] == 11
+    assert out["n_samples"] == 5000
+    assert out["metrics"]["mae"] == pytest.approx(get_mae(y_true, y_pred))
+    assert out["metrics"]["rmse"] == pytest.approx(get_rmse(y_true, y_pred))
+    assert out["metrics"]["r2"] == pytest.approx(get_r2(y_true, y_pred))
+
+
+def test_single_ground_truth_in_shared_memory(regression_shards):
+    """Test: one ground-truth file is sliced across the prediction shards."""
+    tmp, y_true, y_pred = regression_shards
+    out = evaluate_shards(
+        str(tmp / "y_true.npy"), str(tmp / "pred_*.npy"), "mae", max_workers=2, backend="numpy"
+    )
+    assert out["metrics"] == {"mae": pytest.approx(get_mae(y_true, y_pred))}
+
+
+def test_worker_throughput_is_reported(regression_shards):
+    """Test: per-worker counts add up to the totals."""
+    tmp, _, _ = regression_shards
+    out = evaluate_shards(
+        str(tmp / "y_true.npy"), str(tmp / "pred_*.npy"), ["mse"], max_workers=2, backend="numpy"
+    )
+    workers = out["workers"]
+    assert 1 <= len(workers) <= 2
+    assert sum(worker["n_shards"] for worker in workers) == 11
+    assert sum(worker["n_samples"] for worker in workers) == 5000
+    assert all(worker["samples_per_second"] > 0 for worker in workers)
+
+
+def test_classification_shards(tmp_path):
+    """Test: classification metrics are reduced from confusion counts."""
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 2, 3000)
+    y_pred = rng.integers(0, 2, 3000)
+    _write_shards(tmp_path, "pred", y_pred, [1000, 1000, 1000])
+    np.save(tmp_path / "labels.npy", y_true)
+    out = evaluate_shards(
+        str(tmp_path / "labels.npy"), str(tmp_path / "pred_*.npy"), ["precision", "f1"],
+        max_workers=1, backend="numpy",
+    )
+    assert out["metrics"] == {
+        "precision": get_precision(y_true, y_pred),
+        "f1": pytest.approx(get_f1(y_true, y_pred)),
+    }
+
+
+def test_worker_reads_shared_memory_slice(tmp_path):
+    """Test: the worker reads its slice from a shared-memory block in place."""
+    y_true = np.arange(10.0)
+    np.save(tmp_path / "pred.npy", np.arange(4.0, 8.0) + 1)
+    shm = shared_memory.SharedMemory(create=True, size=y_true.nbytes)
+    try:
+        np.ndarray(y_true.shape, y_true.dtype, buffer=shm.buf)[:] = y_true
+        source = (shm.name, 10, "<f8", 4, 8)
+        task = (RegressionAccumulator, "numpy", source, str(tmp_path / "pred.npy"))
+        state, _, n_samples, _ = _evaluate_shard(task)
+    finally:
+        shm.close()
+        shm.unlink()
+    acc = RegressionAccumulator(backend="numpy")
+    acc._merge_state(state)
+    assert n_samples == 4
+    assert acc.mae() == 1.0
+
+
+def test_shard_validation(regression_shards):
+    """Test: mismatched shards and invalid metrics are rejected."""
+    tmp, _, _ = regression_shards
+    with pytest.raises(ValueError, match="no files"):
+        evaluate_shards(str(tmp / "missing_*.npy"), str(tmp / "pred_*.npy"), ["mae"])
+    with pytest.raises(ValueError, match="regression metrics"):
+        evaluate_shards(str(tmp / "y_true.npy"), str(tmp / "pred_*.npy"), ["mae", "f1"])
+    with pytest.raises(ValueError, match="samples"):
+        evaluate_shards(str(tmp / "y_true.npy"), str(tmp / "pred_1*.npy"), ["mae"])
+    with pytest.raises(ValueError, match="matched"):
+        evaluate_shards(str(tmp / "true_1*.npy"), str(tmp / "pred_*.npy"), ["mae"])
+    with pytest.raises(ValueError, match="lengths differ"):
+        evaluate_shards(str(tmp / "true_[01].npy"), str(tmp / "pred_[12].npy"), ["mae"])
+
+
+@pytest.mark.parametrize("reproducible", [False, True])
+def test_empty_shards_are_skipped(tmp_path, reproducible):
+    """Test: zero-length shards contribute nothing; all-empty input is rejected."""
+    rng = np.random.default_rng(1)
+    y_true = rng.normal(5, 2, 1000)
+    y_pred = y_true + rng.normal(0, 1, 1000)
+    sizes = [400, 0, 600, 0]
+    _write_shards(tmp_path, "true", y_true, sizes)
+    _write_shards(tmp_path, "pred", y_pred, sizes)
+    np.save(tmp_path / "y_true.npy", y_true)
+    for pattern_true in ("true_*.npy", "y_true.npy"):
+        out = evaluate_shards(
+            str(tmp_path / pattern_true), str(tmp_path / "pred_*.npy"), ["mae", "r2"],
+            max_workers=2, backend="numpy", reproducible=reproducible,
+        )
+        assert out["n_shards"] == 4 and out["n_samples"] == 1000
+        assert out["metrics"]["mae"] == pytest.approx(get_mae(y_true, y_pred))
+
+    with pytest.raises(ValueError, match="every prediction shard is empty"):
+        evaluate_shards(
+            str(tmp_path / "true_[13].npy"), str(tmp_path / "pred_[13].npy"), "mae",
+            max_workers=1, reproducible=reproducible,
+        )
+
+
+def test_jit_workers_load_numba_before_timing(regression_shards):
+    """Test: the Numba import is paid in the worker initializer, not in shard time."""
+    pytest.importorskip("numba")
+    tmp, _, _ = regression_shards
+    out = evaluate_shards(
+        str(tmp / "true_*.npy"), str(tmp / "pred_*.npy"), "mae", max_workers=1, backend="jit"
+    )
+    (worker,) = out["workers"]
+    assert worker["seconds"] < 0.25
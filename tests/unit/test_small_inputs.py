@@ -0,0 +1,91 @@
+"""
+A test module that tests the pure-Python path for tiny inputs.
+"""
+
+import numpy as np
+import pytest
+
+from reportrabbit import get_accuracy, get_mae, set_memory_budget
+from reportrabbit import _small
+
+
+@pytest.fixture
+def vectorized(monkeypatch):
+    """Call a metric with the small-input path disabled."""
+
+    def call(func, *args):
+        monkeypatch.setattr(_small, "_SMALL_INPUT_MAX", 0)
+        try:
+            return func(*args)
+        finally:
+            monkeypatch.undo()
+
+    return call
+
+
+@pytest.mark.parametrize("n", [1, 5, 7, 8, 9, 20, 31, 64])
+def test_mae_bit_identical(n, vectorized):
+    """Test: the pure-Python MAE equals the vectorized one bit for bit."""
+    rng = np.random.default_rng(n)
+    for _ in range(50):
+        y_true = (rng.normal(size=n) * 10.0 ** rng.integers(-8, 8, n)).tolist()
+        y_pred = (rng.normal(size=n) * 10.0 ** rng.integers(-8, 8, n)).tolist()
+        assert get_mae(y_true, y_pred) == vectorized(get_mae, y_true, y_pred)
+    y_int = rng.integers(-(2**60), 2**60, n).tolist()
+    assert get_mae(y_int, tuple(y_pred)) == vectorized(get_mae, y_int, tuple(y_pred))
+
+
+def test_pairwise_sum_order():
+    """Test: the summation order is NumPy's, beyond the unrolled block too."""
+    rng = np.random.default_rng(0)
+    for n in range(1, 300):
+        values = (rng.random(n) * 10.0 ** rng.integers(-5, 5, n)).tolist()
+        assert _small._pairwise_sum(values) == float(np.add.reduce(np.array(values)))
+
+
+@pytest.mark.parametrize(
+    "y_true, y_pred",
+    [
+        ([0, 1, 1, 0, 2], [0, 1, 0, 0, 2]),
+        ((True, False, True), (1, 0, 0)),
+        ([1.0, 2.0, 3.5], [1, 2, 3]),
+        (["cat", "dog", "cat"], ["cat", "cat", "cat"]),
+        (["1", "2"], [1, 2]),  # np.asarray coerces mixed labels to strings
+        ([np.nan, 1.0], [np.nan, 1.0]),
+    ],
+)
+def test_accuracy_identical(y_true, y_pred, vectorized):
+    """Test: small label lists score the same on both paths."""
+    assert get_accuracy(y_true, y_pred) == vectorized(get_accuracy, y_true, y_pred)
+
+
+def test_errors_match_vectorized_path():
+    """Test: invalid small inputs raise the usual errors."""
+    with pytest.raises(ValueError, match="empty"):
+        get_accuracy([], [])
+    with pytest.raises(ValueError, match="same length"):
+        get_accuracy([1, 2], [1])
+    with pytest.raises(ValueError, match="finite"):
+        get_mae([1.0, np.inf], [1.0, 2.0])
+    with pytest.raises(ValueError, match="finite"):
+        get_mae([1.0, np.nan], [1.0, 2.0])
+    with pytest.raises(ValueError, match="Shape mismatch"):
+        get_mae([1.0, 2.0], [1.0])
+    with pytest.raises(ValueError):
+        get_mae(["a"], [1.0])
+
+
+def test_dispatch(monkeypatch):
+    """Test: only short lists and tuples without a budget take the Python path."""
+    calls = []
+    monkeypatch.setattr(_small, "_pairwise_sum", lambda v: calls.append(len(v)) or sum(v))
+    get_mae([1.0] * 64, [2.0] * 64)
+    get_mae([1.0] * 65, [2.0] * 65)
+    get_mae(np.ones(5), np.zeros(5))
+    get_mae([np.float32(1.0)], [2.0])
+    set_memory_budget(1 << 20)
+    try:
+        get_mae([1.0], [2.0])
+    finally:
+        set_memory_budget(None)
+    assert calls == [64]
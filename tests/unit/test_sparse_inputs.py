@@ -0,0 +1,117 @@
+"""
+A test module that tests positive-index and scipy.sparse inputs to
+get_precision(), get_recall() and get_f1().
+"""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from reportrabbit import get_f1, get_precision, get_recall
+
+METRICS = [get_precision, get_recall, get_f1]
+
+
+@pytest.fixture
+def imbalanced():
+    """Dense labels with about 1% positives and their positive indices."""
+    rng = np.random.default_rng(5)
+    y_true = (rng.random(5000) < 0.01).astype(int)
+    y_pred = (rng.random(5000) < 0.01).astype(int)
+    y_pred[np.flatnonzero(y_true)[::2]] = 1
+    return y_true, y_pred
+
+
+@pytest.mark.parametrize("func", METRICS)
+def test_positive_indices_match_dense(func, imbalanced):
+    """Test: positive indices plus n_samples give the dense result."""
+    y_true, y_pred = imbalanced
+    out = func(np.flatnonzero(y_true), np.flatnonzero(y_pred), n_samples=5000)
+    assert out == func(y_true, y_pred)
+
+
+@pytest.mark.parametrize("func", METRICS)
+def test_scipy_sparse_vectors_match_dense(func, imbalanced):
+    """Test: scipy.sparse row and column vectors give the dense result."""
+    sparse = pytest.importorskip("scipy.sparse")
+    y_true, y_pred = imbalanced
+    expected = func(y_true, y_pred)
+    assert func(sparse.csr_matrix(y_true), sparse.csr_matrix(y_pred)) == expected
+    assert func(sparse.csc_matrix(y_true[:, None]), sparse.csc_matrix(y_pred[:, None])) == expected
+
+
+def test_scipy_sparse_arrays_match_dense(imbalanced):
+    """Test: the sparse array classes are detected like the sparse matrices."""
+    sparse = pytest.importorskip("scipy.sparse")
+    y_true, y_pred = imbalanced
+    assert get_f1(sparse.csr_array(y_true[None, :]), y_pred) == get_f1(y_true, y_pred)
+
+
+def test_dense_inputs_do_not_import_scipy():
+    """Test: SciPy is optional; dense and positive-index inputs never import it."""
+    code = (
+        "import sys, reportrabbit\n"
+        "reportrabbit.get_f1([0, 1, 1], [1, 1, 0])\n"
+        "reportrabbit.get_recall([3, 7], [7], n_samples=10)\n"
+        "print('scipy' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_sparse_mixed_with_indices(imbalanced):
+    """Test: a sparse y_true can be combined with positive indices for y_pred."""
+    sparse = pytest.importorskip("scipy.sparse")
+    y_true, y_pred = imbalanced
+    out = get_recall(sparse.csr_matrix(y_true), np.flatnonzero(y_pred))
+    assert out == get_recall(y_true, y_pred)
+
+
+def test_no_positives_conventions():
+    """Test: empty positive sets follow the dense 0.0 conventions."""
+    assert get_precision([1, 2], [], n_samples=10) == 0.0
+    assert get_recall([], [1, 2], n_samples=10) == 0.0
+    assert get_f1([], [], n_samples=10) == 0.0
+
+
+@pytest.mark.parametrize(
+    "y_true,message",
+    [
+        ([3, 1], "sorted and unique"),
+        ([1, 1], "sorted and unique"),
+        ([1, 10], r"\[0, n_samples\)"),
+        ([0.5, 1.5], "integers"),
+    ],
+)
+def test_invalid_positive_indices(y_true, message):
+    """Test: unsorted, repeated, out-of-range and non-integer indices are rejected."""
+    with pytest.raises(ValueError, match=message):
+        get_precision(y_true, [1, 2], n_samples=10)
+
+
+def test_invalid_n_samples():
+    """Test: n_samples must be a positive integer."""
+    with pytest.raises(ValueError, match="n_samples"):
+        get_recall([1], [1], n_samples=0)
+
+
+def test_sparse_length_mismatch():
+    """Test: a sparse vector whose length disagrees with n_samples is rejected."""
+    sparse = pytest.importorskip("scipy.sparse")
+    with pytest.raises(ValueError, match="n_samples"):
+        get_precision(sparse.csr_matrix([[0, 1, 1]]), [1], n_samples=10)
+
+
+@pytest.mark.parametrize("func", METRICS)
+def test_sparse_mixed_with_dense_labels(func, imbalanced):
+    """Test: a dense 0/1 label array next to a sparse vector is read as labels."""
+    sparse = pytest.importorskip("scipy.sparse")
+    y_true, y_pred = imbalanced
+    expected = func(y_true, y_pred)
+    assert func(sparse.csr_matrix(y_true), y_pred) == expected
+    assert func(y_true, sparse.csr_matrix(y_pred)) == expected
+    assert func(y_true.astype(bool), sparse.csc_matrix(y_pred[:, None])) == expected
+    with pytest.raises(ValueError, match="0/1 label array"):
+        func(sparse.csr_matrix(y_true), y_pred * 2)
@@ -0,0 +1,149 @@
+"""
+A test module that tests ConcurrentRegressionAccumulator and ConcurrentClassificationAccumulator.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from reportrabbit import (
+    ClassificationAccumulator,
+    ConcurrentClassificationAccumulator,
+    ConcurrentRegressionAccumulator,
+    RegressionAccumulator,
+)
+
+CHUNK = 50
+UPDATES_PER_THREAD = 40
+
+
+def _chunks(n_threads, labels):
+    rng = np.random.default_rng(n_threads)
+    n = n_threads * UPDATES_PER_THREAD * CHUNK
+    if labels:
+        y_true, y_pred = rng.integers(0, 2, n), rng.integers(0, 2, n)
+    else:
+        y_true = rng.normal(10, 3, n)
+        y_pred = y_true + rng.normal(0, 1, n)
+    return [
+        (y_true[i:i + CHUNK], y_pred[i:i + CHUNK]) for i in range(0, n, CHUNK)
+    ], (y_true, y_pred)
+
+
+def _run(acc, chunks, n_threads):
+    def work(thread_index):
+        for y_true, y_pred in chunks[thread_index::n_threads]:
+            acc.update(y_true, y_pred)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(n_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+@pytest.mark.parametrize("n_threads", [1, 8, 64])
+def test_classification_counts_are_exact(n_threads):
+    """Test: concurrent updates give exactly the single-threaded confusion counts."""
+    chunks, (y_true, y_pred) = _chunks(n_threads, labels=True)
+    acc = ConcurrentClassificationAccumulator(backend="numpy")
+    _run(acc, chunks, n_threads)
+
+    expected = ClassificationAccumulator(backend="numpy")
+    expected.update(y_true, y_pred)
+    assert acc.snapshot()._state() == pytest.approx(expected._state())
+
+
+@pytest.mark.parametrize("n_threads", [1, 8, 64])
+def test_regression_matches_single_threaded(n_threads):
+    """Test: concurrent updates give the single-threaded metrics up to rounding."""
+    chunks, (y_true, y_pred) = _chunks(n_threads, labels=False)
+    acc = ConcurrentRegressionAccumulator(backend="numpy")
+    _run(acc, chunks, n_threads)
+
+    expected = RegressionAccumulator(backend="numpy")
+    expected.update(y_true, y_pred)
+    snapshot = acc.snapshot()
+    assert snapshot.n == expected.n
+    for name, value in expected.result().items():
+        assert snapshot.result()[name] == pytest.approx(value, rel=1e-12)
+
+
+def test_snapshots_during_updates_see_whole_updates():
+    """Test: a snapshot taken while threads update only contains complete chunks."""
+    acc = ConcurrentClassificationAccumulator(backend="numpy")
+    ones = np.ones(CHUNK, dtype=np.int64)
+    stop = threading.Event()
+
+    def work():
+        while not stop.is_set():
+            acc.update(ones, ones)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    try:
+        previous = 0
+        for _ in range(200):
+            snapshot = acc.snapshot()
+            assert snapshot.n % CHUNK == 0
+            assert snapshot.tp == snapshot.n_correct == snapshot.n
+            assert snapshot.n >= previous
+            previous = snapshot.n
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+    assert acc.snapshot().n >= previous
+
+
+def test_exited_threads_are_retired_without_losing_updates():
+    """Test: slots of finished threads are folded away and their updates kept."""
+    acc = ConcurrentRegressionAccumulator(backend="numpy")
+    for i in range(20):
+        t = threading.Thread(target=acc.update, args=([float(i)], [i + 1.0]))
+        t.start()
+        t.join()
+    snapshot = acc.snapshot()
+    assert snapshot.n == 20
+    assert snapshot.mae() == 1.0
+    assert acc._slots == []
+    acc.update([0.0], [2.0])
+    assert acc.snapshot().n == 21
+
+
+def test_failed_update_is_not_recorded_and_snapshot_is_independent():
+    """Test: invalid chunks raise without changing the state; snapshots are copies."""
+    acc = ConcurrentRegressionAccumulator(backend="numpy")
+    acc.update([1.0, 2.0], [1.0, 3.0])
+    with pytest.raises(ValueError, match="finite"):
+        acc.update([1.0, np.inf], [1.0, 1.0])
+    snapshot = acc.snapshot()
+    acc.update([5.0], [5.0])
+    assert snapshot.n == 2
+    assert acc.snapshot().n == 3
+    assert acc.result()["mae"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.parametrize(
+    "acc_class", [ConcurrentRegressionAccumulator, ConcurrentClassificationAccumulator]
+)
+def test_iterator_failing_after_full_blocks_is_not_recorded(acc_class):
+    """Test: an iterator that fails after several full blocks leaves the state unchanged."""
+    acc = acc_class(backend="numpy")
+    acc.update([1.0, 0.0], [1.0, 1.0])
+    with pytest.raises(ValueError, match="length"):
+        acc.update(iter(np.ones(200_001)), iter(np.ones(200_000)))
+    # The next successful update publishes the slot, which must hold no partial blocks
+    acc.update([1.0], [1.0])
+
+    expected = acc._ACCUMULATOR(backend="numpy")
+    expected.update([1.0, 0.0, 1.0], [1.0, 1.0, 1.0])
+    assert acc.snapshot()._state() == pytest.approx(expected._state())
+
+
+def test_invalid_backend_is_rejected():
+    """Test: unknown backends fail at construction."""
+    with pytest.raises(ValueError, match="backend"):
+        ConcurrentClassificationAccumulator(backend="gpu")
@@ -0,0 +1,122 @@
+"""
+A test module that tests MetricWorkspace and the metrics that accept it
+(get_mae, get_mape, get_mse, get_rmse, get_mse_rmse and get_r2).
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from reportrabbit import (
+    MetricWorkspace,
+    get_mae,
+    get_mape,
+    get_mse,
+    get_mse_rmse,
+    get_r2,
+    get_rmse,
+)
+
+N = 10_000
+METRICS = [get_mae, get_mape, get_mse, get_rmse, get_mse_rmse, get_r2]
+
+
+@pytest.fixture
+def data():
+    """Fixed-size float64 batch with no zeros in y_true."""
+    rng = np.random.default_rng(0)
+    return rng.random(N) + 1.0, rng.random(N) + 1.0
+
+
+@pytest.mark.parametrize("func", METRICS)
+def test_workspace_matches_allocating_path(func, data):
+    """Test: results with a workspace are identical to the default path."""
+    y_true, y_pred = data
+    ws = MetricWorkspace(N)
+    assert func(y_true, y_pred, workspace=ws) == func(y_true, y_pred)
+
+
+def test_workspace_weighted_mse_matches(data):
+    """Test: weighted MSE with a workspace matches np.average."""
+    y_true, y_pred = data
+    weights = np.linspace(0.5, 2.0, N)
+    ws = MetricWorkspace(N)
+    expected = get_mse(y_true, y_pred, sample_weight=weights)
+    assert get_mse(y_true, y_pred, sample_weight=weights, workspace=ws) == expected
+
+
+def test_workspace_smaller_batch_fits():
+    """Test: a workspace can evaluate batches smaller than its capacity."""
+    ws = MetricWorkspace(10)
+    assert get_mae([1.0, 2.0, 3.0], [2.0, 2.0, 4.0], workspace=ws) == pytest.approx(2 / 3)
+
+
+@pytest.mark.parametrize("func", METRICS)
+def test_workspace_steady_state_allocates_nothing(func, data):
+    """Test: after warm-up, a workspace call allocates no n-sized temporaries."""
+    y_true, y_pred = data
+    ws = MetricWorkspace(N)
+    func(y_true, y_pred, workspace=ws)
+
+    tracemalloc.start()
+    try:
+        func(y_true, y_pred, workspace=ws)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # A single float64 temporary would be N * 8 bytes
+    assert peak < N * 8 // 8
+
+
+def test_workspace_float32(data):
+    """Test: a float32 workspace computes in float32."""
+    y_true, y_pred = (a.astype(np.float32) for a in data)
+    ws = MetricWorkspace(N, dtype=np.float32)
+    expected = float(np.mean(np.abs(y_true - y_pred)))
+    assert get_mae(y_true, y_pred, workspace=ws) == expected
+
+
+def test_workspace_rejects_too_large_input():
+    """Test: inputs larger than the workspace raise ValueError."""
+    ws = MetricWorkspace(2)
+    with pytest.raises(ValueError, match="does not fit"):
+        get_mae([1.0, 2.0, 3.0], [1.0, 2.0, 3.0], workspace=ws)
+
+
+def test_workspace_still_validates():
+    """Test: validation errors are raised on the workspace path."""
+    ws = MetricWorkspace(3)
+    with pytest.raises(ValueError, match="finite"):
+        get_mae([1.0, np.nan, 3.0], [1.0, 2.0, 3.0], workspace=ws)
+    with pytest.raises(ValueError, match="zero"):
+        get_mape([0.0, 1.0, 2.0], [1.0, 1.0, 2.0], workspace=ws)
+
+
+def test_workspace_r2_matches_allocating_path_checks():
+    """Test: the R^2 workspace path rejects shape mismatches and propagates NaN."""
+    ws = MetricWorkspace(4)
+    y_true = [[1.0, 2.0], [3.0, 4.0]]
+    for workspace in (None, ws):
+        with pytest.raises(ValueError, match="Shape mismatch"):
+            get_r2(y_true, [1.0, 2.0], workspace=workspace)
+    with np.errstate(invalid="ignore"):
+        assert np.isnan(get_r2([1.0, np.nan, 3.0], [1.0, 2.0, 3.0], workspace=ws))
+        assert np.isnan(get_r2([1.0, np.nan, 3.0], [1.0, 2.0, 3.0]))
+
+
+def test_workspace_owns_only_used_buffers():
+    """Test: the workspace holds one residual and one mask buffer."""
+    ws = MetricWorkspace(3, np.float32)
+    assert not hasattr(ws, "scratch")
+    residual, mask = ws._views(2)
+    assert residual.dtype == np.float32 and residual.shape == (2,)
+    assert mask.dtype == bool and mask.shape == (2,)
+
+
+@pytest.mark.parametrize("n,dtype", [(0, np.float64), (-1, np.float64), (3, np.int64)])
+def test_workspace_invalid_arguments(n, dtype):
+    """Test: invalid sizes and non-float dtypes are rejected."""
+    with pytest.raises(ValueError):
+        MetricWorkspace(n, dtype)